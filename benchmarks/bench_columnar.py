@@ -0,0 +1,45 @@
+""" Compares parsing price pages into model instances and into columns
+
+Run with ``PYTHONPATH="." python benchmarks/bench_columnar.py``
+"""
+import json
+import timeit
+
+from benchmarks.payloads import eod_prices, interval_prices
+from marketstack import columnar
+from marketstack.decoding import default_json_decoder
+from marketstack.models import (
+    PagedResponseListmodelsEodPrice,
+    PagedResponseListmodelsIntervalPrice,
+)
+
+PAYLOADS = {
+    "PagedResponseListmodelsEodPrice": (
+        eod_prices,
+        PagedResponseListmodelsEodPrice,
+        columnar.EOD_PRICE_FIELDS,
+    ),
+    "PagedResponseListmodelsIntervalPrice": (
+        interval_prices,
+        PagedResponseListmodelsIntervalPrice,
+        columnar.INTERVAL_PRICE_FIELDS,
+    ),
+}
+
+
+def main(rows: int = 1000, number: int = 50):
+    decoder = default_json_decoder()
+    print(f"{rows} rows, best of 5 x {number} runs, ms per page including decoding")
+    for name, (payload, model, fields) in PAYLOADS.items():
+        content = json.dumps(payload(rows)).encode()
+        runs = {
+            "from_dict": lambda: model.from_dict(decoder(content)),
+            "columnar": lambda: columnar.parse_page(decoder(content), fields),
+        }
+        for run_name, run in runs.items():
+            seconds = min(timeit.repeat(run, number=number, repeat=5))
+            print(f"{name:40} {run_name:10} {seconds / number * 1000:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
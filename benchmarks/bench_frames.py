@@ -0,0 +1,35 @@
+""" Compares row-wise and column-wise DataFrame construction of price pages
+
+Run with ``PYTHONPATH="." python benchmarks/bench_frames.py``
+"""
+import timeit
+
+import pandas as pd
+
+from benchmarks.payloads import eod_prices
+from marketstack.frames import to_pandas
+from marketstack.models import EodPrice, PagedResponseListmodelsEodPrice
+
+
+def main(rows: int = 1000, pages: int = 10, number: int = 5):
+    items = [
+        PagedResponseListmodelsEodPrice.from_dict(eod_prices(rows)).data
+        for _ in range(pages)
+    ]
+    print(f"{pages} pages of {rows} rows, best of 5 x {number} runs, ms")
+    runs = {
+        "to_dict": lambda: pd.DataFrame(
+            [item.to_dict() for page in items for item in page]
+        ),
+        "concat": lambda: pd.concat(
+            [pd.DataFrame([item.to_dict() for item in page]) for page in items]
+        ),
+        "to_pandas": lambda: to_pandas(items, EodPrice),
+    }
+    for name, run in runs.items():
+        seconds = min(timeit.repeat(run, number=number, repeat=5))
+        print(f"{name:10} {seconds / number * 1000:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+""" Compares the JSON decoders for paged price responses
+
+Run with ``PYTHONPATH="." python benchmarks/bench_json.py``
+"""
+import json
+import timeit
+
+from benchmarks.payloads import eod_prices, interval_prices
+from marketstack.decoding import orjson, stdlib_json_decoder
+from marketstack.models import (
+    PagedResponseListmodelsEodPrice,
+    PagedResponseListmodelsIntervalPrice,
+)
+
+DECODERS = {"json": stdlib_json_decoder}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+PAYLOADS = {
+    "PagedResponseListmodelsEodPrice": (eod_prices, PagedResponseListmodelsEodPrice),
+    "PagedResponseListmodelsIntervalPrice": (
+        interval_prices,
+        PagedResponseListmodelsIntervalPrice,
+    ),
+}
+
+
+def main(rows: int = 1000, number: int = 50):
+    print(f"{rows} rows, best of 5 x {number} runs, ms per page")
+    for name, (payload, model) in PAYLOADS.items():
+        content = json.dumps(payload(rows)).encode()
+        for decoder_name, decoder in DECODERS.items():
+            decode = min(
+                timeit.repeat(lambda: decoder(content), number=number, repeat=5)
+            )
+            parse = min(
+                timeit.repeat(
+                    lambda: model.from_dict(decoder(content)), number=number, repeat=5
+                )
+            )
+            print(
+                f"{name:40} {decoder_name:8} "
+                f"decode {decode / number * 1000:7.3f}  "
+                f"decode+from_dict {parse / number * 1000:7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
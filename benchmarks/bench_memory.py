@@ -0,0 +1,61 @@
+""" Measures the memory allocated per instance of the high volume models
+
+The models are compared with their opt-in slotted variants of ``marketstack.slotted``.
+
+Run with ``PYTHONPATH="." python benchmarks/bench_memory.py``
+"""
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import attr
+
+from benchmarks.payloads import eod_prices, interval_prices
+from marketstack.models import Dividend, EodPrice, IntervalPrice, Split
+from marketstack.slotted import slotted
+
+ROWS = 10000
+
+PAYLOADS = {
+    EodPrice: eod_prices(ROWS)["data"],
+    IntervalPrice: interval_prices(ROWS)["data"],
+    Dividend: [
+        {"date": "2022-01-03", "symbol": "AAPL", "dividend": 0.22 + i}
+        for i in range(ROWS)
+    ],
+    Split: [
+        {"date": "2022-01-03", "symbol": "AAPL", "split_factor": 4.0 + i}
+        for i in range(ROWS)
+    ],
+}
+
+
+def measure(create: Callable[[Dict[str, Any]], Any], values: List[Dict[str, Any]]):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [create(value) for value in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - instances.__sizeof__()) / len(instances)
+
+
+def main():
+    print(f"bytes allocated per instance, {ROWS} rows")
+    print(f"{'':16} {'model':>10} {'slotted':>10}")
+    for model, rows in PAYLOADS.items():
+        rows = json.loads(json.dumps(rows))
+        # parse the field values once, so only the instances themselves are measured
+        names = [field.name for field in attr.fields(model) if field.init]
+        values = [
+            {name: getattr(instance, name) for name in names}
+            for instance in map(model.from_dict, rows)
+        ]
+        results = [
+            measure(lambda value: cls(**value), values)
+            for cls in (model, slotted(model))
+        ]
+        print(f"{model.__name__:16} {results[0]:10.1f} {results[1]:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
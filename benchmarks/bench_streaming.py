@@ -0,0 +1,43 @@
+""" Compares the peak memory of parsing a page at once and streaming its items
+
+Run with ``PYTHONPATH="." python benchmarks/bench_streaming.py``
+"""
+import json
+import tracemalloc
+
+from benchmarks.payloads import interval_prices
+from marketstack.models import IntervalPrice, PagedResponseListmodelsIntervalPrice
+from marketstack.streaming import PageParser
+
+CHUNK_SIZE = 16 * 1024
+
+
+def parse_page(body: bytes) -> None:
+    page = PagedResponseListmodelsIntervalPrice.from_dict(json.loads(body))
+    for _ in page.data:
+        pass
+
+
+def stream_page(body: bytes) -> None:
+    parser = PageParser("data.item", IntervalPrice)
+    for start in range(0, len(body), CHUNK_SIZE):
+        for _ in parser.feed(body[start : start + CHUNK_SIZE]):
+            pass
+    parser.close()
+
+
+def main(rows: int = 10000):
+    body = json.dumps(interval_prices(rows)).encode()
+    print(f"peak bytes allocated for a page of {rows} rows, {len(body)} bytes body")
+    for name, run in {"parse": parse_page, "stream": stream_page}.items():
+        # warm up caches (e.g. parsed dates) before measuring
+        run(body)
+        tracemalloc.start()
+        run(body)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:8} {peak:12d}")
+
+
+if __name__ == "__main__":
+    main()
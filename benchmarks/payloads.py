@@ -0,0 +1,79 @@
+""" Synthetic API payloads for the benchmarks """
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+SYMBOLS = [
+    "AAPL",
+    "AMZN",
+    "MSFT",
+    "GOOG",
+    "META",
+    "TSLA",
+    "NVDA",
+    "NFLX",
+    "INTC",
+    "AMD",
+]
+
+
+def _dates(count: int, step: timedelta) -> List[str]:
+    start = datetime(2022, 1, 3, 9, 30)
+    return [(start + i * step).strftime("%Y-%m-%dT%H:%M:%S+0000") for i in range(count)]
+
+
+def eod_prices(rows: int = 1000) -> Dict[str, Any]:
+    dates = _dates(rows // len(SYMBOLS) + 1, timedelta(days=1))
+    data = []
+    for i in range(rows):
+        price = 100.0 + i % 97
+        data.append(
+            {
+                "open": price,
+                "high": price + 1.25,
+                "low": price - 1.25,
+                "close": price + 0.5,
+                "volume": 1000000.0 + i,
+                "adj_high": price + 1.25,
+                "adj_low": price - 1.25,
+                "adj_close": price + 0.5,
+                "adj_open": price,
+                "adj_volume": 1000000.0 + i,
+                "split_factor": 1.0,
+                "dividend": 0.0,
+                "symbol": SYMBOLS[i % len(SYMBOLS)],
+                "exchange": "XNAS",
+                "date": dates[i // len(SYMBOLS)],
+            }
+        )
+    return _paged(data)
+
+
+def interval_prices(rows: int = 1000) -> Dict[str, Any]:
+    dates = _dates(rows // len(SYMBOLS) + 1, timedelta(hours=1))
+    data = []
+    for i in range(rows):
+        price = 100.0 + i % 97
+        data.append(
+            {
+                "open": price,
+                "high": price + 1.25,
+                "low": price - 1.25,
+                "last": price + 0.25,
+                "close": price + 0.5,
+                "volume": 10000.0 + i,
+                "date": dates[i // len(SYMBOLS)],
+                "symbol": SYMBOLS[i % len(SYMBOLS)],
+                "exchange": "IEXG",
+            }
+        )
+    return _paged(data)
+
+
+def _paged(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    pagination = {
+        "limit": len(data),
+        "offset": 0,
+        "count": len(data),
+        "total": len(data),
+    }
+    return {"pagination": pagination, "data": data}
@@ -0,0 +1,190 @@
+""" Vectorized split and dividend back-adjustment of columnar price series """
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import attr
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Price adjustment requires numpy, install it with: pip install marketstack[numpy]"
+    ) from e
+
+from .models.dividend import Dividend
+from .models.split import Split
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "last")
+"""Columns multiplied by the price factor, if present"""
+VOLUME_COLUMNS = ("volume",)
+"""Columns multiplied by the volume factor, if present"""
+
+Columns = Dict[str, np.ndarray]
+
+
+def _to_datetime64(dates: Iterable[str]) -> np.ndarray:
+    # ex-dates are days, the time of day of the API's date strings is dropped
+    return np.array([date[:10] for date in dates], dtype="datetime64[D]")
+
+
+@attr.s(auto_attribs=True)
+class CorporateActions:
+    """Splits and dividends as arrays sorted by their ex-date
+
+    Attributes:
+        split_dates (np.ndarray): ``datetime64[D]`` ex-dates of the splits.
+        split_factors (np.ndarray): New shares per old share, e.g. 4.0 for a 4:1 split.
+        dividend_dates (np.ndarray): ``datetime64[D]`` ex-dates of the dividends.
+        dividends (np.ndarray): Cash dividend per share.
+    """
+
+    split_dates: np.ndarray
+    split_factors: np.ndarray
+    dividend_dates: np.ndarray
+    dividends: np.ndarray
+
+    @classmethod
+    def from_models(
+        cls,
+        splits: Sequence[Split] = (),
+        dividends: Sequence[Dividend] = (),
+        symbol: Optional[str] = None,
+    ) -> "CorporateActions":
+        """Create corporate actions from the items of the split and dividend endpoints
+
+        Args:
+            splits: E.g. the data of ``splits.splits`` or ``tickers.ticker_symbol_splits``.
+            dividends: E.g. the data of ``dividends.dividends`` or
+                ``tickers.ticker_symbol_dividends``.
+            symbol: Only use the actions of this symbol.
+        """
+        if symbol is not None:
+            splits = [split for split in splits if split.symbol == symbol]
+            dividends = [
+                dividend for dividend in dividends if dividend.symbol == symbol
+            ]
+        split_dates = _to_datetime64(split.date for split in splits)
+        dividend_dates = _to_datetime64(dividend.date for dividend in dividends)
+        split_order = np.argsort(split_dates, kind="stable")
+        dividend_order = np.argsort(dividend_dates, kind="stable")
+        return cls(
+            split_dates=split_dates[split_order],
+            split_factors=np.array(
+                [split.split_factor for split in splits], dtype=np.float64
+            )[split_order],
+            dividend_dates=dividend_dates[dividend_order],
+            dividends=np.array(
+                [dividend.dividend for dividend in dividends], dtype=np.float64
+            )[dividend_order],
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Columns) -> "CorporateActions":
+        """Create corporate actions from the ``split_factor`` and ``dividend`` of EOD bars"""
+        dates = columns["date"].astype("datetime64[D]")
+        split_factors = np.asarray(columns["split_factor"], dtype=np.float64)
+        dividends = np.asarray(columns["dividend"], dtype=np.float64)
+        is_split = (
+            np.isfinite(split_factors) & (split_factors != 1.0) & (split_factors > 0)
+        )
+        is_dividend = np.isfinite(dividends) & (dividends != 0.0)
+        return cls(
+            split_dates=dates[is_split],
+            split_factors=split_factors[is_split],
+            dividend_dates=dates[is_dividend],
+            dividends=dividends[is_dividend],
+        )
+
+
+def _event_positions(dates: np.ndarray, event_dates: np.ndarray) -> np.ndarray:
+    # the factor of an event applies to all bars before its ex-date, so it is placed at the
+    # last bar before the ex-date; events before the first bar do not apply
+    day_starts = event_dates.astype("datetime64[D]").astype(dates.dtype)
+    return np.searchsorted(dates, day_starts, side="left") - 1
+
+
+def adjustment_factors(
+    dates: np.ndarray, close: np.ndarray, actions: CorporateActions
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the back-adjustment factors of every bar
+
+    The price factor of a bar is the product of ``1 / split_factor`` and
+    ``1 - dividend / previous close`` of all later ex-dates, the volume factor the product
+    of the later split factors. Both are computed with one reverse cumulative product.
+
+    Args:
+        dates: ``datetime64`` dates of the bars in ascending order.
+        close: The unadjusted close of the bars, used for dividend factors.
+        actions: The splits and dividends.
+
+    Returns:
+        The price and volume factors of every bar.
+    """
+    count = len(dates)
+    price_steps = np.ones(count, dtype=np.float64)
+    volume_steps = np.ones(count, dtype=np.float64)
+
+    positions = _event_positions(dates, actions.split_dates)
+    applies = positions >= 0
+    np.multiply.at(
+        price_steps, positions[applies], 1.0 / actions.split_factors[applies]
+    )
+    np.multiply.at(volume_steps, positions[applies], actions.split_factors[applies])
+
+    positions = _event_positions(dates, actions.dividend_dates)
+    applies = positions >= 0
+    previous_close = np.asarray(close, dtype=np.float64)[positions[applies]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dividend_steps = 1.0 - actions.dividends[applies] / previous_close
+    dividend_steps[~np.isfinite(dividend_steps)] = 1.0
+    np.multiply.at(price_steps, positions[applies], dividend_steps)
+
+    price_factors = np.cumprod(price_steps[::-1])[::-1]
+    volume_factors = np.cumprod(volume_steps[::-1])[::-1]
+    return price_factors, volume_factors
+
+
+def adjust(columns: Columns, actions: Optional[CorporateActions] = None) -> Columns:
+    """Back-adjust OHLC prices and volumes for splits and dividends
+
+    Works for EOD as well as raw intraday columns of one symbol, e.g. of
+    ``ColumnStore.read()``. The latest bars keep their prices, earlier bars are scaled so
+    the series has no jumps at ex-dates. Intraday bars before midnight UTC of an ex-date
+    are adjusted.
+
+    Args:
+        columns: ``date`` in ascending order and the unadjusted ``close`` as well as any of
+            ``open``, ``high``, ``low``, ``last`` and ``volume``. Dividend factors use
+            ``last`` where ``close`` is NaN.
+        actions: The corporate actions, defaults to the ``split_factor`` and ``dividend``
+            columns of EOD bars.
+
+    Returns:
+        A copy of the columns with adjusted prices and volumes.
+    """
+    if actions is None:
+        actions = CorporateActions.from_columns(columns)
+    close = np.asarray(columns["close"], dtype=np.float64)
+    if "last" in columns:
+        # intraday bars often have no close, but the last price
+        last = np.asarray(columns["last"], dtype=np.float64)
+        close = np.where(np.isnan(close), last, close)
+    price_factors, volume_factors = adjustment_factors(columns["date"], close, actions)
+    adjusted = dict(columns)
+    for name in PRICE_COLUMNS:
+        if name in columns:
+            adjusted[name] = np.asarray(columns[name], dtype=np.float64) * price_factors
+    for name in VOLUME_COLUMNS:
+        if name in columns:
+            adjusted[name] = (
+                np.asarray(columns[name], dtype=np.float64) * volume_factors
+            )
+    return adjusted
+
+
+__all__ = [
+    "CorporateActions",
+    "PRICE_COLUMNS",
+    "VOLUME_COLUMNS",
+    "adjust",
+    "adjustment_factors",
+]
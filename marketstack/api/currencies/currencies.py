@@ -1,11 +1,21 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
 from ...client import Client
+from ...models.currency import Currency
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
 from ...models.paged_response_listmodels_currency import PagedResponseListmodelsCurrency
+from ...paging import (
+    MAX_CONCURRENCY,
+    MAX_LIMIT,
+    ItemIterator,
+    asyncio_fetch_pages,
+    fetch_pages,
+    iter_pages,
+)
 from ...types import UNSET, Response, Unset
 
 
@@ -19,7 +29,6 @@ def _get_kwargs(
     url = "{}/currencies".format(client.base_url)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
@@ -34,50 +43,53 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]
 ]:
     if response.status_code == 200:
-        response_200 = PagedResponseListmodelsCurrency.from_dict(response.json())
+        response_200 = PagedResponseListmodelsCurrency.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]
 ]:
@@ -85,7 +97,9 @@ def _build_response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -95,6 +109,7 @@ def sync_detailed(
     access_key: str,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]
 ]:
@@ -104,6 +119,8 @@ def sync_detailed(
         access_key (str):
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]]
@@ -116,12 +133,11 @@ def sync_detailed(
         offset=offset,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -158,6 +174,7 @@ async def asyncio_detailed(
     access_key: str,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]
 ]:
@@ -167,6 +184,8 @@ async def asyncio_detailed(
         access_key (str):
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsCurrency]]
@@ -179,10 +198,9 @@ async def asyncio_detailed(
         offset=offset,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -213,3 +231,111 @@ async def asyncio(
             offset=offset,
         )
     ).parsed
+
+
+def iter_all(
+    *,
+    client: Client,
+    access_key: str,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> ItemIterator[Currency]:
+    """Iterate over the items of all pages
+
+    Pages are requested lazily one after another until ``pagination.total`` is reached.
+
+    Args:
+        access_key (str):
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        ItemIterator[Currency]: Also supports ``to_pandas()`` and ``to_arrow()``.
+    """
+
+    return ItemIterator(
+        iter_pages(
+            sync_detailed,
+            client=client,
+            access_key=access_key,
+            limit=limit,
+            offset=offset,
+        ),
+        lambda page: page.data,
+        Currency,
+    )
+
+
+def sync_all(
+    *,
+    client: Client,
+    access_key: str,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[Currency]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently from a thread pool.
+
+    Args:
+        access_key (str):
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[Currency]
+    """
+
+    pages = fetch_pages(
+        sync_detailed,
+        client=client,
+        access_key=access_key,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
+
+
+async def asyncio_all(
+    *,
+    client: Client,
+    access_key: str,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[Currency]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently.
+
+    Args:
+        access_key (str):
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[Currency]
+    """
+
+    pages = await asyncio_fetch_pages(
+        asyncio_detailed,
+        client=client,
+        access_key=access_key,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
@@ -1,14 +1,25 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from ...chunking import (
+    asyncio_chunks,
+    asyncio_fetch_chunk_pages,
+    fetch_chunk_pages,
+    iter_chunk_pages,
+    join_symbols,
+    sync_chunks,
+)
 from ...client import Client
+from ...models.eod_price import EodPrice
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
 from ...models.paged_response_listmodels_eod_price import (
     PagedResponseListmodelsEodPrice,
 )
 from ...models.sort import Sort
+from ...paging import MAX_CONCURRENCY, MAX_LIMIT, ItemIterator
 from ...types import UNSET, Response, Unset
 
 
@@ -16,7 +27,7 @@ def _get_kwargs(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     exchange: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
@@ -27,12 +38,11 @@ def _get_kwargs(
     url = "{}/eod".format(client.base_url)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
 
-    params["symbols"] = symbols
+    params["symbols"] = join_symbols(symbols)
 
     params["exchange"] = exchange
 
@@ -56,50 +66,53 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]
 ]:
     if response.status_code == 200:
-        response_200 = PagedResponseListmodelsEodPrice.from_dict(response.json())
+        response_200 = PagedResponseListmodelsEodPrice.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]
 ]:
@@ -107,7 +120,9 @@ def _build_response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -115,13 +130,14 @@ def sync_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     exchange: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]
 ]:
@@ -129,7 +145,7 @@ def sync_detailed(
 
     Args:
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
         exchange (Union[Unset, None, str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
@@ -138,6 +154,8 @@ def sync_detailed(
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]]
@@ -155,19 +173,18 @@ def sync_detailed(
         offset=offset,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     exchange: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
@@ -181,7 +198,10 @@ def sync(
 
     Args:
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response of their first pages, limit and offset can then
+            not be given.
         exchange (Union[Unset, None, str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
@@ -195,7 +215,9 @@ def sync(
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]]
     """
 
-    return sync_detailed(
+    return sync_chunks(
+        sync_detailed,
+        lambda page: page.data,
         client=client,
         access_key=access_key,
         symbols=symbols,
@@ -205,20 +227,21 @@ def sync(
         date_to=date_to,
         limit=limit,
         offset=offset,
-    ).parsed
+    )
 
 
 async def asyncio_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     exchange: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[
     Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]
 ]:
@@ -226,7 +249,7 @@ async def asyncio_detailed(
 
     Args:
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
         exchange (Union[Unset, None, str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
@@ -235,6 +258,8 @@ async def asyncio_detailed(
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]]
@@ -252,17 +277,16 @@ async def asyncio_detailed(
         offset=offset,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     exchange: Union[Unset, None, str] = UNSET,
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
@@ -276,7 +300,10 @@ async def asyncio(
 
     Args:
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response of their first pages, limit and offset can then
+            not be given.
         exchange (Union[Unset, None, str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
@@ -290,8 +317,60 @@ async def asyncio(
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsEodPrice]]
     """
 
-    return (
-        await asyncio_detailed(
+    return await asyncio_chunks(
+        asyncio_detailed,
+        lambda page: page.data,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        exchange=exchange,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset,
+    )
+
+
+def iter_all(
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    exchange: Union[Unset, None, str] = UNSET,
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> ItemIterator[EodPrice]:
+    """Iterate over the items of all pages
+
+    Pages are requested lazily one after another until ``pagination.total`` is reached.
+
+    Args:
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged chunk after chunk.
+        exchange (Union[Unset, None, str]):
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        ItemIterator[EodPrice]: Also supports ``to_pandas()`` and ``to_arrow()``.
+    """
+
+    return ItemIterator(
+        iter_chunk_pages(
+            sync_detailed,
             client=client,
             access_key=access_key,
             symbols=symbols,
@@ -301,5 +380,115 @@ async def asyncio(
             date_to=date_to,
             limit=limit,
             offset=offset,
-        )
-    ).parsed
+        ),
+        lambda page: page.data,
+        EodPrice,
+    )
+
+
+def sync_all(
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    exchange: Union[Unset, None, str] = UNSET,
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[EodPrice]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently from a thread pool.
+
+    Args:
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged in concurrent chunks.
+        exchange (Union[Unset, None, str]):
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[EodPrice]
+    """
+
+    pages = fetch_chunk_pages(
+        sync_detailed,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        exchange=exchange,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
+
+
+async def asyncio_all(
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    exchange: Union[Unset, None, str] = UNSET,
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[EodPrice]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently.
+
+    Args:
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged in concurrent chunks.
+        exchange (Union[Unset, None, str]):
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[EodPrice]
+    """
+
+    pages = await asyncio_fetch_chunk_pages(
+        asyncio_detailed,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        exchange=exchange,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
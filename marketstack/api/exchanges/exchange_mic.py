@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any, Dict, Optional, Union
 
 import httpx
@@ -18,7 +19,6 @@ def _get_kwargs(
     url = "{}/exchanges/{mic}".format(client.base_url, mic=mic)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
@@ -29,54 +29,57 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[Union[ErrorResponse, Exchange, HTTPValidationError]]:
     if response.status_code == 200:
-        response_200 = Exchange.from_dict(response.json())
+        response_200 = Exchange.from_dict(client.json_decoder(response.content))
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[Union[ErrorResponse, Exchange, HTTPValidationError]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -85,12 +88,15 @@ def sync_detailed(
     *,
     client: Client,
     access_key: str,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, Exchange, HTTPValidationError]]:
     """Mic
 
     Args:
         mic (str):
         access_key (str):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, Exchange, HTTPValidationError]]
@@ -102,12 +108,11 @@ def sync_detailed(
         access_key=access_key,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -138,12 +143,15 @@ async def asyncio_detailed(
     *,
     client: Client,
     access_key: str,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, Exchange, HTTPValidationError]]:
     """Mic
 
     Args:
         mic (str):
         access_key (str):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, Exchange, HTTPValidationError]]
@@ -155,10 +163,9 @@ async def asyncio_detailed(
         access_key=access_key,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -1,12 +1,23 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from ...chunking import (
+    asyncio_chunks,
+    asyncio_fetch_chunk_pages,
+    fetch_chunk_pages,
+    iter_chunk_pages,
+    join_symbols,
+    sync_chunks,
+)
 from ...client import Client
+from ...models.eod_price import EodPrice
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
 from ...models.paged_response_exchange_eod import PagedResponseExchangeEod
 from ...models.sort import Sort
+from ...paging import MAX_CONCURRENCY, MAX_LIMIT, ItemIterator
 from ...types import UNSET, Response, Unset
 
 
@@ -15,7 +26,7 @@ def _get_kwargs(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
@@ -25,12 +36,11 @@ def _get_kwargs(
     url = "{}/exchanges/{mic}/eod".format(client.base_url, mic=mic)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
 
-    params["symbols"] = symbols
+    params["symbols"] = join_symbols(symbols)
 
     json_sort: Union[Unset, None, str] = UNSET
     if not isinstance(sort, Unset):
@@ -52,54 +62,59 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     if response.status_code == 200:
-        response_200 = PagedResponseExchangeEod.from_dict(response.json())
+        response_200 = PagedResponseExchangeEod.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -108,19 +123,20 @@ def sync_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
@@ -128,6 +144,8 @@ def sync_detailed(
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -145,12 +163,11 @@ def sync_detailed(
         offset=offset,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -158,7 +175,7 @@ def sync(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
@@ -170,7 +187,10 @@ def sync(
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response of their first pages, limit and offset can then
+            not be given.
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
@@ -183,7 +203,9 @@ def sync(
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return sync_detailed(
+    return sync_chunks(
+        sync_detailed,
+        lambda page: page.data.eod,
         mic=mic,
         client=client,
         access_key=access_key,
@@ -193,7 +215,7 @@ def sync(
         date_to=date_to,
         limit=limit,
         offset=offset,
-    ).parsed
+    )
 
 
 async def asyncio_detailed(
@@ -201,19 +223,20 @@ async def asyncio_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
@@ -221,6 +244,8 @@ async def asyncio_detailed(
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -238,10 +263,9 @@ async def asyncio_detailed(
         offset=offset,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -249,7 +273,7 @@ async def asyncio(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
     sort: Union[Unset, None, Sort] = UNSET,
     date_from: Union[Unset, None, str] = UNSET,
     date_to: Union[Unset, None, str] = UNSET,
@@ -261,7 +285,10 @@ async def asyncio(
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response of their first pages, limit and offset can then
+            not be given.
         sort (Union[Unset, None, Sort]): An enumeration.
         date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
             ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
@@ -274,8 +301,60 @@ async def asyncio(
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return (
-        await asyncio_detailed(
+    return await asyncio_chunks(
+        asyncio_detailed,
+        lambda page: page.data.eod,
+        mic=mic,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset,
+    )
+
+
+def iter_all(
+    mic: str,
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> ItemIterator[EodPrice]:
+    """Iterate over the items of all pages
+
+    Pages are requested lazily one after another until ``pagination.total`` is reached.
+
+    Args:
+        mic (str):
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged chunk after chunk.
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        ItemIterator[EodPrice]: Also supports ``to_pandas()`` and ``to_arrow()``.
+    """
+
+    return ItemIterator(
+        iter_chunk_pages(
+            sync_detailed,
             mic=mic,
             client=client,
             access_key=access_key,
@@ -285,5 +364,115 @@ async def asyncio(
             date_to=date_to,
             limit=limit,
             offset=offset,
-        )
-    ).parsed
+        ),
+        lambda page: page.data.eod,
+        EodPrice,
+    )
+
+
+def sync_all(
+    mic: str,
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[EodPrice]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently from a thread pool.
+
+    Args:
+        mic (str):
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged in concurrent chunks.
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[EodPrice]
+    """
+
+    pages = fetch_chunk_pages(
+        sync_detailed,
+        mic=mic,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data.eod]
+
+
+async def asyncio_all(
+    mic: str,
+    *,
+    client: Client,
+    access_key: str,
+    symbols: Union[List[str], str],
+    sort: Union[Unset, None, Sort] = UNSET,
+    date_from: Union[Unset, None, str] = UNSET,
+    date_to: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[EodPrice]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently.
+
+    Args:
+        mic (str):
+        access_key (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are paged in concurrent chunks.
+        sort (Union[Unset, None, Sort]): An enumeration.
+        date_from (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        date_to (Union[Unset, None, str]): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or
+            ISO-8601 %Y-%m-%dT%H:%M:%S+%Z
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item, only for up to MAX_SYMBOLS symbols.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[EodPrice]
+    """
+
+    pages = await asyncio_fetch_chunk_pages(
+        asyncio_detailed,
+        mic=mic,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data.eod]
@@ -1,7 +1,9 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from ...chunking import asyncio_chunks, join_symbols, sync_chunks
 from ...client import Client
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
@@ -14,16 +16,15 @@ def _get_kwargs(
     date: str,
     *,
     client: Client,
-    symbols: str,
+    symbols: Union[List[str], str],
     access_key: str,
 ) -> Dict[str, Any]:
     url = "{}/exchanges/{mic}/eod/{date}".format(client.base_url, mic=mic, date=date)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
-    params["symbols"] = symbols
+    params["symbols"] = join_symbols(symbols)
 
     params["access_key"] = access_key
 
@@ -33,54 +34,59 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     if response.status_code == 200:
-        response_200 = PagedResponseExchangeEod.from_dict(response.json())
+        response_200 = PagedResponseExchangeEod.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -89,8 +95,9 @@ def sync_detailed(
     date: str,
     *,
     client: Client,
-    symbols: str,
+    symbols: Union[List[str], str],
     access_key: str,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Date
 
@@ -98,8 +105,10 @@ def sync_detailed(
         mic (str):
         date (str): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or ISO-8601
             %Y-%m-%dT%H:%M:%S+%Z
-        symbols (str):
+        symbols (Union[List[str], str]):
         access_key (str):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -113,12 +122,11 @@ def sync_detailed(
         access_key=access_key,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -126,7 +134,7 @@ def sync(
     date: str,
     *,
     client: Client,
-    symbols: str,
+    symbols: Union[List[str], str],
     access_key: str,
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Date
@@ -135,20 +143,24 @@ def sync(
         mic (str):
         date (str): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or ISO-8601
             %Y-%m-%dT%H:%M:%S+%Z
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response.
         access_key (str):
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return sync_detailed(
+    return sync_chunks(
+        sync_detailed,
+        lambda page: page.data.eod,
         mic=mic,
         date=date,
         client=client,
         symbols=symbols,
         access_key=access_key,
-    ).parsed
+    )
 
 
 async def asyncio_detailed(
@@ -156,8 +168,9 @@ async def asyncio_detailed(
     date: str,
     *,
     client: Client,
-    symbols: str,
+    symbols: Union[List[str], str],
     access_key: str,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Date
 
@@ -165,8 +178,10 @@ async def asyncio_detailed(
         mic (str):
         date (str): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or ISO-8601
             %Y-%m-%dT%H:%M:%S+%Z
-        symbols (str):
+        symbols (Union[List[str], str]):
         access_key (str):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -180,10 +195,9 @@ async def asyncio_detailed(
         access_key=access_key,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -191,7 +205,7 @@ async def asyncio(
     date: str,
     *,
     client: Client,
-    symbols: str,
+    symbols: Union[List[str], str],
     access_key: str,
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Date
@@ -200,19 +214,21 @@ async def asyncio(
         mic (str):
         date (str): Date in the formats %Y-%m-%d, %Y-%m-%d %H:%M:%S or ISO-8601
             %Y-%m-%dT%H:%M:%S+%Z
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response.
         access_key (str):
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return (
-        await asyncio_detailed(
-            mic=mic,
-            date=date,
-            client=client,
-            symbols=symbols,
-            access_key=access_key,
-        )
-    ).parsed
+    return await asyncio_chunks(
+        asyncio_detailed,
+        lambda page: page.data.eod,
+        mic=mic,
+        date=date,
+        client=client,
+        symbols=symbols,
+        access_key=access_key,
+    )
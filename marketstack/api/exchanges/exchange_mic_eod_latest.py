@@ -1,7 +1,9 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from ...chunking import asyncio_chunks, join_symbols, sync_chunks
 from ...client import Client
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
@@ -14,17 +16,16 @@ def _get_kwargs(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
 ) -> Dict[str, Any]:
     url = "{}/exchanges/{mic}/eod/latest".format(client.base_url, mic=mic)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
 
-    params["symbols"] = symbols
+    params["symbols"] = join_symbols(symbols)
 
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
@@ -32,54 +33,59 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     if response.status_code == 200:
-        response_200 = PagedResponseExchangeEod.from_dict(response.json())
+        response_200 = PagedResponseExchangeEod.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -88,14 +94,17 @@ def sync_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Latest
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -108,12 +117,11 @@ def sync_detailed(
         symbols=symbols,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -121,25 +129,29 @@ def sync(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Latest
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return sync_detailed(
+    return sync_chunks(
+        sync_detailed,
+        lambda page: page.data.eod,
         mic=mic,
         client=client,
         access_key=access_key,
         symbols=symbols,
-    ).parsed
+    )
 
 
 async def asyncio_detailed(
@@ -147,14 +159,17 @@ async def asyncio_detailed(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Latest
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
@@ -167,10 +182,9 @@ async def asyncio_detailed(
         symbols=symbols,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -178,24 +192,26 @@ async def asyncio(
     *,
     client: Client,
     access_key: str,
-    symbols: str,
+    symbols: Union[List[str], str],
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]:
     """Mic Eod Latest
 
     Args:
         mic (str):
         access_key (str):
-        symbols (str):
+        symbols (Union[List[str], str]): Comma separated symbols or a list of symbols.
+            More than MAX_SYMBOLS symbols are requested in concurrent chunks and
+            merged into one response.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseExchangeEod]]
     """
 
-    return (
-        await asyncio_detailed(
-            mic=mic,
-            client=client,
-            access_key=access_key,
-            symbols=symbols,
-        )
-    ).parsed
+    return await asyncio_chunks(
+        asyncio_detailed,
+        lambda page: page.data.eod,
+        mic=mic,
+        client=client,
+        access_key=access_key,
+        symbols=symbols,
+    )
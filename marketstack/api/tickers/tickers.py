@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
@@ -6,6 +7,15 @@ from ...client import Client
 from ...models.error_response import ErrorResponse
 from ...models.http_validation_error import HTTPValidationError
 from ...models.paged_response_listmodels_ticker import PagedResponseListmodelsTicker
+from ...models.ticker import Ticker
+from ...paging import (
+    MAX_CONCURRENCY,
+    MAX_LIMIT,
+    ItemIterator,
+    asyncio_fetch_pages,
+    fetch_pages,
+    iter_pages,
+)
 from ...types import UNSET, Response, Unset
 
 
@@ -21,7 +31,6 @@ def _get_kwargs(
     url = "{}/tickers".format(client.base_url)
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     params: Dict[str, Any] = {}
     params["access_key"] = access_key
@@ -40,54 +49,59 @@ def _get_kwargs(
         "method": "get",
         "url": url,
         "headers": headers,
-        "cookies": cookies,
         "timeout": client.get_timeout(),
         "params": params,
     }
 
 
 def _parse_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response
 ) -> Optional[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]:
     if response.status_code == 200:
-        response_200 = PagedResponseListmodelsTicker.from_dict(response.json())
+        response_200 = PagedResponseListmodelsTicker.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == 401:
-        response_401 = ErrorResponse.from_dict(response.json())
+        response_401 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_401
     if response.status_code == 403:
-        response_403 = ErrorResponse.from_dict(response.json())
+        response_403 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_403
     if response.status_code == 404:
-        response_404 = ErrorResponse.from_dict(response.json())
+        response_404 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_404
     if response.status_code == 429:
-        response_429 = ErrorResponse.from_dict(response.json())
+        response_429 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_429
     if response.status_code == 500:
-        response_500 = ErrorResponse.from_dict(response.json())
+        response_500 = ErrorResponse.from_dict(client.json_decoder(response.content))
 
         return response_500
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_422
     return None
 
 
 def _build_response(
-    *, response: httpx.Response
+    *, client: Client, response: httpx.Response, parse: bool = True
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]:
     return Response(
         status_code=response.status_code,
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(response=response),
+        parse=partial(_parse_response, client=client, response=response)
+        if parse
+        else None,
     )
 
 
@@ -99,6 +113,7 @@ def sync_detailed(
     search: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]:
     """Query
 
@@ -108,6 +123,8 @@ def sync_detailed(
         search (Union[Unset, None, str]):
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]
@@ -122,12 +139,11 @@ def sync_detailed(
         offset=offset,
     )
 
-    response = httpx.request(
-        verify=client.verify_ssl,
+    response = client.get_httpx_client().request(
         **kwargs,
     )
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 def sync(
@@ -170,6 +186,7 @@ async def asyncio_detailed(
     search: Union[Unset, None, str] = UNSET,
     limit: Union[Unset, None, int] = UNSET,
     offset: Union[Unset, None, int] = UNSET,
+    parse: bool = True,
 ) -> Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]:
     """Query
 
@@ -179,6 +196,8 @@ async def asyncio_detailed(
         search (Union[Unset, None, str]):
         limit (Union[Unset, None, int]):
         offset (Union[Unset, None, int]):
+        parse (bool): Parse the content into models on first access of ``parsed``.
+            False skips deserialization entirely and ``parsed`` stays None.
 
     Returns:
         Response[Union[ErrorResponse, HTTPValidationError, PagedResponseListmodelsTicker]]
@@ -193,10 +212,9 @@ async def asyncio_detailed(
         offset=offset,
     )
 
-    async with httpx.AsyncClient(verify=client.verify_ssl) as _client:
-        response = await _client.request(**kwargs)
+    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(response=response)
+    return _build_response(client=client, response=response, parse=parse)
 
 
 async def asyncio(
@@ -231,3 +249,129 @@ async def asyncio(
             offset=offset,
         )
     ).parsed
+
+
+def iter_all(
+    *,
+    client: Client,
+    access_key: str,
+    exchange: Union[Unset, None, str] = UNSET,
+    search: Union[Unset, None, str] = UNSET,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> ItemIterator[Ticker]:
+    """Iterate over the items of all pages
+
+    Pages are requested lazily one after another until ``pagination.total`` is reached.
+
+    Args:
+        access_key (str):
+        exchange (Union[Unset, None, str]):
+        search (Union[Unset, None, str]):
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        ItemIterator[Ticker]: Also supports ``to_pandas()`` and ``to_arrow()``.
+    """
+
+    return ItemIterator(
+        iter_pages(
+            sync_detailed,
+            client=client,
+            access_key=access_key,
+            exchange=exchange,
+            search=search,
+            limit=limit,
+            offset=offset,
+        ),
+        lambda page: page.data,
+        Ticker,
+    )
+
+
+def sync_all(
+    *,
+    client: Client,
+    access_key: str,
+    exchange: Union[Unset, None, str] = UNSET,
+    search: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[Ticker]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently from a thread pool.
+
+    Args:
+        access_key (str):
+        exchange (Union[Unset, None, str]):
+        search (Union[Unset, None, str]):
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[Ticker]
+    """
+
+    pages = fetch_pages(
+        sync_detailed,
+        client=client,
+        access_key=access_key,
+        exchange=exchange,
+        search=search,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
+
+
+async def asyncio_all(
+    *,
+    client: Client,
+    access_key: str,
+    exchange: Union[Unset, None, str] = UNSET,
+    search: Union[Unset, None, str] = UNSET,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+) -> List[Ticker]:
+    """Fetch the items of all pages
+
+    After the first page the remaining pages are requested concurrently.
+
+    Args:
+        access_key (str):
+        exchange (Union[Unset, None, str]):
+        search (Union[Unset, None, str]):
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first item.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List[Ticker]
+    """
+
+    pages = await asyncio_fetch_pages(
+        asyncio_detailed,
+        client=client,
+        access_key=access_key,
+        exchange=exchange,
+        search=search,
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+    )
+    return [item for page in pages for item in page.data]
@@ -0,0 +1,181 @@
+""" Micro-batching of single symbol latest price lookups into multi-symbol requests """
+import asyncio
+import threading
+from concurrent.futures import Future
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .api.eod import eod_latest
+from .chunking import MAX_SYMBOLS
+from .client import Client
+
+DEFAULT_WINDOW = 0.01
+"""Seconds lookups are collected before they are sent as one request"""
+
+
+def _route(
+    symbols: Sequence[str], rows: Sequence[Any], results: Dict[str, List[Any]]
+) -> None:
+    by_symbol: Dict[str, Any] = {}
+    for row in rows:
+        by_symbol.setdefault(row.symbol, row)
+    for symbol in symbols:
+        row = by_symbol.get(symbol)
+        for future in results.pop(symbol):
+            if not future.done():
+                future.set_result(row)
+
+
+def _fail(results: Dict[str, List[Any]], error: BaseException) -> None:
+    for futures in results.values():
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+
+class LatestPriceBatcher:
+    """Collects single symbol lookups of a latest price endpoint and sends them together
+
+    Lookups arriving within ``window`` seconds are sent as one ``symbols=`` request of
+    up to ``max_symbols`` symbols. Each row of the response is routed back to the callers
+    waiting for its symbol. Callers of a symbol without a row get None, and all callers of
+    a failed request get its exception, e.g. an ApiError.
+
+    ``get()`` can be called from many threads and ``asyncio_get()`` from many coroutines of
+    one event loop.
+
+    Args:
+        client (Client): The client.
+        access_key (str):
+        endpoint (ModuleType): A latest price endpoint module, ``eod.eod_latest`` or
+            ``intraday.intraday_latest``.
+        window (float): Seconds to collect lookups before sending them.
+        max_symbols (int): Maximum number of symbols of a request.
+        **kwargs: Further arguments of the endpoint, e.g. ``exchange`` or ``interval``.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        access_key: str,
+        endpoint: ModuleType = eod_latest,
+        window: float = DEFAULT_WINDOW,
+        max_symbols: int = MAX_SYMBOLS,
+        **kwargs: Any,
+    ):
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if not 1 <= max_symbols <= MAX_SYMBOLS:
+            raise ValueError(f"max_symbols must be between 1 and {MAX_SYMBOLS}")
+        self.client = client
+        self.access_key = access_key
+        self.endpoint = endpoint
+        self.window = window
+        self.max_symbols = max_symbols
+        self.kwargs = kwargs
+        self._pending: Dict[str, List["Future[Any]"]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._async_pending: Dict[str, List["asyncio.Future[Any]"]] = {}
+        self._async_timer: Optional[asyncio.TimerHandle] = None
+        self._async_tasks: Set["asyncio.Task[None]"] = set()
+
+    def _fetch(self, symbols: List[str]) -> List[Any]:
+        return self.endpoint.sync_all(
+            client=self.client,
+            access_key=self.access_key,
+            symbols=symbols,
+            **self.kwargs,
+        )
+
+    async def _asyncio_fetch(self, symbols: List[str]) -> List[Any]:
+        return await self.endpoint.asyncio_all(
+            client=self.client,
+            access_key=self.access_key,
+            symbols=symbols,
+            **self.kwargs,
+        )
+
+    def get(self, symbol: str) -> Optional[Any]:
+        """Return the latest price of a symbol, or None if the API returned no row
+
+        Raises:
+            ApiError: If the API returns an error response.
+        """
+        future: "Future[Any]" = Future()
+        with self._lock:
+            self._pending.setdefault(symbol, []).append(future)
+            if len(self._pending) >= self.max_symbols:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._send(batch)
+        return future.result()
+
+    def _take(self) -> Dict[str, List["Future[Any]"]]:
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _send(self, batch: Dict[str, List["Future[Any]"]]) -> None:
+        symbols = list(batch)
+        try:
+            rows = self._fetch(symbols)
+        except Exception as e:
+            _fail(batch, e)
+        else:
+            _route(symbols, rows, batch)
+
+    def flush(self) -> None:
+        """Send the collected lookups now"""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._send(batch)
+
+    async def asyncio_get(self, symbol: str) -> Optional[Any]:
+        """Return the latest price of a symbol, or None if the API returned no row
+
+        Raises:
+            ApiError: If the API returns an error response.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._async_pending.setdefault(symbol, []).append(future)
+        if len(self._async_pending) >= self.max_symbols:
+            self._asyncio_flush()
+        elif self._async_timer is None:
+            self._async_timer = loop.call_later(self.window, self._asyncio_flush)
+        return await future
+
+    def _asyncio_flush(self) -> None:
+        batch, self._async_pending = self._async_pending, {}
+        if self._async_timer is not None:
+            self._async_timer.cancel()
+            self._async_timer = None
+        if batch:
+            # keep a reference until the task is done
+            task = asyncio.ensure_future(self._asyncio_send(batch))
+            self._async_tasks.add(task)
+            task.add_done_callback(self._async_tasks.discard)
+
+    async def _asyncio_send(
+        self, batch: Dict[str, List["asyncio.Future[Any]"]]
+    ) -> None:
+        symbols = list(batch)
+        try:
+            rows = await self._asyncio_fetch(symbols)
+        except Exception as e:
+            _fail(batch, e)
+        else:
+            _route(symbols, rows, batch)
+
+
+__all__ = ["DEFAULT_WINDOW", "LatestPriceBatcher"]
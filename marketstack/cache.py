@@ -0,0 +1,158 @@
+""" In-memory caching of API responses """
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+import httpx
+
+from .chunking import split_symbols
+
+EXCLUDED_PARAMS = frozenset({"access_key"})
+"""Query parameters which do not change the response and are left out of cache keys"""
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body with the headers needed to rebuild the response"""
+
+    expires: float
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+
+def decoded_headers(response: httpx.Response) -> List[Tuple[str, str]]:
+    """Return the headers of a read response which remain valid for its decoded content"""
+    return [
+        (name, value)
+        for name, value in response.headers.items()
+        if name not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+
+
+def _compile_path(template: str) -> Pattern[str]:
+    parts = re.split(r"\{\w+\}", template.rstrip("/"))
+    return re.compile("[^/]+".join(map(re.escape, parts)))
+
+
+class ResponseCache:
+    """A thread safe LRU cache of successful responses with per endpoint TTLs
+
+    Responses are keyed on the request path and its normalized query parameters: the
+    ``access_key`` is left out and the ``symbols`` are sorted and deduplicated, so the same
+    request of different callers is only sent once until it expires.
+
+    Args:
+        ttl (float): Seconds a response is cached, unless configured per endpoint.
+        ttls (Optional[Dict[str, float]]): Seconds a response is cached by endpoint path,
+            e.g. ``{"/eod/latest": 5, "/tickers/{symbol}/eod/latest": 5, "/exchanges": 3600}``.
+            A TTL of 0 disables caching of the endpoint.
+        max_entries (int): Maximum number of cached responses.
+        max_bytes (Optional[int]): Maximum total size of the cached response bodies.
+        clock (Callable[[], float]): Monotonic clock used for expiration.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # templates with fewer parameters win, e.g. /eod/latest over /eod/{date}
+        self._ttl_patterns = sorted(
+            ((_compile_path(path), ttl) for path, ttl in self.ttls.items()),
+            key=lambda item: item[0].pattern.count("[^/]+"),
+        )
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the cached response bodies"""
+        return self._bytes
+
+    def get_ttl(self, path: str) -> float:
+        """Return the TTL of an endpoint path relative to the base URL"""
+        path = path.rstrip("/")
+        for pattern, ttl in self._ttl_patterns:
+            if pattern.fullmatch(path):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def make_key(request: httpx.Request) -> CacheKey:
+        """Return the cache key of a request"""
+        params = []
+        for name, value in request.url.params.multi_items():
+            if name in EXCLUDED_PARAMS:
+                continue
+            if name == "symbols":
+                value = ",".join(sorted(set(split_symbols(value))))
+            params.append((name, value))
+        return request.url.host, request.url.path, tuple(sorted(params))
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Return the cached response of a key if it has not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: CacheKey, response: httpx.Response, ttl: float) -> None:
+        """Cache a response, which must have been read, for ``ttl`` seconds"""
+        content = response.content
+        if ttl <= 0 or (self.max_bytes is not None and len(content) > self.max_bytes):
+            return
+        entry = CachedResponse(
+            self.clock() + ttl, response.status_code, decoded_headers(response), content
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += len(content)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: CacheKey) -> None:
+        self._bytes -= len(self._entries.pop(key).content)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = ["CachedResponse", "EXCLUDED_PARAMS", "ResponseCache", "decoded_headers"]
@@ -0,0 +1,249 @@
+""" Helpers to split large symbol lists into multiple requests """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, Sequence, Union
+
+from .paging import (
+    MAX_CONCURRENCY,
+    MAX_LIMIT,
+    asyncio_fetch_pages,
+    fetch_pages,
+    iter_pages,
+)
+from .types import Response
+
+MAX_SYMBOLS = 100
+"""The maximum number of symbols accepted by the API in one request"""
+
+Symbols = Union[str, Sequence[str]]
+
+
+def split_symbols(symbols: Symbols) -> List[str]:
+    """Split comma separated symbols into a list of symbols"""
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    return [symbol.strip() for symbol in symbols if symbol.strip()]
+
+
+def join_symbols(symbols: Symbols) -> str:
+    """Join a list of symbols into the comma separated format of the API"""
+    if isinstance(symbols, str):
+        return symbols
+    return ",".join(symbols)
+
+
+def chunk_symbols(symbols: Symbols, chunk_size: int = MAX_SYMBOLS) -> List[str]:
+    """Split symbols into comma separated chunks of at most ``chunk_size`` symbols"""
+    symbol_list = split_symbols(symbols)
+    return [
+        join_symbols(symbol_list[i : i + chunk_size])
+        for i in range(0, len(symbol_list), chunk_size)
+    ] or [join_symbols(symbols)]
+
+
+def merge_responses(
+    responses: List[Response[Any]], get_items: Callable[[Any], List[Any]]
+) -> Optional[Any]:
+    """Merge the parsed first pages of multiple symbol chunks into the first one
+
+    The first error response is returned as it is. The merged pagination sums up ``limit``,
+    ``count`` and ``total`` of all chunks.
+    """
+    for response in responses:
+        if response.status_code != 200:
+            return response.parsed
+
+    merged = responses[0].parsed
+    items = get_items(merged)
+    for response in responses[1:]:
+        page = response.parsed
+        items.extend(get_items(page))
+        merged.pagination.limit += page.pagination.limit
+        merged.pagination.count += page.pagination.count
+        merged.pagination.total += page.pagination.total
+    return merged
+
+
+def _first_page_chunks(symbols: Symbols, kwargs: Any) -> List[str]:
+    chunks = chunk_symbols(symbols)
+    if len(chunks) > 1 and (kwargs.get("limit") or kwargs.get("offset")):
+        raise ValueError(
+            f"limit and offset can not be used with more than {MAX_SYMBOLS} symbols, "
+            "request all pages instead"
+        )
+    return chunks
+
+
+def _pages_chunks(symbols: Symbols, offset: int) -> List[str]:
+    chunks = chunk_symbols(symbols)
+    if len(chunks) > 1 and offset:
+        raise ValueError(f"offset can not be used with more than {MAX_SYMBOLS} symbols")
+    return chunks
+
+
+def sync_chunks(
+    sync_detailed: Callable[..., Response[Any]],
+    get_items: Callable[[Any], List[Any]],
+    *,
+    symbols: Symbols,
+    **kwargs: Any,
+) -> Optional[Any]:
+    """Request the symbols in concurrent chunks from a thread pool and merge the responses
+
+    Every chunk returns its first page, so ``limit`` and ``offset`` can only be given for
+    up to MAX_SYMBOLS symbols, use ``fetch_chunk_pages()`` for all pages.
+
+    Args:
+        sync_detailed: The ``sync_detailed`` function of an endpoint taking ``symbols``.
+        get_items: Returns the list of items of a parsed page.
+        symbols: Comma separated symbols or a list of symbols of any length.
+        **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ValueError: If ``limit`` or ``offset`` is given for more than MAX_SYMBOLS symbols.
+    """
+    chunks = _first_page_chunks(symbols, kwargs)
+    if len(chunks) == 1:
+        return sync_detailed(symbols=chunks[0], **kwargs).parsed
+
+    def fetch(chunk: str) -> Response[Any]:
+        return sync_detailed(symbols=chunk, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(chunks))) as executor:
+        return merge_responses(list(executor.map(fetch, chunks)), get_items)
+
+
+async def asyncio_chunks(
+    asyncio_detailed: Callable[..., Awaitable[Response[Any]]],
+    get_items: Callable[[Any], List[Any]],
+    *,
+    symbols: Symbols,
+    **kwargs: Any,
+) -> Optional[Any]:
+    """Request the symbols in concurrent chunks and merge the responses
+
+    See ``sync_chunks()``.
+    """
+    chunks = _first_page_chunks(symbols, kwargs)
+    if len(chunks) == 1:
+        return (await asyncio_detailed(symbols=chunks[0], **kwargs)).parsed
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def fetch(chunk: str) -> Response[Any]:
+        async with semaphore:
+            return await asyncio_detailed(symbols=chunk, **kwargs)
+
+    responses = await asyncio.gather(*map(fetch, chunks))
+    return merge_responses(list(responses), get_items)
+
+
+def iter_chunk_pages(
+    sync_detailed: Callable[..., Response[Any]],
+    *,
+    symbols: Symbols,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Lazily fetch all pages of the symbols, chunk after chunk
+
+    See ``paging.iter_pages()``. More than MAX_SYMBOLS symbols are split into chunks, the
+    pages of a chunk follow the pages of the previous one.
+
+    Raises:
+        ValueError: If ``offset`` is given for more than MAX_SYMBOLS symbols.
+        ApiError: If the API returns an error response.
+    """
+    return chain.from_iterable(
+        iter_pages(sync_detailed, symbols=chunk, limit=limit, offset=offset, **kwargs)
+        for chunk in _pages_chunks(symbols, offset)
+    )
+
+
+def fetch_chunk_pages(
+    sync_detailed: Callable[..., Response[Any]],
+    *,
+    symbols: Symbols,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[Any]:
+    """Fetch all pages of the symbols using a thread pool
+
+    See ``paging.fetch_pages()``. More than MAX_SYMBOLS symbols are split into chunks,
+    which are paged concurrently and share ``max_concurrency``.
+
+    Raises:
+        ValueError: If ``offset`` is given for more than MAX_SYMBOLS symbols.
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List of all pages, in offset order per chunk.
+    """
+    chunks = _pages_chunks(symbols, offset)
+    chunk_concurrency = max(1, max_concurrency // len(chunks))
+
+    def fetch(chunk: str) -> List[Any]:
+        return fetch_pages(
+            sync_detailed,
+            symbols=chunk,
+            max_concurrency=chunk_concurrency,
+            limit=limit,
+            offset=offset,
+            **kwargs,
+        )
+
+    if len(chunks) == 1:
+        return fetch(chunks[0])
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as executor:
+        return [page for pages in executor.map(fetch, chunks) for page in pages]
+
+
+async def asyncio_fetch_chunk_pages(
+    asyncio_detailed: Callable[..., Awaitable[Response[Any]]],
+    *,
+    symbols: Symbols,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[Any]:
+    """Fetch all pages of the symbols concurrently
+
+    See ``fetch_chunk_pages()``.
+    """
+    chunks = _pages_chunks(symbols, offset)
+    chunk_concurrency = max(1, max_concurrency // len(chunks))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(chunk: str) -> List[Any]:
+        async with semaphore:
+            return await asyncio_fetch_pages(
+                asyncio_detailed,
+                symbols=chunk,
+                max_concurrency=chunk_concurrency,
+                limit=limit,
+                offset=offset,
+                **kwargs,
+            )
+
+    chunk_pages = await asyncio.gather(*map(fetch, chunks))
+    return [page for pages in chunk_pages for page in pages]
+
+
+__all__ = [
+    "MAX_SYMBOLS",
+    "Symbols",
+    "asyncio_chunks",
+    "asyncio_fetch_chunk_pages",
+    "chunk_symbols",
+    "fetch_chunk_pages",
+    "iter_chunk_pages",
+    "join_symbols",
+    "merge_responses",
+    "split_symbols",
+    "sync_chunks",
+]
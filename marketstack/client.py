@@ -1,18 +1,86 @@
+import asyncio
 import ssl
-from typing import Dict, Union
+import threading
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Union
 
 import attr
+import httpx
+from httpx._utils import get_environment_proxies
+
+from .cache import ResponseCache
+from .decoding import JsonDecoder, default_json_decoder
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import (
+    AsyncCacheTransport,
+    AsyncRateLimitTransport,
+    AsyncRetryTransport,
+    AsyncSingleFlightTransport,
+    CacheTransport,
+    RateLimitTransport,
+    RetryTransport,
+    SingleFlightTransport,
+)
+
+
+async def _close_with_loop(
+    async_client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    # finalized by loop.shutdown_asyncgens(), e.g. at the end of asyncio.run()
+    try:
+        yield
+    finally:
+        await async_client.aclose()
 
 
 @attr.s(auto_attribs=True)
 class Client:
-    """A class for keeping track of data related to the API"""
+    """A class for keeping track of data related to the API
+
+    The underlying ``httpx.Client`` and ``httpx.AsyncClient`` are created lazily on first
+    use and reused by all endpoint calls, so connections are kept alive between requests.
+    Use the client as a (async) context manager or call ``close()``/``aclose()`` to release
+    the pooled connections.
+
+    Attributes:
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        rate_limiter: Optional rate limiter shared by all sync and async requests.
+        retry_policy: Optional policy to retry transient failures of all requests.
+        response_cache: Optional cache answering repeated requests without calling the API.
+        single_flight: Let identical concurrent requests share one request to the API.
+        json_decoder: Decodes response bodies, defaults to orjson if it is installed.
+    """
 
     base_url: str
     cookies: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
     headers: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
     timeout: float = attr.ib(5.0, kw_only=True)
     verify_ssl: Union[str, bool, ssl.SSLContext] = attr.ib(True, kw_only=True)
+    max_connections: Optional[int] = attr.ib(100, kw_only=True)
+    max_keepalive_connections: Optional[int] = attr.ib(20, kw_only=True)
+    keepalive_expiry: Optional[float] = attr.ib(5.0, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = attr.ib(None, kw_only=True)
+    retry_policy: Optional[RetryPolicy] = attr.ib(None, kw_only=True)
+    response_cache: Optional[ResponseCache] = attr.ib(None, kw_only=True)
+    single_flight: bool = attr.ib(False, kw_only=True)
+    json_decoder: JsonDecoder = attr.ib(
+        factory=default_json_decoder, kw_only=True, repr=False
+    )
+    _client: Optional[httpx.Client] = attr.ib(None, init=False, repr=False, eq=False)
+    _async_client: Optional[httpx.AsyncClient] = attr.ib(
+        None, init=False, repr=False, eq=False
+    )
+    _async_loop: Optional[asyncio.AbstractEventLoop] = attr.ib(
+        None, init=False, repr=False, eq=False
+    )
+    _async_closer: Optional[AsyncGenerator[None, None]] = attr.ib(
+        None, init=False, repr=False, eq=False
+    )
+    _lock: threading.Lock = attr.ib(
+        factory=threading.Lock, init=False, repr=False, eq=False
+    )
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers to be used in all endpoints"""
@@ -36,6 +104,166 @@ class Client:
         """Get a new client matching this one with a new timeout (in seconds)"""
         return attr.evolve(self, timeout=timeout)
 
+    def get_limits(self) -> httpx.Limits:
+        """Get the connection pool limits used by the underlying httpx clients"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def wrap_transport(self, transport: httpx.BaseTransport) -> httpx.BaseTransport:
+        """Wrap a transport with the client side behaviour configured on this client"""
+        if self.rate_limiter is not None:
+            transport = RateLimitTransport(transport, self.rate_limiter)
+        if self.retry_policy is not None:
+            transport = RetryTransport(transport, self.retry_policy)
+        if self.single_flight:
+            transport = SingleFlightTransport(transport)
+        if self.response_cache is not None:
+            transport = CacheTransport(
+                transport, self.response_cache, httpx.URL(self.base_url).path
+            )
+        return transport
+
+    def wrap_async_transport(
+        self, transport: httpx.AsyncBaseTransport
+    ) -> httpx.AsyncBaseTransport:
+        """Wrap an async transport with the client side behaviour configured on this client"""
+        if self.rate_limiter is not None:
+            transport = AsyncRateLimitTransport(transport, self.rate_limiter)
+        if self.retry_policy is not None:
+            transport = AsyncRetryTransport(transport, self.retry_policy)
+        if self.single_flight:
+            transport = AsyncSingleFlightTransport(transport)
+        if self.response_cache is not None:
+            transport = AsyncCacheTransport(
+                transport, self.response_cache, httpx.URL(self.base_url).path
+            )
+        return transport
+
+    def _get_httpx_args(self) -> Dict[str, Any]:
+        return {
+            "cookies": self.get_cookies(),
+            "timeout": self.get_timeout(),
+        }
+
+    def _wraps_transport(self) -> bool:
+        return (
+            self.rate_limiter is not None
+            or self.retry_policy is not None
+            or self.single_flight
+            or self.response_cache is not None
+        )
+
+    def _get_transport_args(
+        self, transport_type: Callable[..., Any], wrap: Callable[[Any], Any]
+    ) -> Dict[str, Any]:
+        args = {"verify": self.verify_ssl, "limits": self.get_limits()}
+        if not self._wraps_transport():
+            return args
+        # httpx ignores the proxy environment variables if a transport is given
+        mounts = {
+            pattern: None
+            if proxy is None
+            else wrap(transport_type(proxy=httpx.Proxy(proxy), **args))
+            for pattern, proxy in get_environment_proxies().items()
+        }
+        return {"transport": wrap(transport_type(**args)), "mounts": mounts}
+
+    def set_httpx_client(self, client: httpx.Client) -> "Client":
+        """Manually set the underlying httpx.Client
+
+        **NOTE**: This will override any other settings on the client, including cookies, timeout
+        and pool limits. Use ``wrap_transport()`` to keep the client side behaviour.
+        """
+        self._client = client
+        return self
+
+    def get_httpx_client(self) -> httpx.Client:
+        """Get the underlying httpx.Client, constructing a new one if not previously set"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        **self._get_transport_args(
+                            httpx.HTTPTransport, self.wrap_transport
+                        ),
+                        **self._get_httpx_args(),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the underlying httpx.Client and release its pooled connections"""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> "Client":
+        """Enter a context manager for the underlying httpx.Client"""
+        self.get_httpx_client().__enter__()
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        """Exit a context manager for the underlying httpx.Client"""
+        self.close()
+
+    def set_async_httpx_client(self, async_client: httpx.AsyncClient) -> "Client":
+        """Manually set the underlying httpx.AsyncClient
+
+        **NOTE**: This will override any other settings on the client, including cookies, timeout
+        and pool limits. Use ``wrap_async_transport()`` to keep the client side behaviour.
+        """
+        self._async_client = async_client
+        self._async_loop = None
+        return self
+
+    def get_async_httpx_client(self) -> httpx.AsyncClient:
+        """Get the underlying httpx.AsyncClient, constructing a new one if not previously set
+
+        A constructed client is bound to the running event loop; calling this from another
+        event loop (e.g. a second ``asyncio.run()``) creates a fresh client for that loop.
+        Constructed clients are closed when their loop shuts down its async generators, as
+        ``asyncio.run()`` does. Loops managed by hand without ``shutdown_asyncgens()`` need
+        ``aclose()`` before the client is used on another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or (
+            self._async_loop is not None and self._async_loop is not loop
+        ):
+            self._async_client = httpx.AsyncClient(
+                **self._get_transport_args(
+                    httpx.AsyncHTTPTransport, self.wrap_async_transport
+                ),
+                **self._get_httpx_args(),
+            )
+            self._async_loop = loop
+            # run the closer up to its yield, which registers it with the running loop
+            self._async_closer = _close_with_loop(self._async_client)
+            try:
+                self._async_closer.asend(None).send(None)
+            except StopIteration:
+                pass
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient and release its pooled connections"""
+        async_client, self._async_client = self._async_client, None
+        self._async_loop = None
+        self._async_closer = None
+        if async_client is not None:
+            await async_client.aclose()
+
+    async def __aenter__(self) -> "Client":
+        """Enter a context manager for the underlying httpx.AsyncClient"""
+        await self.get_async_httpx_client().__aenter__()
+        return self
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        """Exit a context manager for the underlying httpx.AsyncClient"""
+        await self.aclose()
+
 
 @attr.s(auto_attribs=True)
 class AuthenticatedClient(Client):
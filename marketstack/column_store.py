@@ -0,0 +1,232 @@
+""" Memory-mapped columnar storage of price series partitioned by symbol and year """
+import datetime
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Type, Union
+from urllib.parse import quote, unquote
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Columnar storage requires numpy, install it with: pip install marketstack[numpy]"
+    ) from e
+
+from .columnar import EOD_PRICE_FIELDS, INTERVAL_PRICE_FIELDS
+from .frames import columns as model_columns
+from .frames import to_datetime64
+from .models.eod_price import EodPrice
+from .models.interval_price import IntervalPrice
+
+Price = Union[EodPrice, IntervalPrice]
+Partition = Dict[str, np.ndarray]
+
+DATE_DTYPE = np.dtype("datetime64[s]")
+"""The dtype of the ``date`` column, UTC without timezone"""
+
+_FIELDS = {EodPrice: EOD_PRICE_FIELDS, IntervalPrice: INTERVAL_PRICE_FIELDS}
+
+# names the directory of the complete columns of a partition
+_CURRENT = "CURRENT"
+
+
+class ColumnStore:
+    """Stores price series as one ``.npy`` file per column, symbol and year
+
+    The layout is ``<directory>/<symbol>/<year>/<version>/<column>.npy`` with a ``date``
+    column of ``datetime64[s]`` in UTC and one ``float64`` column per price field, NaN for
+    missing values. Partitions are opened with ``numpy.memmap``
+    (``np.load(mmap_mode="r")``), so reading does not copy the data into memory until it is
+    accessed.
+
+    A write creates a new version directory of the partition and then atomically replaces
+    the ``<year>/CURRENT`` file naming the version, so readers never see the columns of
+    different writes.
+
+    Args:
+        directory (Union[str, os.PathLike]): The root directory of the store.
+        price_type (Type): ``EodPrice`` or ``IntervalPrice``.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        price_type: Type[Price] = EodPrice,
+    ):
+        if price_type not in _FIELDS:
+            raise ValueError(f"{price_type.__name__} is not EodPrice or IntervalPrice")
+        self.directory = Path(directory)
+        self.price_type = price_type
+        self.fields = _FIELDS[price_type]
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the stored columns"""
+        return ["date", *self.fields]
+
+    def _symbol_path(self, symbol: str) -> Path:
+        return self.directory / quote(symbol, safe="")
+
+    def symbols(self) -> List[str]:
+        """Return the stored symbols"""
+        if not self.directory.is_dir():
+            return []
+        return sorted(unquote(path.name) for path in self.directory.iterdir())
+
+    def years(self, symbol: str) -> List[int]:
+        """Return the stored years of a symbol"""
+        path = self._symbol_path(symbol)
+        if not path.is_dir():
+            return []
+        return sorted(
+            int(year.name)
+            for year in path.iterdir()
+            if year.name.isdigit() and (year / _CURRENT).exists()
+        )
+
+    def _current(self, path: Path) -> Optional[Path]:
+        try:
+            return path / (path / _CURRENT).read_text()
+        except FileNotFoundError:
+            return None
+
+    def read_partition(self, symbol: str, year: int) -> Partition:
+        """Return the memory-mapped columns of a symbol and year without copying them"""
+        path = self._symbol_path(symbol) / str(year)
+        version = self._current(path)
+        while True:
+            if version is None:
+                raise FileNotFoundError(f"No partition {path}")
+            try:
+                return {
+                    name: np.load(version / f"{name}.npy", mmap_mode="r")
+                    for name in self.columns
+                }
+            except FileNotFoundError:
+                # the version was removed after a concurrent write, read the new one
+                previous, version = version, self._current(path)
+                if version == previous:
+                    raise
+
+    def partitions(
+        self, symbol: str, years: Optional[Iterable[int]] = None
+    ) -> List[Partition]:
+        """Return the memory-mapped partitions of a symbol in chronological order"""
+        stored = self.years(symbol)
+        if years is not None:
+            wanted = set(years)
+            stored = [year for year in stored if year in wanted]
+        return [self.read_partition(symbol, year) for year in stored]
+
+    def read(
+        self,
+        symbol: str,
+        date_from: Optional[Union[str, datetime.date]] = None,
+        date_to: Optional[Union[str, datetime.date]] = None,
+    ) -> Partition:
+        """Return the columns of a symbol, optionally within an inclusive date range
+
+        A single partition is returned as memory-mapped views, multiple partitions are
+        concatenated.
+        """
+        start = None if date_from is None else np.datetime64(date_from, "s")
+        end = None if date_to is None else np.datetime64(date_to, "s")
+        if end is not None and len(str(date_to)) <= 10:
+            # a date without time includes the whole day
+            end = end + np.timedelta64(1, "D") - np.timedelta64(1, "s")
+        years = None
+        if start is not None or end is not None:
+            first = 1 if start is None else start.astype(object).year
+            last = 9999 if end is None else end.astype(object).year
+            years = range(first, last + 1)
+
+        partitions = self.partitions(symbol, years)
+        if not partitions:
+            return {
+                name: np.empty(0, DATE_DTYPE if name == "date" else np.float64)
+                for name in self.columns
+            }
+        if len(partitions) == 1:
+            result = partitions[0]
+        else:
+            result = {
+                name: np.concatenate([partition[name] for partition in partitions])
+                for name in self.columns
+            }
+        if start is None and end is None:
+            return result
+        dates = result["date"]
+        first_index = 0 if start is None else np.searchsorted(dates, start, "left")
+        last_index = len(dates) if end is None else np.searchsorted(dates, end, "right")
+        return {name: column[first_index:last_index] for name, column in result.items()}
+
+    def write_columns(self, symbol: str, columns: Partition) -> None:
+        """Merge columns of a symbol into its partitions
+
+        Rows are sorted by date and a new row replaces a stored row of the same date.
+
+        Args:
+            symbol: The symbol of all rows.
+            columns: A ``date`` column convertible to ``datetime64[s]`` and the float columns
+                of the price fields.
+        """
+        dates = np.asarray(columns["date"]).astype(DATE_DTYPE)
+        new = {"date": dates}
+        for name in self.fields:
+            new[name] = np.asarray(columns[name], dtype=np.float64)
+        row_years = dates.astype("datetime64[Y]").astype(int) + 1970
+        for year in np.unique(row_years):
+            mask = row_years == year
+            self._merge_partition(
+                symbol, int(year), {name: column[mask] for name, column in new.items()}
+            )
+
+    def _merge_partition(self, symbol: str, year: int, new: Partition) -> None:
+        path = self._symbol_path(symbol) / str(year)
+        if self._current(path) is not None:
+            stored = self.read_partition(symbol, year)
+            merged = {
+                name: np.concatenate([stored[name], new[name]]) for name in self.columns
+            }
+        else:
+            merged = new
+        order = np.argsort(merged["date"], kind="stable")
+        dates = merged["date"][order]
+        # keep the last, i.e. newest written, row of each date
+        keep = np.ones(len(dates), dtype=bool)
+        keep[:-1] = dates[1:] != dates[:-1]
+        order = order[keep]
+
+        path.mkdir(parents=True, exist_ok=True)
+        version = path / uuid.uuid4().hex
+        version.mkdir()
+        for name in self.columns:
+            np.save(version / f"{name}.npy", np.ascontiguousarray(merged[name][order]))
+        temp_path = path / f".{_CURRENT}.tmp"
+        temp_path.write_text(version.name)
+        os.replace(temp_path, path / _CURRENT)
+        # also removes versions left by interrupted writes, a version still mapped by a
+        # reader may not be removable on Windows and is retried on the next write
+        for entry in path.iterdir():
+            if entry.is_dir() and entry != version:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def write(self, prices: Sequence[Price]) -> None:
+        """Merge price models of any symbols into their partitions"""
+        by_symbol: Dict[str, List[Price]] = {}
+        for price in prices:
+            by_symbol.setdefault(price.symbol, []).append(price)
+        for symbol, symbol_prices in by_symbol.items():
+            columns = {
+                name: array
+                for name, (_, array) in model_columns(
+                    symbol_prices, self.price_type
+                ).items()
+            }
+            columns["date"] = to_datetime64(columns["date"])
+            self.write_columns(symbol, columns)
+
+
+__all__ = ["ColumnStore", "DATE_DTYPE"]
@@ -0,0 +1,242 @@
+""" Columnar parsing of EOD and intraday price responses into NumPy arrays """
+import datetime
+from operator import itemgetter
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import attr
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Columnar parsing requires numpy, install it with: pip install marketstack[numpy]"
+    ) from e
+
+from .client import Client
+from .dates import parse_datetime
+from .models.error_response import ErrorResponse
+from .models.http_validation_error import HTTPValidationError
+from .models.paged_response_exchange_eod import PagedResponseExchangeEod
+from .models.paged_response_exchange_intraday import PagedResponseExchangeIntraday
+from .models.paged_response_listmodels_eod_price import PagedResponseListmodelsEodPrice
+from .models.paged_response_listmodels_interval_price import (
+    PagedResponseListmodelsIntervalPrice,
+)
+from .models.paged_response_ticker_eod import PagedResponseTickerEod
+from .models.paged_response_ticker_intraday import PagedResponseTickerIntraday
+from .models.pagination import Pagination
+
+DATE_FIELDS = ("date",)
+CATEGORICAL_FIELDS = ("symbol", "exchange")
+EOD_PRICE_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adj_open",
+    "adj_high",
+    "adj_low",
+    "adj_close",
+    "adj_volume",
+    "split_factor",
+    "dividend",
+)
+"""The float fields of EodPrice"""
+INTERVAL_PRICE_FIELDS = ("open", "high", "low", "close", "last", "volume")
+"""The float fields of IntervalPrice"""
+
+_PRICE_FIELDS = {
+    PagedResponseListmodelsEodPrice: EOD_PRICE_FIELDS,
+    PagedResponseTickerEod: EOD_PRICE_FIELDS,
+    PagedResponseExchangeEod: EOD_PRICE_FIELDS,
+    PagedResponseListmodelsIntervalPrice: INTERVAL_PRICE_FIELDS,
+    PagedResponseTickerIntraday: INTERVAL_PRICE_FIELDS,
+    PagedResponseExchangeIntraday: INTERVAL_PRICE_FIELDS,
+}
+
+
+@attr.s(auto_attribs=True)
+class Categorical:
+    """A column of repeating strings stored as integer codes into unique categories
+
+    Attributes:
+        codes (np.ndarray): int32 index into ``categories`` for every row.
+        categories (np.ndarray): The unique values in order of first appearance.
+    """
+
+    codes: np.ndarray
+    categories: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def to_numpy(self) -> np.ndarray:
+        """Return the values as an object array"""
+        return self.categories[self.codes]
+
+
+Column = Union[np.ndarray, Categorical]
+
+
+@attr.s(auto_attribs=True)
+class PriceColumns:
+    """The prices of a response as one array per field
+
+    Dates are ``datetime64[ns]`` in UTC, prices and volumes ``float64`` with NaN for missing
+    values, and ``symbol``/``exchange`` are Categorical columns. Column names are the API's
+    field names, e.g. ``open`` instead of ``open_``.
+
+    Attributes:
+        pagination (Pagination): The pagination of the response.
+        columns (Dict[str, Column]): The columns by field name.
+    """
+
+    pagination: Pagination
+    columns: Dict[str, Column]
+
+    def __len__(self) -> int:
+        return len(self.columns["date"])
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+
+def _categorize(values: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    lookup: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (lookup.setdefault(value, len(lookup)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    categories = np.empty(len(lookup), dtype=object)
+    categories[:] = list(lookup)
+    return codes, categories
+
+
+def _to_datetime64(value: str) -> np.datetime64:
+    date = parse_datetime(value)
+    if date.tzinfo is not None:
+        date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(date, "ns")
+
+
+def parse_rows(
+    rows: List[Dict[str, Any]], price_fields: Tuple[str, ...]
+) -> Dict[str, Column]:
+    """Convert decoded price rows into columns without creating model instances
+
+    Args:
+        rows: The decoded ``data`` items of a price response.
+        price_fields: The float fields to extract, e.g. EOD_PRICE_FIELDS.
+    """
+    columns: Dict[str, Column] = {}
+    for name in DATE_FIELDS:
+        codes, unique_dates = _categorize([row[name] for row in rows])
+        dates = np.array(
+            [_to_datetime64(date) for date in unique_dates], dtype="M8[ns]"
+        )
+        columns[name] = dates[codes]
+    for name in CATEGORICAL_FIELDS:
+        columns[name] = Categorical(*_categorize([row.get(name) for row in rows]))
+    for name in price_fields:
+        try:
+            columns[name] = np.fromiter(
+                map(itemgetter(name), rows), dtype=np.float64, count=len(rows)
+            )
+        except (KeyError, TypeError):
+            # optional fields like volume or close may be missing or null
+            columns[name] = np.array([row.get(name) for row in rows], dtype=np.float64)
+    return columns
+
+
+def _price_rows(
+    data: Union[List[Dict[str, Any]], Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    if isinstance(data, list):
+        return data
+    # ticker and exchange wrappers nest the prices
+    if "eod" in data:
+        return data["eod"]
+    return data["intraday"]
+
+
+def parse_page(src_dict: Dict[str, Any], price_fields: Tuple[str, ...]) -> PriceColumns:
+    """Parse a decoded paged price response into columns
+
+    Supports the list responses of ``eod``/``intraday`` as well as the nested ticker and
+    exchange responses, e.g. of ``ticker_symbol_eod`` and ``exchange_mic_eod``.
+    """
+    return PriceColumns(
+        pagination=Pagination.from_dict(src_dict["pagination"]),
+        columns=parse_rows(_price_rows(src_dict["data"]), price_fields),
+    )
+
+
+def get_price_fields(endpoint: ModuleType) -> Tuple[str, ...]:
+    """Return the price fields of an endpoint module returning EOD or intraday prices"""
+    for page_type, price_fields in _PRICE_FIELDS.items():
+        if getattr(endpoint, page_type.__name__, None) is page_type:
+            return price_fields
+    raise ValueError(f"{endpoint.__name__} does not return EOD or intraday prices")
+
+
+def sync(
+    endpoint: ModuleType, *args: Any, client: Client, **kwargs: Any
+) -> Optional[Union[ErrorResponse, HTTPValidationError, PriceColumns]]:
+    """Request a price endpoint and parse the response into columns
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.eod.eod``.
+        client: The client.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Returns:
+        PriceColumns, or the parsed error response.
+    """
+    price_fields = get_price_fields(endpoint)
+    response = client.get_httpx_client().request(
+        **endpoint._get_kwargs(*args, client=client, **kwargs)
+    )
+    if response.status_code != 200:
+        return endpoint._parse_response(client=client, response=response)
+    return parse_page(client.json_decoder(response.content), price_fields)
+
+
+async def asyncio(
+    endpoint: ModuleType, *args: Any, client: Client, **kwargs: Any
+) -> Optional[Union[ErrorResponse, HTTPValidationError, PriceColumns]]:
+    """Request a price endpoint and parse the response into columns
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.eod.eod``.
+        client: The client.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Returns:
+        PriceColumns, or the parsed error response.
+    """
+    price_fields = get_price_fields(endpoint)
+    response = await client.get_async_httpx_client().request(
+        **endpoint._get_kwargs(*args, client=client, **kwargs)
+    )
+    if response.status_code != 200:
+        return endpoint._parse_response(client=client, response=response)
+    return parse_page(client.json_decoder(response.content), price_fields)
+
+
+__all__ = [
+    "Categorical",
+    "EOD_PRICE_FIELDS",
+    "INTERVAL_PRICE_FIELDS",
+    "PriceColumns",
+    "asyncio",
+    "get_price_fields",
+    "parse_page",
+    "parse_rows",
+    "sync",
+]
@@ -0,0 +1,30 @@
+""" Fast parsing of the ISO-8601 timestamps returned by the API """
+import datetime
+import re
+from functools import lru_cache
+
+from dateutil.parser import isoparse
+
+_NUMERIC_OFFSET = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp like ``2022-01-03T00:00:00+0000``
+
+    Uses ``datetime.fromisoformat`` where possible and falls back to ``dateutil``'s
+    ``isoparse`` otherwise. Results are memoized, so timestamps repeated for every symbol of
+    a multi-symbol page are only parsed once.
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        # Python < 3.11 only accepts offsets with a colon
+        return datetime.datetime.fromisoformat(_NUMERIC_OFFSET.sub(r"\1:\2", value))
+    except ValueError:
+        return isoparse(value)
+
+
+__all__ = ["parse_datetime"]
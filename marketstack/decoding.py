@@ -0,0 +1,25 @@
+""" JSON decoding of response bodies """
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def stdlib_json_decoder(content: bytes) -> Any:
+    """Decode a response body with the standard library"""
+    return json.loads(content)
+
+
+def default_json_decoder() -> JsonDecoder:
+    """Return orjson's decoder if it is installed, otherwise the standard library's"""
+    if orjson is not None:
+        return orjson.loads
+    return stdlib_json_decoder
+
+
+__all__ = ["JsonDecoder", "default_json_decoder", "stdlib_json_decoder"]
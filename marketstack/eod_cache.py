@@ -0,0 +1,403 @@
+""" Persistent local cache of historical end-of-day prices """
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .api.eod import eod
+from .chunking import Symbols, split_symbols
+from .client import Client
+from .models.eod_price import EodPrice
+from .paging import MAX_CONCURRENCY
+from .types import UNSET, Unset
+
+DateLike = Union[str, datetime.date]
+DateRange = Tuple[datetime.date, datetime.date]
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eod_prices (
+    scope TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (scope, symbol, date)
+);
+CREATE TABLE IF NOT EXISTS eod_ranges (
+    scope TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    date_from TEXT NOT NULL,
+    date_to TEXT NOT NULL,
+    PRIMARY KEY (scope, symbol, date_from)
+);
+"""
+
+
+def _utc_today() -> datetime.date:
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+
+def to_date(value: DateLike) -> datetime.date:
+    """Convert a date, datetime or string in one of the API's date formats into a date"""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value[:10])
+
+
+def merge_ranges(ranges: Sequence[DateRange]) -> List[DateRange]:
+    """Merge overlapping and adjacent date ranges"""
+    merged: List[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + _ONE_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(
+    covered: Sequence[DateRange], date_from: datetime.date, date_to: datetime.date
+) -> List[DateRange]:
+    """Return the sub-ranges of ``date_from`` to ``date_to`` which are not covered"""
+    missing: List[DateRange] = []
+    start = date_from
+    for covered_from, covered_to in merge_ranges(covered):
+        if start > date_to or covered_from > date_to:
+            break
+        if covered_to < start:
+            continue
+        if covered_from > start:
+            missing.append((start, covered_from - _ONE_DAY))
+        start = covered_to + _ONE_DAY
+    if start <= date_to:
+        missing.append((start, date_to))
+    return missing
+
+
+class EodCache:
+    """Stores historical end-of-day prices per (symbol, date) in a SQLite database
+
+    Prices of days before the current UTC date never change, so they are requested only
+    once. Besides the prices, the cache stores which date ranges have been requested for
+    every symbol. A later request is answered locally for the covered days, and only the
+    missing sub-ranges are requested from the API. Prices of the current day are always
+    requested and never stored.
+
+    Recent days may not be published yet when they are requested. Within the last
+    ``settle_days`` days before today, a day is only covered once a price of it or of a
+    later day has been received, so missing recent prices are requested again.
+
+    Prices requested with an ``exchange`` filter are stored separately from unfiltered ones.
+
+    Args:
+        path (Union[str, os.PathLike]): The SQLite database file, defaults to an in-memory
+            database.
+        today (Callable[[], datetime.date]): Returns the current date, defaults to UTC.
+        settle_days (int): Number of days before today whose absence of prices is not
+            cached.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+        today: Callable[[], datetime.date] = _utc_today,
+        settle_days: int = 2,
+    ):
+        self.today = today
+        self.settle_days = settle_days
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "EodCache":
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.close()
+
+    def covered_ranges(
+        self, symbol: str, exchange: Optional[str] = None
+    ) -> List[DateRange]:
+        """Return the stored date ranges of a symbol"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date_from, date_to FROM eod_ranges "
+                "WHERE scope = ? AND symbol = ? ORDER BY date_from",
+                (exchange or "", symbol),
+            ).fetchall()
+        return [(to_date(start), to_date(end)) for start, end in rows]
+
+    def plan(
+        self,
+        symbols: Symbols,
+        date_from: DateLike,
+        date_to: DateLike,
+        exchange: Optional[str] = None,
+    ) -> Dict[DateRange, List[str]]:
+        """Return the symbols which need to be requested by missing historical date range
+
+        Symbols missing the same ranges are grouped, so they can share requests.
+        """
+        last_closed = min(to_date(date_to), self.today() - _ONE_DAY)
+        groups: Dict[DateRange, List[str]] = {}
+        for symbol in split_symbols(symbols):
+            covered = self.covered_ranges(symbol, exchange)
+            for missing in missing_ranges(covered, to_date(date_from), last_closed):
+                groups.setdefault(missing, []).append(symbol)
+        return groups
+
+    def store(
+        self,
+        prices: Sequence[EodPrice],
+        symbols: Symbols,
+        date_from: DateLike,
+        date_to: DateLike,
+        exchange: Optional[str] = None,
+    ) -> None:
+        """Store the prices of a request and mark its date range as covered for the symbols
+
+        Days without prices, e.g. weekends and holidays, are covered as well, so they are
+        not requested again. Within the settle period, days are only covered up to the
+        newest received price of a symbol.
+        """
+        scope = exchange or ""
+        start, end = to_date(date_from), to_date(date_to)
+        settled = min(end, self.today() - datetime.timedelta(days=self.settle_days))
+        newest: Dict[str, datetime.date] = {}
+        for price in prices:
+            date = price.date.date()
+            if date > newest.get(price.symbol, datetime.date.min):
+                newest[price.symbol] = date
+        rows = [
+            (
+                scope,
+                price.symbol,
+                price.date.date().isoformat(),
+                json.dumps(price.to_dict()),
+            )
+            for price in prices
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO eod_prices VALUES (?, ?, ?, ?)", rows
+            )
+            for symbol in split_symbols(symbols):
+                covered_to = max(
+                    settled, min(end, newest.get(symbol, datetime.date.min))
+                )
+                if covered_to < start:
+                    continue
+                covered = self._connection.execute(
+                    "SELECT date_from, date_to FROM eod_ranges "
+                    "WHERE scope = ? AND symbol = ?",
+                    (scope, symbol),
+                ).fetchall()
+                ranges = merge_ranges(
+                    [(to_date(first), to_date(last)) for first, last in covered]
+                    + [(start, covered_to)]
+                )
+                self._connection.execute(
+                    "DELETE FROM eod_ranges WHERE scope = ? AND symbol = ?",
+                    (scope, symbol),
+                )
+                self._connection.executemany(
+                    "INSERT INTO eod_ranges VALUES (?, ?, ?, ?)",
+                    [
+                        (scope, symbol, first.isoformat(), last.isoformat())
+                        for first, last in ranges
+                    ],
+                )
+
+    def load(
+        self,
+        symbols: Symbols,
+        date_from: DateLike,
+        date_to: DateLike,
+        exchange: Optional[str] = None,
+    ) -> List[EodPrice]:
+        """Return the stored prices of the symbols, newest first"""
+        symbol_list = split_symbols(symbols)
+        placeholders = ", ".join("?" * len(symbol_list))
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM eod_prices "
+                f"WHERE scope = ? AND symbol IN ({placeholders}) AND date BETWEEN ? AND ? "
+                "ORDER BY date DESC, symbol",
+                (
+                    exchange or "",
+                    *symbol_list,
+                    to_date(date_from).isoformat(),
+                    to_date(date_to).isoformat(),
+                ),
+            ).fetchall()
+        return [EodPrice.from_dict(json.loads(payload)) for payload, in rows]
+
+    def _live_range(
+        self, date_from: datetime.date, date_to: datetime.date
+    ) -> Optional[DateRange]:
+        today = self.today()
+        if date_to < today:
+            return None
+        return max(date_from, today), date_to
+
+    def eod(
+        self,
+        *,
+        client: Client,
+        access_key: str,
+        symbols: Symbols,
+        date_from: DateLike,
+        date_to: DateLike,
+        exchange: Union[Unset, None, str] = UNSET,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> List[EodPrice]:
+        """Return the end-of-day prices of ``eod.eod``, requesting only uncached days
+
+        Args:
+            client (Client): The client used for missing prices.
+            access_key (str):
+            symbols (Union[List[str], str]):
+            date_from (Union[str, datetime.date]): First day of the range.
+            date_to (Union[str, datetime.date]): Last day of the range.
+            exchange (Union[Unset, None, str]):
+            max_concurrency (int): Maximum number of concurrent page requests.
+
+        Raises:
+            ApiError: If the API returns an error response.
+
+        Returns:
+            List[EodPrice]: Newest first.
+        """
+        date_from, date_to = to_date(date_from), to_date(date_to)
+        scope = exchange or None
+
+        def fetch(requested: DateRange, group: Symbols) -> List[EodPrice]:
+            return eod.sync_all(
+                client=client,
+                access_key=access_key,
+                symbols=group,
+                exchange=exchange,
+                date_from=requested[0].isoformat(),
+                date_to=requested[1].isoformat(),
+                max_concurrency=max_concurrency,
+            )
+
+        for requested, group in self.plan(symbols, date_from, date_to, scope).items():
+            self.store(fetch(requested, group), group, *requested, exchange=scope)
+
+        prices = self.load(symbols, date_from, date_to, scope)
+        live_range = self._live_range(date_from, date_to)
+        if live_range is not None:
+            prices = _newest_first(fetch(live_range, symbols) + prices)
+        return prices
+
+    async def asyncio_eod(
+        self,
+        *,
+        client: Client,
+        access_key: str,
+        symbols: Symbols,
+        date_from: DateLike,
+        date_to: DateLike,
+        exchange: Union[Unset, None, str] = UNSET,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> List[EodPrice]:
+        """Return the end-of-day prices of ``eod.eod``, requesting only uncached days
+
+        Args:
+            client (Client): The client used for missing prices.
+            access_key (str):
+            symbols (Union[List[str], str]):
+            date_from (Union[str, datetime.date]): First day of the range.
+            date_to (Union[str, datetime.date]): Last day of the range.
+            exchange (Union[Unset, None, str]):
+            max_concurrency (int): Maximum number of concurrent page requests.
+
+        Raises:
+            ApiError: If the API returns an error response.
+
+        Returns:
+            List[EodPrice]: Newest first.
+        """
+        date_from, date_to = to_date(date_from), to_date(date_to)
+        scope = exchange or None
+
+        async def fetch(requested: DateRange, group: Symbols) -> List[EodPrice]:
+            return await eod.asyncio_all(
+                client=client,
+                access_key=access_key,
+                symbols=group,
+                exchange=exchange,
+                date_from=requested[0].isoformat(),
+                date_to=requested[1].isoformat(),
+                max_concurrency=max_concurrency,
+            )
+
+        for requested, group in self.plan(symbols, date_from, date_to, scope).items():
+            self.store(await fetch(requested, group), group, *requested, exchange=scope)
+
+        prices = self.load(symbols, date_from, date_to, scope)
+        live_range = self._live_range(date_from, date_to)
+        if live_range is not None:
+            prices = _newest_first(await fetch(live_range, symbols) + prices)
+        return prices
+
+    def eod_date(
+        self,
+        date: DateLike,
+        *,
+        client: Client,
+        access_key: str,
+        symbols: Symbols,
+        exchange: Union[Unset, None, str] = UNSET,
+    ) -> List[EodPrice]:
+        """Return the end-of-day prices of ``eod.eod_date`` for one day"""
+        return self.eod(
+            client=client,
+            access_key=access_key,
+            symbols=symbols,
+            date_from=date,
+            date_to=date,
+            exchange=exchange,
+        )
+
+    def ticker_symbol_eod_date(
+        self, symbol: str, date: DateLike, *, client: Client, access_key: str
+    ) -> Optional[EodPrice]:
+        """Return the end-of-day price of ``tickers.ticker_symbol_eod_date``, if any"""
+        prices = self.eod_date(
+            date, client=client, access_key=access_key, symbols=[symbol]
+        )
+        return prices[0] if prices else None
+
+    def exchange_mic_eod_date(
+        self,
+        mic: str,
+        date: DateLike,
+        *,
+        client: Client,
+        access_key: str,
+        symbols: Symbols,
+    ) -> List[EodPrice]:
+        """Return the end-of-day prices of ``exchanges.exchange_mic_eod_date``"""
+        return self.eod_date(
+            date, client=client, access_key=access_key, symbols=symbols, exchange=mic
+        )
+
+
+def _newest_first(prices: List[EodPrice]) -> List[EodPrice]:
+    return sorted(prices, key=lambda price: price.date, reverse=True)
+
+
+__all__ = ["EodCache", "merge_ranges", "missing_ranges", "to_date"]
@@ -0,0 +1,28 @@
+""" Contains the exceptions raised by helpers which cannot return an error model """
+from typing import Any, Optional
+
+from .models.error_response import ErrorResponse
+
+
+class ApiError(Exception):
+    """Raised when an endpoint returns an unexpected status code
+
+    Attributes:
+        status_code (int): The HTTP status code of the response.
+        content (bytes): The raw response body.
+        parsed (Optional[Any]): The parsed error model, e.g. an ErrorResponse.
+    """
+
+    def __init__(self, status_code: int, content: bytes, parsed: Optional[Any]):
+        self.status_code = status_code
+        self.content = content
+        self.parsed = parsed
+
+        if isinstance(parsed, ErrorResponse):
+            message = f"{parsed.error.code.value}: {parsed.error.message}"
+        else:
+            message = content.decode(errors="ignore")
+        super().__init__(f"Unexpected status code {status_code}: {message}")
+
+
+__all__ = ["ApiError"]
@@ -0,0 +1,175 @@
+""" Column-wise conversion of model lists into pandas DataFrames and Arrow tables """
+import datetime
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_type_hints,
+)
+
+import attr
+
+from .types import UNSET, Unset
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "DataFrame conversion requires numpy, install it with: pip install marketstack[pandas]"
+    ) from e
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+    import pyarrow
+
+FLOAT = "float"
+DATETIME = "datetime"
+OBJECT = "object"
+
+Columns = Dict[str, Tuple[str, np.ndarray]]
+
+
+def _column_name(name: str) -> str:
+    # the generator appends "_" to field names which are reserved in Python
+    return name[:-1] if name.endswith("_") else name
+
+
+def _field_kind(type_hint: Any) -> Tuple[str, Any]:
+    args = [a for a in get_args(type_hint) if a not in (Unset, type(None))]
+    base = args[0] if len(args) == 1 else type_hint
+    if attr.has(base):
+        return "model", base
+    if base in (float, int):
+        return FLOAT, None
+    if base is datetime.datetime:
+        return DATETIME, None
+    return OBJECT, None
+
+
+def _missing(values: np.ndarray) -> np.ndarray:
+    return np.equal(values, UNSET) | np.equal(values, None)
+
+
+def _to_array(values: List[Any], kind: str) -> np.ndarray:
+    if kind == FLOAT:
+        try:
+            return np.fromiter(values, dtype=np.float64, count=len(values))
+        except TypeError:
+            # optional fields contain UNSET or None
+            pass
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    if kind == FLOAT:
+        array[_missing(array)] = np.nan
+        return array.astype(np.float64)
+    array[_missing(array)] = None
+    return array
+
+
+def columns(items: Sequence[Any], item_type: Type[Any], prefix: str = "") -> Columns:
+    """Extract one array per field of an attrs model list
+
+    Nested models are flattened into ``parent.child`` columns. Missing (``UNSET`` or
+    ``None``) values become NaN in float columns and None otherwise.
+
+    Args:
+        items: Model instances, may contain UNSET or None for nested models.
+        item_type: The attrs model class of the items.
+        prefix: Prefix of the column names.
+
+    Returns:
+        The kind ("float", "datetime" or "object") and array of every column.
+    """
+    hints = get_type_hints(item_type)
+    result: Columns = {}
+    for field in attr.fields(item_type):
+        if field.name.startswith("_"):
+            continue
+        name = prefix + _column_name(field.name)
+        kind, model = _field_kind(hints[field.name])
+        if prefix:
+            values = [getattr(item, field.name, UNSET) for item in items]
+        else:
+            values = list(map(attrgetter(field.name), items))
+        if kind == "model":
+            result.update(columns(values, model, name + "."))
+        else:
+            result[name] = (kind, _to_array(values, kind))
+    return result
+
+
+def concat_columns(
+    item_lists: Iterable[Sequence[Any]], item_type: Type[Any]
+) -> Columns:
+    """Extract the columns of multiple item lists, e.g. pages, and concatenate them once"""
+    chunks = [columns(items, item_type) for items in item_lists]
+    if not chunks:
+        return columns([], item_type)
+    if len(chunks) == 1:
+        return chunks[0]
+    return {
+        name: (kind, np.concatenate([chunk[name][1] for chunk in chunks]))
+        for name, (kind, _) in chunks[0].items()
+    }
+
+
+def to_datetime64(dates: Iterable[datetime.datetime]) -> np.ndarray:
+    """Convert datetimes, e.g. a ``DATETIME`` column, into UTC ``datetime64[s]``
+
+    Naive datetimes are taken as UTC.
+    """
+    utc = datetime.timezone.utc
+    return np.array(
+        [
+            date if date.tzinfo is None else date.astimezone(utc).replace(tzinfo=None)
+            for date in dates
+        ],
+        dtype="datetime64[s]",
+    )
+
+
+def to_pandas(
+    item_lists: Iterable[Sequence[Any]], item_type: Type[Any]
+) -> "pandas.DataFrame":
+    """Convert item lists into one pandas DataFrame
+
+    Dates become timezone aware ``datetime64`` in UTC and missing floats NaN.
+    """
+    import pandas as pd
+
+    data: Dict[str, Union[np.ndarray, "pandas.DatetimeIndex"]] = {}
+    for name, (kind, array) in concat_columns(item_lists, item_type).items():
+        if kind == DATETIME:
+            data[name] = pd.to_datetime(array, utc=True)
+        else:
+            data[name] = array
+    return pd.DataFrame(data, copy=False).infer_objects()
+
+
+def to_arrow(
+    item_lists: Iterable[Sequence[Any]], item_type: Type[Any]
+) -> "pyarrow.Table":
+    """Convert item lists into one Arrow table
+
+    Dates become ``timestamp[us, tz=UTC]`` and missing values null.
+    """
+    import pyarrow as pa
+
+    arrays = {}
+    for name, (kind, array) in concat_columns(item_lists, item_type).items():
+        if kind == DATETIME:
+            arrays[name] = pa.array(array, type=pa.timestamp("us", tz="UTC"))
+        else:
+            arrays[name] = pa.array(array, from_pandas=True)
+    return pa.table(arrays)
+
+
+__all__ = ["columns", "concat_columns", "to_arrow", "to_datetime64", "to_pandas"]
@@ -1,11 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="Currency")
 
+_FIELD_NAMES = frozenset({"code", "name", "symbol", "symbol_native"})
+
 
 @attr.s(auto_attribs=True)
 class Currency:
@@ -21,7 +23,9 @@ class Currency:
     name: str
     symbol: Union[Unset, str] = UNSET
     symbol_native: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         code = self.code
@@ -30,7 +34,8 @@ class Currency:
         symbol_native = self.symbol_native
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "code": code,
@@ -46,14 +51,14 @@ class Currency:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        code = d.pop("code")
+        d = src_dict
+        code = d["code"]
 
-        name = d.pop("name")
+        name = d["name"]
 
-        symbol = d.pop("symbol", UNSET)
+        symbol = d.get("symbol", UNSET)
 
-        symbol_native = d.pop("symbol_native", UNSET)
+        symbol_native = d.get("symbol_native", UNSET)
 
         currency = cls(
             code=code,
@@ -62,12 +67,25 @@ class Currency:
             symbol_native=symbol_native,
         )
 
-        currency.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            currency.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return currency
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -79,4 +97,4 @@ class Currency:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
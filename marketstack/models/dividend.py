@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from ..types import additional_properties_eq_key
+
 T = TypeVar("T", bound="Dividend")
 
+_FIELD_NAMES = frozenset({"date", "symbol", "dividend"})
+
 
 @attr.s(auto_attribs=True)
 class Dividend:
@@ -17,7 +21,9 @@ class Dividend:
     date: str
     symbol: str
     dividend: float
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         date = self.date
@@ -25,7 +31,8 @@ class Dividend:
         dividend = self.dividend
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "date": date,
@@ -38,12 +45,12 @@ class Dividend:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        date = d.pop("date")
+        d = src_dict
+        date = d["date"]
 
-        symbol = d.pop("symbol")
+        symbol = d["symbol"]
 
-        dividend = d.pop("dividend")
+        dividend = d["dividend"]
 
         dividend = cls(
             date=date,
@@ -51,12 +58,25 @@ class Dividend:
             dividend=dividend,
         )
 
-        dividend.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            dividend.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return dividend
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -68,4 +88,4 @@ class Dividend:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,13 +1,34 @@
 import datetime
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..dates import parse_datetime
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="EodPrice")
 
+_FIELD_NAMES = frozenset(
+    {
+        "date",
+        "symbol",
+        "open",
+        "low",
+        "high",
+        "exchange",
+        "split_factor",
+        "dividend",
+        "adj_open",
+        "adj_close",
+        "adj_high",
+        "adj_low",
+        "adj_volume",
+        "volume",
+        "close",
+        "last",
+    }
+)
+
 
 @attr.s(auto_attribs=True)
 class EodPrice:
@@ -47,7 +68,9 @@ class EodPrice:
     volume: Union[Unset, float] = UNSET
     close: Union[Unset, float] = UNSET
     last: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         date = self.date.isoformat()
@@ -69,7 +92,8 @@ class EodPrice:
         last = self.last
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "date": date,
@@ -98,38 +122,38 @@ class EodPrice:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        date = isoparse(d.pop("date"))
+        d = src_dict
+        date = parse_datetime(d["date"])
 
-        symbol = d.pop("symbol")
+        symbol = d["symbol"]
 
-        open_ = d.pop("open")
+        open_ = d["open"]
 
-        low = d.pop("low")
+        low = d["low"]
 
-        high = d.pop("high")
+        high = d["high"]
 
-        exchange = d.pop("exchange")
+        exchange = d["exchange"]
 
-        split_factor = d.pop("split_factor")
+        split_factor = d["split_factor"]
 
-        dividend = d.pop("dividend")
+        dividend = d["dividend"]
 
-        adj_open = d.pop("adj_open")
+        adj_open = d["adj_open"]
 
-        adj_close = d.pop("adj_close")
+        adj_close = d["adj_close"]
 
-        adj_high = d.pop("adj_high")
+        adj_high = d["adj_high"]
 
-        adj_low = d.pop("adj_low")
+        adj_low = d["adj_low"]
 
-        adj_volume = d.pop("adj_volume")
+        adj_volume = d["adj_volume"]
 
-        volume = d.pop("volume", UNSET)
+        volume = d.get("volume", UNSET)
 
-        close = d.pop("close", UNSET)
+        close = d.get("close", UNSET)
 
-        last = d.pop("last", UNSET)
+        last = d.get("last", UNSET)
 
         eod_price = cls(
             date=date,
@@ -150,12 +174,25 @@ class EodPrice:
             last=last,
         )
 
-        eod_price.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            eod_price.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return eod_price
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -167,4 +204,4 @@ class EodPrice:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,13 +1,15 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
 from ..models.error_code import ErrorCode
 from ..models.error_context import ErrorContext
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="Error")
 
+_FIELD_NAMES = frozenset({"code", "message", "context"})
+
 
 @attr.s(auto_attribs=True)
 class Error:
@@ -21,7 +23,9 @@ class Error:
     code: ErrorCode
     message: str
     context: Union[Unset, ErrorContext] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         code = self.code.value
@@ -32,7 +36,8 @@ class Error:
             context = self.context.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "code": code,
@@ -46,12 +51,12 @@ class Error:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        code = ErrorCode(d.pop("code"))
+        d = src_dict
+        code = ErrorCode(d["code"])
 
-        message = d.pop("message")
+        message = d["message"]
 
-        _context = d.pop("context", UNSET)
+        _context = d.get("context", UNSET)
         context: Union[Unset, ErrorContext]
         if isinstance(_context, Unset):
             context = UNSET
@@ -64,12 +69,25 @@ class Error:
             context=context,
         )
 
-        error.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            error.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return error
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -81,4 +99,4 @@ class Error:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
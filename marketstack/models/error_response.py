@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
 from ..models.error import Error
+from ..types import additional_properties_eq_key
 
 T = TypeVar("T", bound="ErrorResponse")
 
+_FIELD_NAMES = frozenset({"error"})
+
 
 @attr.s(auto_attribs=True)
 class ErrorResponse:
@@ -15,13 +18,16 @@ class ErrorResponse:
     """
 
     error: Error
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         error = self.error.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "error": error,
@@ -32,19 +38,32 @@ class ErrorResponse:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        error = Error.from_dict(d.pop("error"))
+        d = src_dict
+        error = Error.from_dict(d["error"])
 
         error_response = cls(
             error=error,
         )
 
-        error_response.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            error_response.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return error_response
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -56,4 +75,4 @@ class ErrorResponse:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,13 +1,27 @@
-from typing import Any, Dict, List, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 import attr
 
 from ..models.currency import Currency
 from ..models.timezone import Timezone
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="Exchange")
 
+_FIELD_NAMES = frozenset(
+    {
+        "name",
+        "acronym",
+        "mic",
+        "country",
+        "country_code",
+        "city",
+        "website",
+        "currency",
+        "timezone",
+    }
+)
+
 
 @attr.s(auto_attribs=True)
 class Exchange:
@@ -33,7 +47,9 @@ class Exchange:
     website: str
     currency: Union[Currency, None, Unset] = UNSET
     timezone: Union[None, Timezone, Unset] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -68,7 +84,8 @@ class Exchange:
             timezone = self.timezone
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -89,20 +106,20 @@ class Exchange:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        acronym = d.pop("acronym")
+        acronym = d["acronym"]
 
-        mic = d.pop("mic")
+        mic = d["mic"]
 
-        country = d.pop("country")
+        country = d["country"]
 
-        country_code = d.pop("country_code")
+        country_code = d["country_code"]
 
-        city = d.pop("city")
+        city = d["city"]
 
-        website = d.pop("website")
+        website = d["website"]
 
         def _parse_currency(data: object) -> Union[Currency, None, Unset]:
             if data is None:
@@ -124,7 +141,7 @@ class Exchange:
                 pass
             return cast(Union[Currency, None, Unset], data)
 
-        currency = _parse_currency(d.pop("currency", UNSET))
+        currency = _parse_currency(d.get("currency", UNSET))
 
         def _parse_timezone(data: object) -> Union[None, Timezone, Unset]:
             if data is None:
@@ -146,7 +163,7 @@ class Exchange:
                 pass
             return cast(Union[None, Timezone, Unset], data)
 
-        timezone = _parse_timezone(d.pop("timezone", UNSET))
+        timezone = _parse_timezone(d.get("timezone", UNSET))
 
         exchange = cls(
             name=name,
@@ -160,12 +177,25 @@ class Exchange:
             timezone=timezone,
         )
 
-        exchange.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            exchange.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return exchange
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -177,4 +207,4 @@ class Exchange:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="ExchangeBase")
 
+_FIELD_NAMES = frozenset(
+    {"name", "acronym", "mic", "country", "city", "website", "country_code"}
+)
+
 
 @attr.s(auto_attribs=True)
 class ExchangeBase:
@@ -27,7 +31,9 @@ class ExchangeBase:
     city: str
     website: str
     country_code: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -39,7 +45,8 @@ class ExchangeBase:
         country_code = self.country_code
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -57,20 +64,20 @@ class ExchangeBase:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        acronym = d.pop("acronym")
+        acronym = d["acronym"]
 
-        mic = d.pop("mic")
+        mic = d["mic"]
 
-        country = d.pop("country")
+        country = d["country"]
 
-        city = d.pop("city")
+        city = d["city"]
 
-        website = d.pop("website")
+        website = d["website"]
 
-        country_code = d.pop("country_code", UNSET)
+        country_code = d.get("country_code", UNSET)
 
         exchange_base = cls(
             name=name,
@@ -82,12 +89,25 @@ class ExchangeBase:
             country_code=country_code,
         )
 
-        exchange_base.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            exchange_base.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return exchange_base
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -99,4 +119,4 @@ class ExchangeBase:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
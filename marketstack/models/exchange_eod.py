@@ -1,12 +1,16 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
 from ..models.eod_price import EodPrice
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="ExchangeEod")
 
+_FIELD_NAMES = frozenset(
+    {"name", "acronym", "mic", "country", "city", "website", "eod", "country_code"}
+)
+
 
 @attr.s(auto_attribs=True)
 class ExchangeEod:
@@ -30,7 +34,9 @@ class ExchangeEod:
     website: str
     eod: List[EodPrice]
     country_code: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -48,7 +54,8 @@ class ExchangeEod:
         country_code = self.country_code
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -67,27 +74,27 @@ class ExchangeEod:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        acronym = d.pop("acronym")
+        acronym = d["acronym"]
 
-        mic = d.pop("mic")
+        mic = d["mic"]
 
-        country = d.pop("country")
+        country = d["country"]
 
-        city = d.pop("city")
+        city = d["city"]
 
-        website = d.pop("website")
+        website = d["website"]
 
         eod = []
-        _eod = d.pop("eod")
+        _eod = d["eod"]
         for eod_item_data in _eod:
             eod_item = EodPrice.from_dict(eod_item_data)
 
             eod.append(eod_item)
 
-        country_code = d.pop("country_code", UNSET)
+        country_code = d.get("country_code", UNSET)
 
         exchange_eod = cls(
             name=name,
@@ -100,12 +107,25 @@ class ExchangeEod:
             country_code=country_code,
         )
 
-        exchange_eod.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            exchange_eod.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return exchange_eod
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -117,4 +137,4 @@ class ExchangeEod:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
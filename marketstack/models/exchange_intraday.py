@@ -1,12 +1,16 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
 from ..models.interval_price import IntervalPrice
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="ExchangeIntraday")
 
+_FIELD_NAMES = frozenset(
+    {"name", "acronym", "mic", "country", "city", "website", "intraday", "country_code"}
+)
+
 
 @attr.s(auto_attribs=True)
 class ExchangeIntraday:
@@ -30,7 +34,9 @@ class ExchangeIntraday:
     website: str
     intraday: List[IntervalPrice]
     country_code: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -48,7 +54,8 @@ class ExchangeIntraday:
         country_code = self.country_code
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -67,27 +74,27 @@ class ExchangeIntraday:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        acronym = d.pop("acronym")
+        acronym = d["acronym"]
 
-        mic = d.pop("mic")
+        mic = d["mic"]
 
-        country = d.pop("country")
+        country = d["country"]
 
-        city = d.pop("city")
+        city = d["city"]
 
-        website = d.pop("website")
+        website = d["website"]
 
         intraday = []
-        _intraday = d.pop("intraday")
+        _intraday = d["intraday"]
         for intraday_item_data in _intraday:
             intraday_item = IntervalPrice.from_dict(intraday_item_data)
 
             intraday.append(intraday_item)
 
-        country_code = d.pop("country_code", UNSET)
+        country_code = d.get("country_code", UNSET)
 
         exchange_intraday = cls(
             name=name,
@@ -100,12 +107,25 @@ class ExchangeIntraday:
             country_code=country_code,
         )
 
-        exchange_intraday.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            exchange_intraday.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return exchange_intraday
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -117,4 +137,4 @@ class ExchangeIntraday:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
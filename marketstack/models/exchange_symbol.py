@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from ..types import additional_properties_eq_key
+
 T = TypeVar("T", bound="ExchangeSymbol")
 
+_FIELD_NAMES = frozenset({"name", "symbol", "has_intraday", "has_eod"})
+
 
 @attr.s(auto_attribs=True)
 class ExchangeSymbol:
@@ -19,7 +23,9 @@ class ExchangeSymbol:
     symbol: str
     has_intraday: bool
     has_eod: bool
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -28,7 +34,8 @@ class ExchangeSymbol:
         has_eod = self.has_eod
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -42,14 +49,14 @@ class ExchangeSymbol:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        symbol = d.pop("symbol")
+        symbol = d["symbol"]
 
-        has_intraday = d.pop("has_intraday")
+        has_intraday = d["has_intraday"]
 
-        has_eod = d.pop("has_eod")
+        has_eod = d["has_eod"]
 
         exchange_symbol = cls(
             name=name,
@@ -58,12 +65,25 @@ class ExchangeSymbol:
             has_eod=has_eod,
         )
 
-        exchange_symbol.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            exchange_symbol.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return exchange_symbol
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -75,4 +95,4 @@ class ExchangeSymbol:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,12 +1,14 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
 from ..models.validation_error import ValidationError
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="HTTPValidationError")
 
+_FIELD_NAMES = frozenset({"detail"})
+
 
 @attr.s(auto_attribs=True)
 class HTTPValidationError:
@@ -16,7 +18,9 @@ class HTTPValidationError:
     """
 
     detail: Union[Unset, List[ValidationError]] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         detail: Union[Unset, List[Dict[str, Any]]] = UNSET
@@ -28,7 +32,8 @@ class HTTPValidationError:
                 detail.append(detail_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if detail is not UNSET:
             field_dict["detail"] = detail
@@ -37,9 +42,9 @@ class HTTPValidationError:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         detail = []
-        _detail = d.pop("detail", UNSET)
+        _detail = d.get("detail", UNSET)
         for detail_item_data in _detail or []:
             detail_item = ValidationError.from_dict(detail_item_data)
 
@@ -49,12 +54,25 @@ class HTTPValidationError:
             detail=detail,
         )
 
-        http_validation_error.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            http_validation_error.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return http_validation_error
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -66,4 +84,4 @@ class HTTPValidationError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,13 +1,17 @@
 import datetime
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..dates import parse_datetime
+from ..types import UNSET, Unset, additional_properties_eq_key
 
 T = TypeVar("T", bound="IntervalPrice")
 
+_FIELD_NAMES = frozenset(
+    {"date", "symbol", "open", "low", "high", "exchange", "volume", "close", "last"}
+)
+
 
 @attr.s(auto_attribs=True)
 class IntervalPrice:
@@ -33,7 +37,9 @@ class IntervalPrice:
     volume: Union[Unset, float] = UNSET
     close: Union[Unset, float] = UNSET
     last: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         date = self.date.isoformat()
@@ -48,7 +54,8 @@ class IntervalPrice:
         last = self.last
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "date": date,
@@ -70,24 +77,24 @@ class IntervalPrice:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        date = isoparse(d.pop("date"))
+        d = src_dict
+        date = parse_datetime(d["date"])
 
-        symbol = d.pop("symbol")
+        symbol = d["symbol"]
 
-        open_ = d.pop("open")
+        open_ = d["open"]
 
-        low = d.pop("low")
+        low = d["low"]
 
-        high = d.pop("high")
+        high = d["high"]
 
-        exchange = d.pop("exchange")
+        exchange = d["exchange"]
 
-        volume = d.pop("volume", UNSET)
+        volume = d.get("volume", UNSET)
 
-        close = d.pop("close", UNSET)
+        close = d.get("close", UNSET)
 
-        last = d.pop("last", UNSET)
+        last = d.get("last", UNSET)
 
         interval_price = cls(
             date=date,
@@ -101,12 +108,25 @@ class IntervalPrice:
             last=last,
         )
 
-        interval_price.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            interval_price.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return interval_price
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -118,4 +138,4 @@ class IntervalPrice:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,12 +1,20 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from ..models.exchange_symbol import ExchangeSymbol
 from ..models.exchange_tickers import ExchangeTickers
 from ..models.pagination import Pagination
+from ..types import additional_properties_eq_key
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+    import pyarrow
 
 T = TypeVar("T", bound="PagedResponseExchangeTickers")
 
+_FIELD_NAMES = frozenset({"pagination", "data"})
+
 
 @attr.s(auto_attribs=True)
 class PagedResponseExchangeTickers:
@@ -18,7 +26,9 @@ class PagedResponseExchangeTickers:
 
     pagination: Pagination
     data: ExchangeTickers
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         pagination = self.pagination.to_dict()
@@ -26,7 +36,8 @@ class PagedResponseExchangeTickers:
         data = self.data.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "pagination": pagination,
@@ -38,22 +49,47 @@ class PagedResponseExchangeTickers:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        pagination = Pagination.from_dict(d.pop("pagination"))
+        d = src_dict
+        pagination = Pagination.from_dict(d["pagination"])
 
-        data = ExchangeTickers.from_dict(d.pop("data"))
+        data = ExchangeTickers.from_dict(d["data"])
 
         paged_response_exchange_tickers = cls(
             pagination=pagination,
             data=data,
         )
 
-        paged_response_exchange_tickers.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            paged_response_exchange_tickers.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return paged_response_exchange_tickers
 
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Convert the ExchangeSymbol items column-wise into a pandas DataFrame"""
+        from ..frames import to_pandas
+
+        return to_pandas([self.data.tickers], ExchangeSymbol)
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Convert the ExchangeSymbol items column-wise into an Arrow table"""
+        from ..frames import to_arrow
+
+        return to_arrow([self.data.tickers], ExchangeSymbol)
+
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -65,4 +101,4 @@ class PagedResponseExchangeTickers:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
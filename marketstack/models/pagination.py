@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from ..types import additional_properties_eq_key
+
 T = TypeVar("T", bound="Pagination")
 
+_FIELD_NAMES = frozenset({"limit", "offset", "count", "total"})
+
 
 @attr.s(auto_attribs=True)
 class Pagination:
@@ -19,7 +23,9 @@ class Pagination:
     offset: int
     count: int
     total: int
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         limit = self.limit
@@ -28,7 +34,8 @@ class Pagination:
         total = self.total
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "limit": limit,
@@ -42,14 +49,14 @@ class Pagination:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        limit = d.pop("limit")
+        d = src_dict
+        limit = d["limit"]
 
-        offset = d.pop("offset")
+        offset = d["offset"]
 
-        count = d.pop("count")
+        count = d["count"]
 
-        total = d.pop("total")
+        total = d["total"]
 
         pagination = cls(
             limit=limit,
@@ -58,12 +65,25 @@ class Pagination:
             total=total,
         )
 
-        pagination.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            pagination.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return pagination
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -75,4 +95,4 @@ class Pagination:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,16 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
 from ..models.eod_price import EodPrice
+from ..types import additional_properties_eq_key
 
 T = TypeVar("T", bound="TickerEod")
 
+_FIELD_NAMES = frozenset(
+    {"name", "symbol", "has_intraday", "has_eod", "country", "eod"}
+)
+
 
 @attr.s(auto_attribs=True)
 class TickerEod:
@@ -25,7 +30,9 @@ class TickerEod:
     has_eod: bool
     country: str
     eod: List[EodPrice]
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -40,7 +47,8 @@ class TickerEod:
             eod.append(eod_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -56,19 +64,19 @@ class TickerEod:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        symbol = d.pop("symbol")
+        symbol = d["symbol"]
 
-        has_intraday = d.pop("has_intraday")
+        has_intraday = d["has_intraday"]
 
-        has_eod = d.pop("has_eod")
+        has_eod = d["has_eod"]
 
-        country = d.pop("country")
+        country = d["country"]
 
         eod = []
-        _eod = d.pop("eod")
+        _eod = d["eod"]
         for eod_item_data in _eod:
             eod_item = EodPrice.from_dict(eod_item_data)
 
@@ -83,12 +91,25 @@ class TickerEod:
             eod=eod,
         )
 
-        ticker_eod.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            ticker_eod.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return ticker_eod
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -100,4 +121,4 @@ class TickerEod:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from ..types import additional_properties_eq_key
+
 T = TypeVar("T", bound="Timezone")
 
+_FIELD_NAMES = frozenset({"timezone", "abbr", "abbr_dst"})
+
 
 @attr.s(auto_attribs=True)
 class Timezone:
@@ -17,7 +21,9 @@ class Timezone:
     timezone: str
     abbr: str
     abbr_dst: str
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         timezone = self.timezone
@@ -25,7 +31,8 @@ class Timezone:
         abbr_dst = self.abbr_dst
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "timezone": timezone,
@@ -38,12 +45,12 @@ class Timezone:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        timezone = d.pop("timezone")
+        d = src_dict
+        timezone = d["timezone"]
 
-        abbr = d.pop("abbr")
+        abbr = d["abbr"]
 
-        abbr_dst = d.pop("abbr_dst")
+        abbr_dst = d["abbr_dst"]
 
         timezone = cls(
             timezone=timezone,
@@ -51,12 +58,25 @@ class Timezone:
             abbr_dst=abbr_dst,
         )
 
-        timezone.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            timezone.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return timezone
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -68,4 +88,4 @@ class Timezone:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
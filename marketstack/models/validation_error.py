@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 import attr
 
+from ..types import additional_properties_eq_key
+
 T = TypeVar("T", bound="ValidationError")
 
+_FIELD_NAMES = frozenset({"loc", "msg", "type"})
+
 
 @attr.s(auto_attribs=True)
 class ValidationError:
@@ -17,7 +21,9 @@ class ValidationError:
     loc: List[Union[int, str]]
     msg: str
     type: str
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(
+        init=False, default=None, eq=additional_properties_eq_key
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         loc = []
@@ -32,7 +38,8 @@ class ValidationError:
         type = self.type
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "loc": loc,
@@ -45,9 +52,9 @@ class ValidationError:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
+        d = src_dict
         loc = []
-        _loc = d.pop("loc")
+        _loc = d["loc"]
         for loc_item_data in _loc:
 
             def _parse_loc_item(data: object) -> Union[int, str]:
@@ -57,9 +64,9 @@ class ValidationError:
 
             loc.append(loc_item)
 
-        msg = d.pop("msg")
+        msg = d["msg"]
 
-        type = d.pop("type")
+        type = d["type"]
 
         validation_error = cls(
             loc=loc,
@@ -67,12 +74,25 @@ class ValidationError:
             type=type,
         )
 
-        validation_error.additional_properties = d
+        if not _FIELD_NAMES.issuperset(d):
+            validation_error.additional_properties = {
+                k: v for k, v in d.items() if k not in _FIELD_NAMES
+            }
         return validation_error
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -84,4 +104,4 @@ class ValidationError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -0,0 +1,221 @@
+""" Helpers to walk paged endpoints """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from .errors import ApiError
+from .types import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+    import pyarrow
+
+T = TypeVar("T")
+
+MAX_LIMIT = 1000
+"""The maximum page size accepted by the API"""
+
+MAX_CONCURRENCY = 8
+"""The default number of pages requested concurrently"""
+
+
+def parse_page(response: Response[Any]) -> Any:
+    """Return the parsed page of a successful response or raise an ApiError"""
+    if response.status_code != 200 or response.parsed is None:
+        raise ApiError(response.status_code, response.content, response.parsed)
+    return response.parsed
+
+
+def iter_pages(
+    sync_detailed: Callable[..., Response[Any]],
+    *,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Lazily fetch all pages of a paged endpoint
+
+    The next page is only requested when the previous one has been consumed. Iteration
+    stops when ``pagination.total`` is reached or the API returns an empty page.
+
+    Args:
+        sync_detailed: The ``sync_detailed`` function of a paged endpoint.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first page.
+        **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+    """
+    while True:
+        page = parse_page(sync_detailed(limit=limit, offset=offset, **kwargs))
+        yield page
+
+        pagination = page.pagination
+        offset = pagination.offset + pagination.count
+        if pagination.count == 0 or offset >= pagination.total:
+            return
+
+
+class ItemIterator(Generic[T]):
+    """Lazily iterates over the items of all pages
+
+    Returned by the ``iter_all`` functions of paged endpoints. Besides item by item
+    iteration, the remaining items can be converted column-wise into a pandas DataFrame or
+    Arrow table, see ``marketstack.frames``.
+
+    Args:
+        pages: The lazily fetched pages, e.g. of ``iter_pages``.
+        get_items: Returns the items of a page.
+        item_type: The model class of the items.
+    """
+
+    def __init__(
+        self,
+        pages: Iterable[Any],
+        get_items: Callable[[Any], Sequence[T]],
+        item_type: Type[T],
+    ) -> None:
+        self._pages = iter(pages)
+        self._get_items = get_items
+        self._item_type = item_type
+        self._items: Sequence[T] = []
+        self._index = 0
+
+    def __iter__(self) -> "ItemIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        while self._index >= len(self._items):
+            self._items = self._get_items(next(self._pages))
+            self._index = 0
+        item = self._items[self._index]
+        self._index += 1
+        return item
+
+    def _remaining_item_lists(self) -> Iterator[Sequence[T]]:
+        items, self._items = self._items[self._index :], []
+        self._index = 0
+        return chain([items], map(self._get_items, self._pages))
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Fetch the remaining pages and convert their items into one DataFrame"""
+        from .frames import to_pandas
+
+        return to_pandas(self._remaining_item_lists(), self._item_type)
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Fetch the remaining pages and convert their items into one Arrow table"""
+        from .frames import to_arrow
+
+        return to_arrow(self._remaining_item_lists(), self._item_type)
+
+
+def _remaining_offsets(first_page: Any) -> range:
+    pagination = first_page.pagination
+    if pagination.count == 0:
+        return range(0)
+    start = pagination.offset + pagination.count
+    return range(start, pagination.total, pagination.limit or pagination.count)
+
+
+def fetch_pages(
+    sync_detailed: Callable[..., Response[Any]],
+    *,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[Any]:
+    """Fetch all pages of a paged endpoint using a thread pool
+
+    The first page is requested to learn ``pagination.total``, then the remaining offsets are
+    requested concurrently over the client's connection pool.
+
+    Args:
+        sync_detailed: The ``sync_detailed`` function of a paged endpoint.
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first page.
+        **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List of all pages in offset order.
+    """
+    first_page = parse_page(sync_detailed(limit=limit, offset=offset, **kwargs))
+    offsets = _remaining_offsets(first_page)
+    if not offsets:
+        return [first_page]
+
+    def fetch(page_offset: int) -> Any:
+        return parse_page(sync_detailed(limit=limit, offset=page_offset, **kwargs))
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(offsets))) as executor:
+        return [first_page, *executor.map(fetch, offsets)]
+
+
+async def asyncio_fetch_pages(
+    asyncio_detailed: Callable[..., Awaitable[Response[Any]]],
+    *,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[Any]:
+    """Fetch all pages of a paged endpoint concurrently
+
+    The first page is requested to learn ``pagination.total``, then the remaining offsets are
+    requested concurrently with at most ``max_concurrency`` requests in flight.
+
+    Args:
+        asyncio_detailed: The ``asyncio_detailed`` function of a paged endpoint.
+        max_concurrency (int): Maximum number of concurrent requests.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first page.
+        **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Returns:
+        List of all pages in offset order.
+    """
+    first_page = parse_page(
+        await asyncio_detailed(limit=limit, offset=offset, **kwargs)
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page_offset: int) -> Any:
+        async with semaphore:
+            response = await asyncio_detailed(limit=limit, offset=page_offset, **kwargs)
+        return parse_page(response)
+
+    pages = await asyncio.gather(*map(fetch, _remaining_offsets(first_page)))
+    return [first_page, *pages]
+
+
+__all__ = [
+    "ItemIterator",
+    "MAX_CONCURRENCY",
+    "MAX_LIMIT",
+    "asyncio_fetch_pages",
+    "fetch_pages",
+    "iter_pages",
+    "parse_page",
+]
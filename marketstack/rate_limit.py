@@ -0,0 +1,96 @@
+""" Client side rate limiting of API requests """
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """A token bucket shared by all sync and async requests of a client
+
+    The bucket allows bursts of up to ``burst`` requests and refills at ``rate`` requests per
+    second. When the API responds with 429 (``ErrorCode.RATE_LIMIT_REACHED``) the effective
+    rate is multiplied by ``backoff`` and recovers by ``recovery * rate`` with every
+    successful response, so throughput converges just below the plan's limit.
+
+    Args:
+        rate (float): Requests per second.
+        burst (int): Maximum number of requests sent without waiting.
+        min_rate (Optional[float]): Lower bound of the adapted rate, defaults to ``rate / 10``.
+        backoff (float): Factor applied to the effective rate on a 429 response.
+        recovery (float): Fraction of ``rate`` regained per successful response.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        backoff: float = 0.5,
+        recovery: float = 0.05,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = rate / 10 if min_rate is None else min_rate
+        self.backoff = backoff
+        self.recovery = recovery
+        self._current_rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self) -> float:
+        """The effective rate after adapting to rate limit responses"""
+        return self._current_rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self._current_rate)
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before sending"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._current_rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait asynchronously until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_response(
+        self, status_code: int, retry_after: Optional[float] = None
+    ) -> None:
+        """Adapt the effective rate to the status code of a response"""
+        with self._lock:
+            if status_code == 429:
+                self._refill(time.monotonic())
+                self._current_rate = max(
+                    self.min_rate, self._current_rate * self.backoff
+                )
+                pause = retry_after or 0.0
+                self._tokens = min(self._tokens, -pause * self._current_rate)
+            elif self._current_rate < self.rate:
+                self._refill(time.monotonic())
+                self._current_rate = min(
+                    self.rate, self._current_rate + self.rate * self.recovery
+                )
+
+
+__all__ = ["RateLimiter"]
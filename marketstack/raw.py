@@ -0,0 +1,261 @@
+""" Passthrough of endpoint responses as decoded JSON or bytes without building models """
+import re
+from functools import partial
+from types import ModuleType
+from typing import Any, Iterator, List, Optional
+
+import attr
+import httpx
+
+from .chunking import asyncio_fetch_chunk_pages, fetch_chunk_pages, iter_chunk_pages
+from .client import Client
+from .models.pagination import Pagination
+from .paging import (
+    MAX_CONCURRENCY,
+    MAX_LIMIT,
+    asyncio_fetch_pages,
+    fetch_pages,
+    iter_pages,
+    parse_page,
+)
+from .types import Response
+
+# the pagination is a flat object, an escaped key inside a string value is not matched
+_PAGINATION = re.compile(rb'(?<!\\)"pagination"\s*:\s*(\{[^{}]*\})')
+
+
+@attr.s(auto_attribs=True)
+class RawPage:
+    """A successful response of an endpoint without models
+
+    Attributes:
+        content (bytes): The undecoded body.
+        data (Any): The decoded body, None if it was not decoded.
+        pagination (Optional[Pagination]): The pagination of paged endpoints.
+    """
+
+    content: bytes
+    data: Any
+    pagination: Optional[Pagination]
+
+
+def parse_raw(client: Client, content: bytes, decode: bool = True) -> RawPage:
+    """Parse only the pagination of a response body
+
+    Args:
+        client: The client, whose ``json_decoder`` is used.
+        content: The response body.
+        decode: Decode the whole body into ``data``, otherwise only the pagination object
+            is decoded.
+    """
+    pagination = None
+    if decode:
+        data = client.json_decoder(content)
+        if isinstance(data, dict):
+            pagination = data.get("pagination")
+    else:
+        data = None
+        match = _PAGINATION.search(content)
+        if match is not None:
+            pagination = client.json_decoder(match.group(1))
+    return RawPage(
+        content=content,
+        data=data,
+        pagination=None if pagination is None else Pagination.from_dict(pagination),
+    )
+
+
+def _build_response(
+    endpoint: ModuleType, client: Client, response: httpx.Response, decode: bool
+) -> Response[Any]:
+    if response.status_code == 200:
+        parse = partial(parse_raw, client, response.content, decode)
+    else:
+        parse = partial(endpoint._parse_response, client=client, response=response)
+    return Response(
+        status_code=response.status_code,
+        content=response.content,
+        headers=response.headers,
+        parse=parse,
+    )
+
+
+def sync_detailed(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    **kwargs: Any,
+) -> Response[Any]:
+    """Request an endpoint and return a RawPage as ``parsed`` of successful responses
+
+    Error responses are parsed into the endpoint's error models.
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.eod.eod``.
+        client: The client.
+        decode: Decode the whole body, otherwise only the pagination.
+        *args, **kwargs: The arguments of the endpoint.
+    """
+    response = client.get_httpx_client().request(
+        **endpoint._get_kwargs(*args, client=client, **kwargs)
+    )
+    return _build_response(endpoint, client, response, decode)
+
+
+async def asyncio_detailed(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    **kwargs: Any,
+) -> Response[Any]:
+    """Request an endpoint and return a RawPage as ``parsed`` of successful responses
+
+    See ``sync_detailed()``.
+    """
+    response = await client.get_async_httpx_client().request(
+        **endpoint._get_kwargs(*args, client=client, **kwargs)
+    )
+    return _build_response(endpoint, client, response, decode)
+
+
+def sync(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    **kwargs: Any,
+) -> RawPage:
+    """Request an endpoint and return its body without building models
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.eod.eod``.
+        client: The client.
+        decode: Decode the whole body into ``data``, otherwise only the pagination.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+    """
+    return parse_page(
+        sync_detailed(endpoint, *args, client=client, decode=decode, **kwargs)
+    )
+
+
+async def asyncio(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    **kwargs: Any,
+) -> RawPage:
+    """Request an endpoint and return its body without building models
+
+    See ``sync()``.
+    """
+    return parse_page(
+        await asyncio_detailed(endpoint, *args, client=client, decode=decode, **kwargs)
+    )
+
+
+def iter_all(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[RawPage]:
+    """Lazily fetch all pages of a paged endpoint without building models
+
+    More than MAX_SYMBOLS ``symbols`` are paged chunk after chunk.
+
+    Args:
+        endpoint: A paged endpoint module, e.g. ``marketstack.api.eod.eod``.
+        client: The client.
+        decode: Decode the whole bodies into ``data``, otherwise only the paginations.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first page.
+        *args, **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+    """
+    pages = iter_chunk_pages if "symbols" in kwargs else iter_pages
+    return pages(
+        partial(sync_detailed, endpoint, *args, client=client, decode=decode),
+        limit=limit,
+        offset=offset,
+        **kwargs,
+    )
+
+
+def sync_all(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[RawPage]:
+    """Fetch all pages of a paged endpoint concurrently without building models
+
+    See ``paging.fetch_pages()``, more than MAX_SYMBOLS ``symbols`` are paged in
+    concurrent chunks.
+
+    Returns:
+        List of all pages in offset order.
+    """
+    fetch = fetch_chunk_pages if "symbols" in kwargs else fetch_pages
+    return fetch(
+        partial(sync_detailed, endpoint, *args, client=client, decode=decode),
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+        **kwargs,
+    )
+
+
+async def asyncio_all(
+    endpoint: ModuleType,
+    *args: Any,
+    client: Client,
+    decode: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> List[RawPage]:
+    """Fetch all pages of a paged endpoint concurrently without building models
+
+    See ``paging.asyncio_fetch_pages()``, more than MAX_SYMBOLS ``symbols`` are paged in
+    concurrent chunks.
+
+    Returns:
+        List of all pages in offset order.
+    """
+    fetch = asyncio_fetch_chunk_pages if "symbols" in kwargs else asyncio_fetch_pages
+    return await fetch(
+        partial(asyncio_detailed, endpoint, *args, client=client, decode=decode),
+        max_concurrency=max_concurrency,
+        limit=limit,
+        offset=offset,
+        **kwargs,
+    )
+
+
+__all__ = [
+    "RawPage",
+    "asyncio",
+    "asyncio_all",
+    "asyncio_detailed",
+    "iter_all",
+    "parse_raw",
+    "sync",
+    "sync_all",
+    "sync_detailed",
+]
@@ -0,0 +1,365 @@
+""" Long-lived cache of the reference data of exchanges, currencies and timezones """
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from operator import attrgetter, methodcaller
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .api.currencies import currencies
+from .api.exchanges import exchanges
+from .api.timezones import timezones
+from .client import Client
+from .models.currency import Currency
+from .models.exchange import Exchange
+from .models.timezone import Timezone
+
+T = TypeVar("T")
+
+DEFAULT_REFRESH_INTERVAL = 24 * 60 * 60.0
+"""Seconds after which reference data is revalidated"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reference_items (
+    name TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+
+class ReferenceStore:
+    """Persists the items of reference tables in a SQLite database
+
+    Processes sharing the database file start with the items fetched by any of them.
+
+    Args:
+        path (Union[str, os.PathLike]): The SQLite database file.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ReferenceStore":
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.close()
+
+    def load(self, name: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        """Return the UNIX time and the items of the last save of a table, or None"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fetched_at, payload FROM reference_items WHERE name = ?",
+                (name,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def save(self, name: str, items: List[Dict[str, Any]], fetched_at: float) -> None:
+        """Replace the items of a table fetched at a UNIX time"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO reference_items (name, fetched_at, payload) "
+                "VALUES (?, ?, ?)",
+                (name, fetched_at, json.dumps(items)),
+            )
+
+
+class ReferenceTable(Generic[T]):
+    """Items of a reference endpoint indexed by a key
+
+    The items are fetched on first use. Once they are older than ``refresh_interval``,
+    lookups keep returning the stale items while a background thread refetches them
+    (stale-while-revalidate). Only when the items are older than ``max_age`` do lookups
+    wait for the refetch. A failed revalidation keeps the stale items and is retried after
+    ``retry_interval``.
+
+    With a ``store``, fetched items are saved under ``name``, and a new table starts with
+    the saved items. They are served right away and revalidated in the background on
+    first use, unless they are older than ``max_age``.
+
+    Args:
+        fetch (Callable[[], List[T]]): Fetches all items, e.g. of all pages.
+        key (Callable[[T], str]): Returns the lookup key of an item.
+        refresh_interval (float): Seconds after which the items are revalidated.
+        max_age (Optional[float]): Seconds after which stale items are no longer returned.
+        retry_interval (float): Seconds to wait after a failed revalidation.
+        clock (Callable[[], float]): Monotonic clock.
+        store (Optional[ReferenceStore]): Persists the items.
+        name (str): The name of the items in the store.
+        from_dict (Optional[Callable[[Dict[str, Any]], T]]): Restores an item from the
+            store, e.g. ``Exchange.from_dict``. Items are saved with their ``to_dict()``.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], List[T]],
+        key: Callable[[T], str],
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_age: Optional[float] = None,
+        retry_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        store: Optional[ReferenceStore] = None,
+        name: str = "",
+        from_dict: Optional[Callable[[Dict[str, Any]], T]] = None,
+    ):
+        self.fetch = fetch
+        self.key = key
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.retry_interval = retry_interval
+        self.clock = clock
+        self.last_error: Optional[Exception] = None
+        self._items: List[T] = []
+        self._index: Optional[Dict[str, T]] = None
+        self._loaded_at = 0.0
+        self._next_refresh = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self.store = store
+        self.name = name
+        self.from_dict = from_dict
+        if store is not None:
+            self._restore()
+
+    def _restore(self) -> None:
+        saved = self.store.load(self.name)  # type: ignore[union-attr]
+        if saved is None or self.from_dict is None:
+            return
+        fetched_at, payload = saved
+        age = max(0.0, time.time() - fetched_at)
+        self._set_items([self.from_dict(item) for item in payload], self.clock() - age)
+        # the saved items may be outdated, revalidate them on first use
+        self._next_refresh = self._loaded_at
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the items have been fetched"""
+        return self._index is not None
+
+    def _set_items(self, items: List[T], loaded_at: float) -> None:
+        index = {self.key(item): item for item in items}
+        with self._lock:
+            self._items = list(items)
+            self._index = index
+            self._loaded_at = loaded_at
+            self._next_refresh = loaded_at + self.refresh_interval
+            self.last_error = None
+
+    def set_items(self, items: List[T]) -> None:
+        """Replace the items, e.g. with items fetched asynchronously, and save them"""
+        self._set_items(items, self.clock())
+        if self.store is not None:
+            to_dict = methodcaller("to_dict")
+            self.store.save(self.name, [to_dict(item) for item in items], time.time())
+
+    def refresh(self) -> None:
+        """Fetch the items and wait for them
+
+        Raises:
+            ApiError: If the API returns an error response.
+        """
+        self.set_items(self.fetch())
+
+    def _revalidate(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            with self._lock:
+                self.last_error = e
+                self._next_refresh = self.clock() + self.retry_interval
+
+    def _get_index(self) -> Dict[str, T]:
+        index = self._index
+        now = self.clock()
+        if index is None or (
+            self.max_age is not None and now - self._loaded_at >= self.max_age
+        ):
+            with self._load_lock:
+                # another thread may have loaded the items in the meantime
+                if self._index is index:
+                    self.refresh()
+            return self._index  # type: ignore[return-value]
+
+        if now >= self._next_refresh:
+            with self._lock:
+                start = (self._thread is None or not self._thread.is_alive()) and (
+                    now >= self._next_refresh
+                )
+                if start:
+                    self._thread = threading.Thread(
+                        target=self._revalidate,
+                        name="marketstack-reference",
+                        daemon=True,
+                    )
+                    self._thread.start()
+        return index
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for a running background revalidation"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def get(self, key: str) -> Optional[T]:
+        """Return the item of a key in O(1), or None"""
+        return self._get_index().get(key)
+
+    def __getitem__(self, key: str) -> T:
+        return self._get_index()[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._get_index()
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def values(self) -> List[T]:
+        """Return all items in the order of the API"""
+        self._get_index()
+        return list(self._items)
+
+
+class ReferenceData:
+    """Cached exchanges, currencies and timezones with O(1) lookups
+
+    Every kind of reference data is a ReferenceTable fetched with all of its pages on first
+    use and revalidated in the background after ``refresh_interval``. The intervals can be
+    changed per table, e.g. ``reference.timezones.refresh_interval = 7 * 24 * 3600``.
+
+    With a ``path``, the data is persisted in a SQLite database. Instances sharing the path,
+    e.g. after a restart, serve the persisted data right away and revalidate it in the
+    background.
+
+    Args:
+        client (Client): The client used to fetch the reference data.
+        access_key (str):
+        refresh_interval (float): Seconds after which the data is revalidated.
+        max_age (Optional[float]): Seconds after which stale data is no longer returned.
+        clock (Callable[[], float]): Monotonic clock.
+        path (Union[None, str, os.PathLike]): The SQLite database file persisting the data.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        access_key: str,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        path: Union[None, str, "os.PathLike[str]"] = None,
+    ):
+        self.client = client
+        self.access_key = access_key
+        self.store = None if path is None else ReferenceStore(path)
+        self.exchanges: ReferenceTable[Exchange] = ReferenceTable(
+            lambda: exchanges.sync_all(client=client, access_key=access_key),
+            attrgetter("mic"),
+            refresh_interval=refresh_interval,
+            max_age=max_age,
+            clock=clock,
+            store=self.store,
+            name="exchanges",
+            from_dict=Exchange.from_dict,
+        )
+        self.currencies: ReferenceTable[Currency] = ReferenceTable(
+            lambda: currencies.sync_all(client=client, access_key=access_key),
+            attrgetter("code"),
+            refresh_interval=refresh_interval,
+            max_age=max_age,
+            clock=clock,
+            store=self.store,
+            name="currencies",
+            from_dict=Currency.from_dict,
+        )
+        self.timezones: ReferenceTable[Timezone] = ReferenceTable(
+            lambda: timezones.sync_all(client=client, access_key=access_key),
+            attrgetter("timezone"),
+            refresh_interval=refresh_interval,
+            max_age=max_age,
+            clock=clock,
+            store=self.store,
+            name="timezones",
+            from_dict=Timezone.from_dict,
+        )
+
+    def close(self) -> None:
+        """Wait for running background revalidations and close the database connection"""
+        for table in (self.exchanges, self.currencies, self.timezones):
+            table.wait()
+        if self.store is not None:
+            self.store.close()
+
+    def __enter__(self) -> "ReferenceData":
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.close()
+
+    def exchange(self, mic: str) -> Optional[Exchange]:
+        """Return the exchange of a MIC, e.g. ``XNAS``, like ``exchanges.exchange_mic``"""
+        return self.exchanges.get(mic)
+
+    def currency(self, code: str) -> Optional[Currency]:
+        """Return the currency of a code, e.g. ``USD``"""
+        return self.currencies.get(code)
+
+    def timezone(self, name: str) -> Optional[Timezone]:
+        """Return the timezone of a name, e.g. ``America/New_York``"""
+        return self.timezones.get(name)
+
+    def refresh(self) -> None:
+        """Fetch all reference data and wait for it
+
+        Raises:
+            ApiError: If the API returns an error response.
+        """
+        for table in (self.exchanges, self.currencies, self.timezones):
+            table.refresh()
+
+    async def asyncio_refresh(self) -> None:
+        """Fetch all reference data concurrently, e.g. to preload it in an event loop
+
+        Raises:
+            ApiError: If the API returns an error response.
+        """
+        client, access_key = self.client, self.access_key
+        exchange_items, currency_items, timezone_items = await asyncio.gather(
+            exchanges.asyncio_all(client=client, access_key=access_key),
+            currencies.asyncio_all(client=client, access_key=access_key),
+            timezones.asyncio_all(client=client, access_key=access_key),
+        )
+        self.exchanges.set_items(exchange_items)
+        self.currencies.set_items(currency_items)
+        self.timezones.set_items(timezone_items)
+
+
+__all__ = [
+    "DEFAULT_REFRESH_INTERVAL",
+    "ReferenceData",
+    "ReferenceStore",
+    "ReferenceTable",
+]
@@ -0,0 +1,162 @@
+""" Vectorized resampling of intraday bars to coarser intervals """
+import datetime
+import math
+from typing import Dict, List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Resampling requires numpy, install it with: pip install marketstack[numpy]"
+    ) from e
+
+from .frames import columns as model_columns
+from .frames import to_datetime64
+from .models.interval import Interval
+from .models.interval_price import IntervalPrice
+from .types import UNSET, Unset
+
+Columns = Dict[str, np.ndarray]
+
+INTERVAL_SECONDS = {
+    Interval.MIN1: 60,
+    Interval.MIN5: 5 * 60,
+    Interval.MIN10: 10 * 60,
+    Interval.MIN30: 30 * 60,
+    Interval.HOUR1: 60 * 60,
+    Interval.HOUR3: 3 * 60 * 60,
+    Interval.HOUR6: 6 * 60 * 60,
+    Interval.HOUR12: 12 * 60 * 60,
+    Interval.HOUR24: 24 * 60 * 60,
+}
+"""The length of every interval in seconds"""
+
+
+def can_resample(source: Interval, target: Interval) -> bool:
+    """Return whether bars of the target interval can be built from source interval bars"""
+    return INTERVAL_SECONDS[target] % INTERVAL_SECONDS[source] == 0
+
+
+def _first_valid(
+    values: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    count = len(values)
+    index = np.where(np.isnan(values), count, np.arange(count))
+    index = np.minimum.accumulate(index[::-1])[::-1][starts]
+    valid = index <= ends
+    return np.where(valid, values[np.where(valid, index, 0)], np.nan)
+
+
+def _last_valid(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    index = np.where(np.isnan(values), -1, np.arange(len(values)))
+    index = np.maximum.accumulate(index)[ends]
+    valid = index >= starts
+    return np.where(valid, values[np.where(valid, index, 0)], np.nan)
+
+
+def _sum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    missing = np.isnan(values)
+    sums = np.add.reduceat(np.where(missing, 0.0, values), starts)
+    counts = np.add.reduceat(~missing, starts)
+    return np.where(counts > 0, sums, np.nan)
+
+
+def resample(columns: Columns, interval: Interval) -> Columns:
+    """Aggregate the intraday bars of one symbol to a coarser interval
+
+    Bars are grouped by the UTC interval they start in, e.g. ``3hour`` bars start at
+    00:00, 03:00, ... UTC. ``open`` is the first and ``close``/``last`` the last value of a
+    group, ``high``/``low`` its extremes and ``volume`` its sum; missing values (NaN) are
+    skipped.
+
+    Args:
+        columns: ``date`` in ascending order and any of ``open``, ``high``, ``low``,
+            ``close``, ``last`` and ``volume``, e.g. of ``ColumnStore.read()``.
+        interval: The target interval.
+
+    Returns:
+        The columns of the resampled bars, with the start of the interval as ``date``.
+    """
+    dates = np.asarray(columns["date"])
+    if len(dates) == 0:
+        return {name: np.asarray(column)[:0] for name, column in columns.items()}
+    step = INTERVAL_SECONDS[interval]
+    seconds = dates.astype("datetime64[s]").astype(np.int64)
+    buckets = seconds - seconds % step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(dates)] - 1
+
+    resampled = {"date": buckets[starts].astype("datetime64[s]").astype(dates.dtype)}
+    for name, column in columns.items():
+        values = np.asarray(column)
+        if name == "date" or values.dtype.kind != "f":
+            continue
+        if name == "open":
+            resampled[name] = _first_valid(values, starts, ends)
+        elif name == "high":
+            resampled[name] = np.fmax.reduceat(values, starts)
+        elif name == "low":
+            resampled[name] = np.fmin.reduceat(values, starts)
+        elif name == "volume":
+            resampled[name] = _sum(values, starts)
+        else:
+            resampled[name] = _last_valid(values, starts, ends)
+    return resampled
+
+
+def _to_float(value: float) -> Union[Unset, float]:
+    return UNSET if math.isnan(value) else float(value)
+
+
+def resample_prices(
+    prices: Sequence[IntervalPrice], interval: Interval
+) -> List[IntervalPrice]:
+    """Aggregate IntervalPrice bars of any symbols to a coarser interval
+
+    See ``resample()``. The exchange of a resampled bar is the one of its first bar. An
+    interval without any valid ``open``, ``low`` or ``high`` value, i.e. all NaN, has no
+    resampled bar, as these fields are required.
+
+    Returns:
+        The resampled bars ordered by symbol and date.
+    """
+    by_symbol: Dict[str, List[IntervalPrice]] = {}
+    for price in prices:
+        by_symbol.setdefault(price.symbol, []).append(price)
+
+    resampled = []
+    utc = datetime.timezone.utc
+    for symbol, symbol_prices in by_symbol.items():
+        symbol_prices.sort(key=lambda price: price.date)
+        columns = {
+            name: array
+            for name, (_, array) in model_columns(symbol_prices, IntervalPrice).items()
+        }
+        exchanges = columns.pop("exchange")
+        columns["date"] = to_datetime64(columns["date"])
+        bars = resample(columns, interval)
+        # the first bar of every interval, as the dates of both are ascending
+        first = np.searchsorted(columns["date"], bars["date"], side="left")
+        valid = ~(
+            np.isnan(bars["open"]) | np.isnan(bars["low"]) | np.isnan(bars["high"])
+        )
+        for index, date in enumerate(bars["date"].astype(object)):
+            if not valid[index]:
+                continue
+            resampled.append(
+                IntervalPrice(
+                    date=date.replace(tzinfo=utc),
+                    symbol=symbol,
+                    open_=float(bars["open"][index]),
+                    low=float(bars["low"][index]),
+                    high=float(bars["high"][index]),
+                    exchange=exchanges[first[index]],
+                    volume=_to_float(bars["volume"][index]),
+                    close=_to_float(bars["close"][index]),
+                    last=_to_float(bars["last"][index]),
+                )
+            )
+    return resampled
+
+
+__all__ = ["INTERVAL_SECONDS", "can_resample", "resample", "resample_prices"]
@@ -0,0 +1,66 @@
+""" Retry policy for transient request failures """
+import random
+from typing import FrozenSet, Optional, Tuple, Type
+
+import attr
+import httpx
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RetryPolicy:
+    """Describes which failed requests are retried and how long to wait in between
+
+    The delay before retry ``n`` is drawn uniformly from
+    ``[0, min(max_backoff, backoff_factor * 2 ** (n - 1))]`` ("full jitter"), or is the
+    exponential value itself if ``jitter`` is disabled. A ``Retry-After`` header takes
+    precedence if ``respect_retry_after`` is set; if it demands a longer wait than
+    ``max_retry_after``, the request is not retried and the response is returned.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts including the first request.
+        status_codes (FrozenSet[int]): Status codes which are retried.
+        exceptions (Tuple[Type[Exception], ...]): Transport exceptions which are retried.
+        backoff_factor (float): Base delay in seconds of the exponential backoff.
+        max_backoff (float): Upper bound of the backoff delay in seconds.
+        jitter (bool): Randomize the backoff delay.
+        respect_retry_after (bool): Wait as long as the ``Retry-After`` header demands.
+        max_retry_after (float): Longest ``Retry-After`` in seconds which is waited for.
+    """
+
+    max_attempts: int = 3
+    status_codes: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    exceptions: Tuple[Type[Exception], ...] = (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+    )
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def get_delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """Return the seconds to wait after the given failed attempt (starting at 1)
+
+        Returns:
+            The delay, or None if ``Retry-After`` exceeds ``max_retry_after`` and the
+            request should not be retried.
+        """
+        if self.respect_retry_after and retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        return self.get_backoff(attempt)
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return the backoff delay after the given failed attempt (starting at 1)"""
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+__all__ = ["RetryPolicy"]
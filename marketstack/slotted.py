@@ -0,0 +1,54 @@
+""" Opt-in slotted variants of the high volume models """
+from typing import Any, Type, TypeVar
+
+import attr
+
+from .models.dividend import Dividend
+from .models.eod_price import EodPrice
+from .models.interval_price import IntervalPrice
+from .models.split import Split
+
+T = TypeVar("T")
+
+
+def slotted(model: Type[T]) -> Type[T]:
+    """Return a copy of an attrs model class with ``__slots__``
+
+    Instances of the copy need less memory, but have no ``__dict__``, so ``vars()`` and
+    attributes other than the fields fail. The copy is no subclass of the model.
+
+    Args:
+        model: A model class, e.g. ``EodPrice``.
+    """
+    namespace = {
+        name: value
+        for name, value in vars(model).items()
+        if name not in ("__dict__", "__weakref__")
+    }
+    name = f"Slotted{model.__name__}"
+    namespace.update(__module__=__name__, __qualname__=name)
+    fields = {
+        field.name: attr.ib(
+            default=field.default,
+            init=field.init,
+            repr=field.repr,
+            eq=field.eq_key or field.eq,
+        )
+        for field in attr.fields(model)
+    }
+    cls: Any = type(name, model.__bases__, namespace)
+    return attr.s(these=fields, slots=True)(cls)
+
+
+SlottedEodPrice = slotted(EodPrice)
+SlottedIntervalPrice = slotted(IntervalPrice)
+SlottedDividend = slotted(Dividend)
+SlottedSplit = slotted(Split)
+
+__all__ = [
+    "SlottedDividend",
+    "SlottedEodPrice",
+    "SlottedIntervalPrice",
+    "SlottedSplit",
+    "slotted",
+]
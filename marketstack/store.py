@@ -0,0 +1,310 @@
+""" Incremental local store of EOD and intraday price series """
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+
+from .api.eod import eod
+from .api.intraday import intraday
+from .chunking import Symbols, split_symbols
+from .client import Client
+from .dates import parse_datetime
+from .eod_cache import DateLike, to_date
+from .models.eod_price import EodPrice
+from .models.interval import Interval
+from .models.interval_price import IntervalPrice
+from .paging import MAX_CONCURRENCY
+
+Price = Union[EodPrice, IntervalPrice]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    scope TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (scope, symbol, date)
+);
+"""
+
+_PRICE_TYPES = {eod: EodPrice, intraday: IntervalPrice}
+
+
+def _utc(date: datetime.datetime) -> datetime.datetime:
+    if date.tzinfo is None:
+        return date.replace(tzinfo=datetime.timezone.utc)
+    return date.astimezone(datetime.timezone.utc)
+
+
+def _format(date: datetime.datetime) -> str:
+    return _utc(date).strftime("%Y-%m-%dT%H:%M:%S+0000")
+
+
+def _to_datetime_or_date(
+    value: DateLike,
+) -> Union[datetime.date, datetime.datetime]:
+    if isinstance(value, str):
+        return parse_datetime(value) if len(value) > 10 else to_date(value)
+    return value
+
+
+def _to_key(value: Union[datetime.date, datetime.datetime]) -> str:
+    if isinstance(value, datetime.datetime):
+        return _format(value)
+    return value.isoformat()
+
+
+class PriceStore:
+    """A local store of price series which only requests bars newer than the stored ones
+
+    The store remembers the last stored date of every symbol. ``sync()`` requests the bars
+    from the day (EOD) or second (intraday) after it, so a daily update of many symbols only
+    transfers the new bars. Symbols with the same last date share requests.
+
+    Args:
+        path (Union[str, os.PathLike]): The SQLite database file, defaults to an in-memory
+            database.
+        endpoint (ModuleType): ``eod.eod`` or ``intraday.intraday``.
+        **kwargs: Further arguments of the endpoint, e.g. ``interval`` or ``exchange``.
+            Series of different arguments are stored separately.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+        endpoint: ModuleType = eod,
+        **kwargs: Any,
+    ):
+        if endpoint not in _PRICE_TYPES:
+            raise ValueError(f"{endpoint.__name__} is not eod.eod or intraday.intraday")
+        self.endpoint = endpoint
+        self.price_type = _PRICE_TYPES[endpoint]
+        self.kwargs = kwargs
+        self.scope = json.dumps(
+            [
+                endpoint.__name__.rsplit(".", 1)[-1],
+                {k: str(v) for k, v in kwargs.items()},
+            ],
+            sort_keys=True,
+        )
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "PriceStore":
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.close()
+
+    def last_dates(self, symbols: Symbols) -> Dict[str, Optional[datetime.datetime]]:
+        """Return the date of the last stored bar of every symbol, None if there is none"""
+        symbol_list = split_symbols(symbols)
+        placeholders = ", ".join("?" * len(symbol_list))
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT symbol, MAX(date) FROM prices "
+                f"WHERE scope = ? AND symbol IN ({placeholders}) GROUP BY symbol",
+                (self.scope, *symbol_list),
+            ).fetchall()
+        last = {symbol: parse_datetime(date) for symbol, date in rows}
+        return {symbol: last.get(symbol) for symbol in symbol_list}
+
+    def _next_date(self, last: datetime.datetime) -> str:
+        if self.endpoint is eod:
+            return (last.date() + datetime.timedelta(days=1)).isoformat()
+        return _format(last + datetime.timedelta(seconds=1))
+
+    def plan(
+        self, symbols: Symbols, date_from: Optional[DateLike] = None
+    ) -> Dict[Optional[str], List[str]]:
+        """Return the symbols to request grouped by the ``date_from`` of their next bars
+
+        Args:
+            symbols: The symbols to sync.
+            date_from: The start of the series of symbols without stored bars, defaults to
+                the API's default range.
+        """
+        if isinstance(date_from, datetime.date):
+            date_from = date_from.isoformat()
+        groups: Dict[Optional[str], List[str]] = {}
+        for symbol, last in self.last_dates(symbols).items():
+            start = date_from if last is None else self._next_date(last)
+            groups.setdefault(start, []).append(symbol)
+        return groups
+
+    def append(self, prices: List[Price]) -> int:
+        """Store bars, replacing stored bars of the same symbol and date
+
+        Returns:
+            The number of bars.
+        """
+        rows = [
+            (self.scope, price.symbol, _format(price.date), json.dumps(price.to_dict()))
+            for price in prices
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def _request_kwargs(
+        self,
+        client: Client,
+        access_key: str,
+        symbols: Symbols,
+        date_from: Optional[str],
+    ) -> Dict[str, Any]:
+        kwargs = {**self.kwargs, "client": client, "access_key": access_key}
+        if date_from is not None:
+            kwargs["date_from"] = date_from
+        kwargs["symbols"] = symbols
+        return kwargs
+
+    def sync(
+        self,
+        symbols: Symbols,
+        *,
+        client: Client,
+        access_key: str,
+        date_from: Optional[DateLike] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> int:
+        """Request and store the bars after the last stored bar of every symbol
+
+        Args:
+            symbols (Union[List[str], str]): The symbols to sync.
+            client (Client): The client.
+            access_key (str):
+            date_from (Union[None, str, datetime.date]): Start of the series of symbols
+                without stored bars.
+            max_concurrency (int): Maximum number of concurrent page requests.
+
+        Raises:
+            ApiError: If the API returns an error response.
+
+        Returns:
+            The number of new bars.
+        """
+        count = 0
+        for start, group in self.plan(symbols, date_from).items():
+            count += self.append(
+                self.endpoint.sync_all(
+                    max_concurrency=max_concurrency,
+                    **self._request_kwargs(client, access_key, group, start),
+                )
+            )
+        return count
+
+    async def asyncio_sync(
+        self,
+        symbols: Symbols,
+        *,
+        client: Client,
+        access_key: str,
+        date_from: Optional[DateLike] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> int:
+        """Request and store the bars after the last stored bar of every symbol
+
+        Args:
+            symbols (Union[List[str], str]): The symbols to sync.
+            client (Client): The client.
+            access_key (str):
+            date_from (Union[None, str, datetime.date]): Start of the series of symbols
+                without stored bars.
+            max_concurrency (int): Maximum number of concurrent page requests.
+
+        Raises:
+            ApiError: If the API returns an error response.
+
+        Returns:
+            The number of new bars.
+        """
+        count = 0
+        for start, group in self.plan(symbols, date_from).items():
+            count += self.append(
+                await self.endpoint.asyncio_all(
+                    max_concurrency=max_concurrency,
+                    **self._request_kwargs(client, access_key, group, start),
+                )
+            )
+        return count
+
+    def load(
+        self,
+        symbols: Symbols,
+        date_from: Optional[DateLike] = None,
+        date_to: Optional[DateLike] = None,
+    ) -> List[Price]:
+        """Return the stored bars of the symbols, oldest first
+
+        ``date_from`` and ``date_to`` are inclusive, dates without time include the whole day.
+        """
+        symbol_list = split_symbols(symbols)
+        placeholders = ", ".join("?" * len(symbol_list))
+        query = (
+            "SELECT payload FROM prices "
+            f"WHERE scope = ? AND symbol IN ({placeholders})"
+        )
+        params: List[Any] = [self.scope, *symbol_list]
+        if date_from is not None:
+            date_from = _to_datetime_or_date(date_from)
+            query += " AND date >= ?"
+            params.append(_to_key(date_from))
+        if date_to is not None:
+            date_to = _to_datetime_or_date(date_to)
+            if isinstance(date_to, datetime.datetime):
+                query += " AND date <= ?"
+                params.append(_to_key(date_to))
+            else:
+                query += " AND date < ?"
+                params.append(_to_key(date_to + datetime.timedelta(days=1)))
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY date, symbol", params
+            ).fetchall()
+        from_dict = self.price_type.from_dict
+        return [from_dict(json.loads(payload)) for payload, in rows]
+
+    def load_resampled(
+        self,
+        symbols: Symbols,
+        interval: Interval,
+        date_from: Optional[DateLike] = None,
+        date_to: Optional[DateLike] = None,
+    ) -> List[IntervalPrice]:
+        """Return the stored intraday bars aggregated to a coarser interval
+
+        Answers requests of coarser intervals from the stored bars without requesting the
+        API, see ``resampling.resample()``. ``date_from`` should be the start of an interval
+        of the target interval, otherwise its first bar is incomplete.
+
+        Raises:
+            ValueError: If the store is not an intraday store, or the interval is not a
+                multiple of its interval.
+        """
+        from .resampling import can_resample, resample_prices
+
+        if self.endpoint is not intraday:
+            raise ValueError("Only intraday bars can be resampled")
+        # the API defaults to hourly bars
+        source = Interval(self.kwargs.get("interval") or Interval.HOUR1)
+        if not can_resample(source, interval):
+            raise ValueError(f"{interval} bars cannot be built from {source} bars")
+        return resample_prices(
+            self.load(symbols, date_from, date_to), interval  # type: ignore[arg-type]
+        )
+
+
+__all__ = ["PriceStore"]
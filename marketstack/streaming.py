@@ -0,0 +1,271 @@
+""" Incremental parsing of EOD and intraday price responses while they are received """
+from types import ModuleType
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple, Type, Union
+
+try:
+    import ijson
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Streaming requires ijson, install it with: pip install marketstack[streaming]"
+    ) from e
+
+from .client import Client
+from .errors import ApiError
+from .models.eod_price import EodPrice
+from .models.interval_price import IntervalPrice
+from .models.paged_response_exchange_eod import PagedResponseExchangeEod
+from .models.paged_response_exchange_intraday import PagedResponseExchangeIntraday
+from .models.paged_response_listmodels_eod_price import PagedResponseListmodelsEodPrice
+from .models.paged_response_listmodels_interval_price import (
+    PagedResponseListmodelsIntervalPrice,
+)
+from .models.paged_response_ticker_eod import PagedResponseTickerEod
+from .models.paged_response_ticker_intraday import PagedResponseTickerIntraday
+from .models.pagination import Pagination
+from .paging import MAX_LIMIT
+from .transport import STREAM_EXTENSION
+
+Price = Union[EodPrice, IntervalPrice]
+
+_ITEM_PATHS = {
+    PagedResponseListmodelsEodPrice: ("data.item", EodPrice),
+    PagedResponseTickerEod: ("data.eod.item", EodPrice),
+    PagedResponseExchangeEod: ("data.eod.item", EodPrice),
+    PagedResponseListmodelsIntervalPrice: ("data.item", IntervalPrice),
+    PagedResponseTickerIntraday: ("data.intraday.item", IntervalPrice),
+    PagedResponseExchangeIntraday: ("data.intraday.item", IntervalPrice),
+}
+
+
+def get_item_path(endpoint: ModuleType) -> Tuple[str, Type[Price]]:
+    """Return the ijson prefix and the model of the prices of an endpoint module"""
+    for page_type, item_path in _ITEM_PATHS.items():
+        if getattr(endpoint, page_type.__name__, None) is page_type:
+            return item_path
+    raise ValueError(f"{endpoint.__name__} does not return EOD or intraday prices")
+
+
+class PageParser:
+    """Parses the chunks of a price response into models as soon as an item is complete
+
+    Only the events of the current chunk and the item being built are held in memory.
+
+    Args:
+        item_prefix (str): The ijson prefix of the items, e.g. ``data.item``.
+        item_type (Type): The model of the items.
+
+    Attributes:
+        pagination (Optional[Pagination]): The pagination, once it has been parsed.
+    """
+
+    def __init__(self, item_prefix: str, item_type: Type[Price]):
+        self.item_prefix = item_prefix
+        self.item_type = item_type
+        self.pagination: Optional[Pagination] = None
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._builder: Optional[ijson.ObjectBuilder] = None
+        self._building = ""
+
+    def feed(self, chunk: bytes) -> List[Price]:
+        """Parse a chunk of the response body and return the completed items"""
+        self._parser.send(chunk)
+        return self._handle_events()
+
+    def close(self) -> List[Price]:
+        """Finish parsing and return the remaining items
+
+        Raises:
+            ijson.IncompleteJSONError: If the body is not a complete JSON document.
+        """
+        self._parser.close()
+        return self._handle_events()
+
+    def _handle_events(self) -> List[Price]:
+        items = []
+        for prefix, event, value in self._events:
+            if self._builder is None:
+                if event != "start_map" or prefix not in (
+                    self.item_prefix,
+                    "pagination",
+                ):
+                    continue
+                self._builder = ijson.ObjectBuilder()
+                self._building = prefix
+            self._builder.event(event, value)
+            # nested maps have longer prefixes, so this is the end of the built object
+            if event == "end_map" and prefix == self._building:
+                if prefix == "pagination":
+                    self.pagination = Pagination.from_dict(self._builder.value)
+                else:
+                    items.append(self.item_type.from_dict(self._builder.value))
+                self._builder = None
+        del self._events[:]
+        return items
+
+
+def _request_kwargs(
+    endpoint: ModuleType, args: Tuple[Any, ...], client: Client, kwargs: Any
+) -> Any:
+    request_kwargs = endpoint._get_kwargs(*args, client=client, **kwargs)
+    request_kwargs["extensions"] = {STREAM_EXTENSION: True}
+    return request_kwargs
+
+
+def _stream_page(
+    endpoint: ModuleType, parser: PageParser, client: Client, request_kwargs: Any
+) -> Iterator[Price]:
+    with client.get_httpx_client().stream(**request_kwargs) as response:
+        if response.status_code != 200:
+            response.read()
+            raise ApiError(
+                response.status_code,
+                response.content,
+                endpoint._parse_response(client=client, response=response),
+            )
+        for chunk in response.iter_bytes():
+            yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def _asyncio_stream_page(
+    endpoint: ModuleType, parser: PageParser, client: Client, request_kwargs: Any
+) -> AsyncIterator[Price]:
+    async with client.get_async_httpx_client().stream(**request_kwargs) as response:
+        if response.status_code != 200:
+            await response.aread()
+            raise ApiError(
+                response.status_code,
+                response.content,
+                endpoint._parse_response(client=client, response=response),
+            )
+        async for chunk in response.aiter_bytes():
+            for item in parser.feed(chunk):
+                yield item
+    for item in parser.close():
+        yield item
+
+
+def stream(
+    endpoint: ModuleType, *args: Any, client: Client, **kwargs: Any
+) -> Iterator[Price]:
+    """Request a page of a price endpoint and yield its items while they are received
+
+    Unlike ``sync()``, neither the whole body nor all models of the page are held in memory
+    at once.
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.intraday.intraday``.
+        client: The client.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Yields:
+        EodPrice or IntervalPrice items.
+    """
+    parser = PageParser(*get_item_path(endpoint))
+    yield from _stream_page(
+        endpoint, parser, client, _request_kwargs(endpoint, args, client, kwargs)
+    )
+
+
+async def asyncio_stream(
+    endpoint: ModuleType, *args: Any, client: Client, **kwargs: Any
+) -> AsyncIterator[Price]:
+    """Request a page of a price endpoint and yield its items while they are received
+
+    See ``stream()``.
+    """
+    parser = PageParser(*get_item_path(endpoint))
+    async for item in _asyncio_stream_page(
+        endpoint, parser, client, _request_kwargs(endpoint, args, client, kwargs)
+    ):
+        yield item
+
+
+def _next_offset(parser: PageParser) -> Optional[int]:
+    pagination = parser.pagination
+    if pagination is None:
+        return None
+    offset = pagination.offset + pagination.count
+    if pagination.count == 0 or offset >= pagination.total:
+        return None
+    return offset
+
+
+def stream_all(
+    endpoint: ModuleType,
+    *,
+    client: Client,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Price]:
+    """Request all pages of a price endpoint one after another and yield their items
+
+    Args:
+        endpoint: An endpoint module, e.g. ``marketstack.api.intraday.intraday``.
+        client: The client.
+        limit (int): Page size, defaults to the maximum page size.
+        offset (int): Offset of the first page.
+        **kwargs: Further arguments of the endpoint.
+
+    Raises:
+        ApiError: If the API returns an error response.
+
+    Yields:
+        EodPrice or IntervalPrice items.
+    """
+    item_path = get_item_path(endpoint)
+    next_offset: Optional[int] = offset
+    while next_offset is not None:
+        parser = PageParser(*item_path)
+        yield from _stream_page(
+            endpoint,
+            parser,
+            client,
+            _request_kwargs(
+                endpoint, (), client, {**kwargs, "limit": limit, "offset": next_offset}
+            ),
+        )
+        next_offset = _next_offset(parser)
+
+
+async def asyncio_stream_all(
+    endpoint: ModuleType,
+    *,
+    client: Client,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> AsyncIterator[Price]:
+    """Request all pages of a price endpoint one after another and yield their items
+
+    See ``stream_all()``.
+    """
+    item_path = get_item_path(endpoint)
+    next_offset: Optional[int] = offset
+    while next_offset is not None:
+        parser = PageParser(*item_path)
+        async for item in _asyncio_stream_page(
+            endpoint,
+            parser,
+            client,
+            _request_kwargs(
+                endpoint, (), client, {**kwargs, "limit": limit, "offset": next_offset}
+            ),
+        ):
+            yield item
+        next_offset = _next_offset(parser)
+
+
+__all__ = [
+    "PageParser",
+    "asyncio_stream",
+    "asyncio_stream_all",
+    "get_item_path",
+    "stream",
+    "stream_all",
+]
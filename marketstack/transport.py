@@ -0,0 +1,349 @@
+""" httpx transports adding client side behaviour to all endpoint calls """
+import asyncio
+import hashlib
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .cache import CachedResponse, CacheKey, ResponseCache, decoded_headers
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+
+# request extension marking streamed requests, whose responses must not be buffered
+STREAM_EXTENSION = "marketstack_stream"
+
+
+def _buffers(request: httpx.Request) -> bool:
+    return request.method == "GET" and not request.extensions.get(STREAM_EXTENSION)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the seconds to wait according to the ``Retry-After`` header, if any"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Waits for the rate limiter before sending each request"""
+
+    def __init__(self, transport: httpx.BaseTransport, rate_limiter: RateLimiter):
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.rate_limiter.acquire()
+        response = self.transport.handle_request(request)
+        self.rate_limiter.on_response(response.status_code, parse_retry_after(response))
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Waits for the rate limiter before sending each request"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, rate_limiter: RateLimiter):
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.rate_limiter.acquire_async()
+        response = await self.transport.handle_async_request(request)
+        self.rate_limiter.on_response(response.status_code, parse_retry_after(response))
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries failed requests according to a retry policy"""
+
+    def __init__(self, transport: httpx.BaseTransport, retry_policy: RetryPolicy):
+        self.transport = transport
+        self.retry_policy = retry_policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except policy.exceptions:
+                if attempt >= policy.max_attempts:
+                    raise
+                time.sleep(policy.get_backoff(attempt))
+            else:
+                if (
+                    response.status_code not in policy.status_codes
+                    or attempt >= policy.max_attempts
+                ):
+                    return response
+                delay = policy.get_delay(attempt, parse_retry_after(response))
+                if delay is None:
+                    return response
+                response.close()
+                time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Retries failed requests according to a retry policy"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, retry_policy: RetryPolicy):
+        self.transport = transport
+        self.retry_policy = retry_policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except policy.exceptions:
+                if attempt >= policy.max_attempts:
+                    raise
+                await asyncio.sleep(policy.get_backoff(attempt))
+            else:
+                if (
+                    response.status_code not in policy.status_codes
+                    or attempt >= policy.max_attempts
+                ):
+                    return response
+                delay = policy.get_delay(attempt, parse_retry_after(response))
+                if delay is None:
+                    return response
+                await response.aclose()
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _cached_response(request: httpx.Request, entry: CachedResponse) -> httpx.Response:
+    return httpx.Response(
+        entry.status_code, headers=entry.headers, content=entry.content, request=request
+    )
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Serves successful GET requests from a response cache
+
+    Streamed requests are passed through without being cached.
+
+    Args:
+        transport: The wrapped transport.
+        cache: The response cache.
+        base_path: The path of the client's base URL, endpoint TTLs are relative to it.
+    """
+
+    def __init__(
+        self, transport: httpx.BaseTransport, cache: ResponseCache, base_path: str = ""
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.base_path = base_path.rstrip("/")
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _buffers(request):
+            return self.transport.handle_request(request)
+        key = self.cache.make_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return _cached_response(request, entry)
+        response = self.transport.handle_request(request)
+        if response.status_code == 200:
+            response.read()
+            path = request.url.path[len(self.base_path) :]
+            self.cache.put(key, response, self.cache.get_ttl(path))
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Serves successful GET requests from a response cache
+
+    Streamed requests are passed through without being cached.
+
+    Args:
+        transport: The wrapped transport.
+        cache: The response cache.
+        base_path: The path of the client's base URL, endpoint TTLs are relative to it.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: ResponseCache,
+        base_path: str = "",
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.base_path = base_path.rstrip("/")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _buffers(request):
+            return await self.transport.handle_async_request(request)
+        key = self.cache.make_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return _cached_response(request, entry)
+        response = await self.transport.handle_async_request(request)
+        if response.status_code == 200:
+            await response.aread()
+            path = request.url.path[len(self.base_path) :]
+            self.cache.put(key, response, self.cache.get_ttl(path))
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+_FlightKey = Tuple[str, CacheKey]
+
+
+def _flight_key(request: httpx.Request) -> _FlightKey:
+    # the cache key leaves out the access_key, requests of different keys are not shared
+    access_key = request.url.params.get("access_key", "").encode()
+    return hashlib.sha256(access_key).hexdigest(), ResponseCache.make_key(request)
+
+
+def _copy_response(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        response.status_code,
+        headers=decoded_headers(response),
+        content=response.content,
+        request=request,
+    )
+
+
+class _Call:
+    """A request in flight whose response is shared with identical requests"""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        return self.response is not None or self.error is not None
+
+    def result(self, request: httpx.Request) -> httpx.Response:
+        if self.error is not None:
+            raise self.error
+        assert self.response is not None
+        return _copy_response(self.response, request)
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """Lets identical concurrent GET requests share one request to the API
+
+    Requests are identical if they have the same access key and ResponseCache key. The
+    first request is sent, the others wait for its response and get a copy of it, or its
+    exception. If the first request is interrupted, e.g. by a KeyboardInterrupt, a waiting
+    request is sent instead. Streamed requests are passed through.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+        self._calls: Dict[_FlightKey, _Call] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not _buffers(request):
+            return self.transport.handle_request(request)
+        key = _flight_key(request)
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    break
+            call.event.wait()
+            if call.done:
+                return call.result(request)
+
+        try:
+            call.response = self.transport.handle_request(request)
+            call.response.read()
+            return call.response
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+    """Lets identical concurrent GET requests share one request to the API
+
+    Requests are identical if they have the same access key and ResponseCache key. The
+    first request is sent in its own task and all identical requests get a copy of its
+    response, or its exception. Cancelling one of them does not cancel the shared request.
+    Streamed requests are passed through.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self._calls: "Dict[_FlightKey, asyncio.Task[httpx.Response]]" = {}
+
+    async def _send(self, key: _FlightKey, request: httpx.Request) -> httpx.Response:
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+            return response
+        finally:
+            del self._calls[key]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not _buffers(request):
+            return await self.transport.handle_async_request(request)
+        key = _flight_key(request)
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(self._send(key, request))
+            # retrieve the exception even if every caller was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return _copy_response(await asyncio.shield(task), request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AsyncCacheTransport",
+    "AsyncRateLimitTransport",
+    "AsyncRetryTransport",
+    "AsyncSingleFlightTransport",
+    "CacheTransport",
+    "RateLimitTransport",
+    "RetryTransport",
+    "STREAM_EXTENSION",
+    "SingleFlightTransport",
+    "parse_retry_after",
+]
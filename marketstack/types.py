@@ -1,5 +1,15 @@
 """ Contains some shared types for properties """
-from typing import BinaryIO, Generic, MutableMapping, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import attr
 
@@ -27,17 +37,43 @@ class File:
         return self.file_name, self.payload, self.mime_type
 
 
+def additional_properties_eq_key(value: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compare not yet allocated additional properties equal to empty ones"""
+    return value or {}
+
+
 T = TypeVar("T")
 
 
 @attr.s(auto_attribs=True)
 class Response(Generic[T]):
-    """A response from an endpoint"""
+    """A response from an endpoint
+
+    ``parsed`` is computed by ``parse`` on first access, so callers which only need the
+    status code, headers or raw content never pay for the deserialization. Responses are
+    compared by their raw attributes, as the parsed model is derived from the content.
+    """
 
     status_code: int
     content: bytes
     headers: MutableMapping[str, str]
-    parsed: Optional[T]
+    _parsed: Optional[T] = attr.ib(default=None, repr=False, eq=False)
+    _parse: Optional[Callable[[], Optional[T]]] = attr.ib(
+        default=None, repr=False, eq=False
+    )
+
+    @property
+    def parsed(self) -> Optional[T]:
+        """The parsed model, None if the status code is undocumented or in raw-only mode"""
+        if self._parse is not None:
+            self._parsed = self._parse()
+            self._parse = None
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, parsed: Optional[T]) -> None:
+        self._parsed = parsed
+        self._parse = None
 
 
 __all__ = ["File", "Response", "FileJsonType"]
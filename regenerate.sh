@@ -1,4 +1,17 @@
 #!/usr/bin/env bash
+# marketstack/api and marketstack/models are generated with the custom templates in templates/.
+# marketstack/client.py, types.py and the other modules are written by hand, so the client is
+# generated into a temporary directory and only api/ and models/ are replaced.
+set -euo pipefail
 
-openapi-python-client update --path ../marketstack-openapi/marketstack-openapi.json --meta none --config generator-config.yml
+root="$(cd "$(dirname "$0")" && pwd)"
+output="$(mktemp -d)"
+trap 'rm -rf "$output"' EXIT
+
+(cd "$output" && openapi-python-client generate --path "$root/../marketstack-openapi/marketstack-openapi.json" --meta none --config "$root/generator-config.yml" --custom-template-path "$root/templates")
+for package in api models; do
+    rm -rf "$root/marketstack/$package"
+    cp -r "$output/marketstack/$package" "$root/marketstack/$package"
+done
+cd "$root"
 PYTHONPATH="." pytest tests/test_models.py
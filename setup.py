@@ -15,4 +15,11 @@ setup(
     author="Mike Reiche",
     packages=find_packages(),
     install_requires=["attrs>=22.1.0", "httpx>=0.23.0", "python-dateutil>=2.8.2"],
+    extras_require={
+        "orjson": ["orjson>=3.8.0"],
+        "numpy": ["numpy>=1.21.0"],
+        "pandas": ["numpy>=1.21.0", "pandas>=1.3.0"],
+        "arrow": ["numpy>=1.21.0", "pyarrow>=7.0.0"],
+        "streaming": ["ijson>=3.1.0"],
+    },
 )
@@ -2,6 +2,7 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
 
 from marketstack.client import Client
@@ -36,3 +37,79 @@ def create_client():
     ), "Environment variable MARKETSTACK_API_KEY is not defined"
     protocol = "https" if tls_support == "1" else "http"
     return Client(base_url=f"{protocol}://api.marketstack.com/v1")
+
+
+def create_mock_client(handler, **kwargs) -> Client:
+    client = Client(base_url="http://api.marketstack.com/v1", **kwargs)
+    transport = httpx.MockTransport(handler)
+    client.set_httpx_client(httpx.Client(transport=client.wrap_transport(transport)))
+    client.set_async_httpx_client(
+        httpx.AsyncClient(transport=client.wrap_async_transport(transport))
+    )
+    return client
+
+
+def paged_response(data: list, limit: int = 100, offset: int = 0, total: int = None):
+    return {
+        "pagination": {
+            "limit": limit,
+            "offset": offset,
+            "count": len(data),
+            "total": len(data) if total is None else total,
+        },
+        "data": data,
+    }
+
+
+def eod_price(index: int, symbol: str = "AAPL"):
+    return {
+        "date": f"2022-01-{index % 28 + 1:02d}T00:00:00+0000",
+        "symbol": symbol,
+        "exchange": "XNAS",
+        "open": 1.0 + index,
+        "high": 2.0 + index,
+        "low": 0.5 + index,
+        "close": 1.5 + index,
+        "volume": 100.0,
+        "split_factor": 1.0,
+        "dividend": 0.0,
+        "adj_open": 1.0,
+        "adj_close": 1.5,
+        "adj_high": 2.0,
+        "adj_low": 0.5,
+        "adj_volume": 100.0,
+    }
+
+
+def paged_handler(total: int, requests: list):
+    def handler(request: httpx.Request):
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        requests.append((limit, offset))
+        data = [eod_price(i) for i in range(offset, min(offset + limit, total))]
+        return httpx.Response(
+            200, json=paged_response(data, limit=limit, offset=offset, total=total)
+        )
+
+    return handler
+
+
+def interval_price(index: int, symbol: str):
+    return {
+        "date": f"2022-01-03T{index:02d}:00:00+0000",
+        "symbol": symbol,
+        "exchange": "IEXG",
+        "open": 1.0 + index,
+        "high": 2.0 + index,
+        "low": 0.5 + index,
+        "last": None,
+        "volume": 100.0,
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
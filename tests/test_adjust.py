@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from marketstack.adjustments import CorporateActions, adjust, adjustment_factors
+from marketstack.models import Dividend, Split
+
+
+def eod_columns():
+    return {
+        "date": np.array(
+            ["2022-01-03", "2022-01-04", "2022-01-05", "2022-01-06"],
+            dtype="datetime64[s]",
+        ),
+        "open": np.array([100.0, 102.0, 26.0, 24.0]),
+        "close": np.array([100.0, 104.0, 25.0, 24.5]),
+        "volume": np.array([10.0, 20.0, 80.0, 40.0]),
+        "split_factor": np.array([1.0, 1.0, 4.0, 1.0]),
+        "dividend": np.array([0.0, 0.0, 0.0, 0.5]),
+    }
+
+
+def test_adjust_from_columns():
+    columns = eod_columns()
+    adjusted = adjust(columns)
+
+    dividend_step = 1.0 - 0.5 / 25.0
+    assert adjusted["close"] == pytest.approx(
+        [
+            100.0 / 4 * dividend_step,
+            104.0 / 4 * dividend_step,
+            25.0 * dividend_step,
+            24.5,
+        ]
+    )
+    assert adjusted["open"][0] == pytest.approx(25.0 * dividend_step)
+    assert list(adjusted["volume"]) == [40.0, 80.0, 80.0, 40.0]
+    assert adjusted["split_factor"] is columns["split_factor"]
+    assert columns["close"][0] == 100.0
+
+
+def test_adjust_from_models():
+    actions = CorporateActions.from_models(
+        splits=[
+            Split(date="2022-01-05", symbol="AAPL", split_factor=4.0),
+            Split(date="2022-01-04", symbol="MSFT", split_factor=2.0),
+        ],
+        dividends=[
+            Dividend(date="2022-01-06", symbol="AAPL", dividend=0.5),
+            Dividend(date="2021-12-01", symbol="AAPL", dividend=1.0),
+        ],
+        symbol="AAPL",
+    )
+    assert list(actions.dividend_dates.astype(str)) == ["2021-12-01", "2022-01-06"]
+
+    columns = eod_columns()
+    assert adjust(columns, actions)["close"] == pytest.approx(adjust(columns)["close"])
+
+
+def test_same_day_events():
+    dates = np.array(["2022-01-03", "2022-01-04"], dtype="datetime64[D]")
+    actions = CorporateActions(
+        split_dates=np.array(["2022-01-04", "2022-01-04"], dtype="datetime64[D]"),
+        split_factors=np.array([2.0, 3.0]),
+        dividend_dates=np.array([], dtype="datetime64[D]"),
+        dividends=np.array([]),
+    )
+    price_factors, volume_factors = adjustment_factors(
+        dates, np.array([60.0, 10.0]), actions
+    )
+    assert price_factors == pytest.approx([1 / 6, 1.0])
+    assert list(volume_factors) == [6.0, 1.0]
+
+
+def test_adjust_intraday():
+    columns = {
+        "date": np.array(
+            [
+                "2022-01-04T20:00:00",
+                "2022-01-04T21:00:00",
+                "2022-01-05T14:00:00",
+                "2022-01-05T15:00:00",
+            ],
+            dtype="datetime64[s]",
+        ),
+        "close": np.array([100.0, 104.0, 26.0, 25.0]),
+        "last": np.array([100.5, 104.5, 26.5, 25.5]),
+        "volume": np.array([1.0, 2.0, 8.0, 4.0]),
+    }
+    actions = CorporateActions.from_models(
+        splits=[Split(date="2022-01-05", symbol="AAPL", split_factor=4.0)]
+    )
+    adjusted = adjust(columns, actions)
+
+    assert list(adjusted["close"]) == [25.0, 26.0, 26.0, 25.0]
+    assert list(adjusted["last"]) == [25.125, 26.125, 26.5, 25.5]
+    assert list(adjusted["volume"]) == [4.0, 8.0, 8.0, 4.0]
+
+
+def test_adjust_intraday_dividend_without_close():
+    columns = {
+        "date": np.array(
+            ["2022-01-04T20:00:00", "2022-01-04T21:00:00", "2022-01-05T14:00:00"],
+            dtype="datetime64[s]",
+        ),
+        "close": np.array([np.nan, np.nan, np.nan]),
+        "last": np.array([100.0, 50.0, 49.0]),
+    }
+    actions = CorporateActions.from_models(
+        dividends=[Dividend(date="2022-01-05", symbol="AAPL", dividend=1.0)]
+    )
+    adjusted = adjust(columns, actions)
+
+    assert adjusted["last"] == pytest.approx([98.0, 49.0, 49.0])
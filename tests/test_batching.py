@@ -0,0 +1,97 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from marketstack.api.intraday import intraday_latest
+from marketstack.batching import LatestPriceBatcher
+from marketstack.errors import ApiError
+from marketstack.models import Interval
+from tests.setup import create_mock_client, eod_price, interval_price, paged_response
+
+
+def latest_handler(requests: list, price=eod_price):
+    def handler(request: httpx.Request):
+        symbols = request.url.params["symbols"].split(",")
+        requests.append(sorted(symbols))
+        data = [price(0, symbol) for symbol in symbols if symbol != "UNKNOWN"]
+        return httpx.Response(200, json=paged_response(data))
+
+    return handler
+
+
+def test_asyncio_batching():
+    requests = []
+    client = create_mock_client(latest_handler(requests))
+    batcher = LatestPriceBatcher(client, "key", window=0.02)
+    symbols = ["AAPL", "MSFT", "AMZN", "AAPL", "UNKNOWN"]
+
+    async def run():
+        return await asyncio.gather(*map(batcher.asyncio_get, symbols))
+
+    prices = asyncio.run(run())
+
+    assert requests == [["AAPL", "AMZN", "MSFT", "UNKNOWN"]]
+    assert [price and price.symbol for price in prices] == [
+        "AAPL",
+        "MSFT",
+        "AMZN",
+        "AAPL",
+        None,
+    ]
+
+
+def test_asyncio_max_symbols():
+    requests = []
+    client = create_mock_client(latest_handler(requests))
+    batcher = LatestPriceBatcher(client, "key", window=10, max_symbols=2)
+
+    async def run():
+        return await asyncio.gather(
+            *map(batcher.asyncio_get, ["AAPL", "MSFT", "AMZN", "GOOG"])
+        )
+
+    assert len(asyncio.run(run())) == 4
+    assert requests == [["AAPL", "MSFT"], ["AMZN", "GOOG"]]
+
+
+def test_sync_batching_intraday():
+    requests = []
+    client = create_mock_client(latest_handler(requests, interval_price))
+    batcher = LatestPriceBatcher(
+        client, "key", endpoint=intraday_latest, window=0.05, interval=Interval.MIN1
+    )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        prices = list(executor.map(batcher.get, ["AAPL", "MSFT", "AMZN"]))
+
+    assert requests == [["AAPL", "AMZN", "MSFT"]]
+    assert [price.symbol for price in prices] == ["AAPL", "MSFT", "AMZN"]
+
+
+def test_errors_are_routed_to_all_callers():
+    def handler(request: httpx.Request):
+        error = {"error": {"code": "invalid_access_key", "message": "Invalid key"}}
+        return httpx.Response(401, json=error)
+
+    batcher = LatestPriceBatcher(create_mock_client(handler), "key")
+
+    async def run():
+        return await asyncio.gather(
+            batcher.asyncio_get("AAPL"),
+            batcher.asyncio_get("MSFT"),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, ApiError) for result in asyncio.run(run()))
+    with pytest.raises(ApiError):
+        batcher.get("AAPL")
+
+
+def test_invalid_arguments():
+    client = create_mock_client(latest_handler([]))
+    with pytest.raises(ValueError):
+        LatestPriceBatcher(client, "key", window=-1)
+    with pytest.raises(ValueError):
+        LatestPriceBatcher(client, "key", max_symbols=101)
@@ -0,0 +1,155 @@
+import asyncio
+
+import httpx
+import pytest
+
+from marketstack.api.eod import eod_latest
+from marketstack.api.tickers import ticker_symbol_eod_latest
+from marketstack.api.timezones import timezones
+from marketstack.cache import ResponseCache
+from tests.setup import FakeClock, create_mock_client, eod_price, paged_response
+
+
+def counting_handler(requests: list, status_code: int = 200):
+    def handler(request: httpx.Request):
+        requests.append(request.url)
+        if status_code != 200:
+            error = {"error": {"code": "internal_error", "message": "Failure"}}
+            return httpx.Response(status_code, json=error)
+        if request.url.path.endswith("/timezones"):
+            return httpx.Response(200, json=paged_response([]))
+        if "/tickers/" in request.url.path:
+            return httpx.Response(200, json=eod_price(0))
+        symbols = request.url.params["symbols"].split(",")
+        return httpx.Response(
+            200, json=paged_response([eod_price(0, symbol) for symbol in symbols])
+        )
+
+    return handler
+
+
+def test_cache_key_normalization():
+    base_url = "http://api.marketstack.com/v1/eod/latest"
+    first = httpx.Request(
+        "GET", base_url, params={"access_key": "a", "symbols": "MSFT,AAPL"}
+    )
+    second = httpx.Request(
+        "GET", base_url, params={"symbols": "AAPL, MSFT,AAPL", "access_key": "b"}
+    )
+    other = httpx.Request("GET", base_url, params={"symbols": "AAPL"})
+
+    assert ResponseCache.make_key(first) == ResponseCache.make_key(second)
+    assert ResponseCache.make_key(first) != ResponseCache.make_key(other)
+
+
+def test_endpoint_ttls():
+    cache = ResponseCache(
+        ttl=60, ttls={"/eod/latest": 5, "/eod/{date}": 3600, "/timezones": 0}
+    )
+
+    assert cache.get_ttl("/eod/latest") == 5
+    assert cache.get_ttl("/eod/2022-01-03") == 3600
+    assert cache.get_ttl("/timezones") == 0
+    assert cache.get_ttl("/tickers/AAPL/eod/latest") == 60
+
+
+def test_cached_sync_calls():
+    requests = []
+    cache = ResponseCache(ttl=10)
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+
+    first = eod_latest.sync(client=client, access_key="a", symbols=["MSFT", "AAPL"])
+    second = eod_latest.sync(client=client, access_key="b", symbols="AAPL,MSFT")
+
+    assert len(requests) == 1
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cached_async_calls():
+    requests = []
+    cache = ResponseCache(ttl=10)
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+
+    async def run():
+        first = await ticker_symbol_eod_latest.asyncio(
+            "AAPL", client=client, access_key="key"
+        )
+        second = await ticker_symbol_eod_latest.asyncio(
+            "AAPL", client=client, access_key="key"
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(requests) == 1
+    assert first == second
+    assert cache.hits == 1
+
+
+def test_cache_expires():
+    requests = []
+    clock = FakeClock()
+    cache = ResponseCache(ttl=60, ttls={"/eod/latest": 5}, clock=clock)
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+
+    eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+    clock.now = 4.9
+    eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+    assert len(requests) == 1
+
+    clock.now = 5.0
+    eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+    assert len(requests) == 2
+    assert len(cache) == 1
+
+
+def test_disabled_endpoint_and_errors_are_not_cached():
+    requests = []
+    cache = ResponseCache(ttls={"/timezones": 0})
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+    timezones.sync(client=client, access_key="key")
+    timezones.sync(client=client, access_key="key")
+    assert len(requests) == 2
+
+    client = create_mock_client(counting_handler(requests, 500), response_cache=cache)
+    eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+    eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+    assert len(requests) == 4
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    requests = []
+    cache = ResponseCache(max_entries=2)
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+
+    for symbol in ("AAPL", "MSFT", "AAPL", "AMZN", "AAPL", "MSFT"):
+        eod_latest.sync(client=client, access_key="key", symbols=symbol)
+
+    assert len(requests) == 4
+    assert len(cache) == 2
+
+
+def test_byte_size_eviction():
+    requests = []
+    client = create_mock_client(counting_handler(requests))
+    url = f"{client.base_url}/eod/latest?symbols=AAPL"
+    size = len(client.get_httpx_client().get(url).content)
+    cache = ResponseCache(max_bytes=size * 2)
+    client = create_mock_client(counting_handler(requests), response_cache=cache)
+
+    for symbol in ("AAPL", "MSFT", "AMZN"):
+        eod_latest.sync(client=client, access_key="key", symbols=symbol)
+
+    assert len(cache) == 2
+    assert cache.size_bytes <= size * 2
+
+    cache.clear()
+    assert (len(cache), cache.size_bytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ResponseCache(ttl=-1)
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
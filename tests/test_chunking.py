@@ -0,0 +1,160 @@
+import asyncio
+
+import httpx
+import pytest
+
+from marketstack.api.eod import eod, eod_latest
+from marketstack.api.exchanges import exchange_mic_eod_latest
+from marketstack.chunking import MAX_SYMBOLS, chunk_symbols
+from marketstack.models import ErrorResponse
+from tests.setup import create_mock_client, eod_price, paged_response
+
+symbols = [f"S{i}" for i in range(250)]
+
+
+def eod_latest_handler(requests: list):
+    def handler(request: httpx.Request):
+        chunk = request.url.params["symbols"].split(",")
+        requests.append(chunk)
+        return httpx.Response(
+            200, json=paged_response([eod_price(0, s) for s in chunk])
+        )
+
+    return handler
+
+
+def test_chunk_symbols():
+    assert chunk_symbols("AAPL,AMZN") == ["AAPL,AMZN"]
+    assert chunk_symbols(["AAPL", "AMZN", "MSFT"], chunk_size=2) == [
+        "AAPL,AMZN",
+        "MSFT",
+    ]
+    assert len(chunk_symbols(",".join(symbols))) == 3
+
+
+def test_sync_chunks():
+    requests = []
+    client = create_mock_client(eod_latest_handler(requests))
+
+    response = eod_latest.sync(client=client, access_key="key", symbols=symbols)
+
+    assert sorted(map(len, requests)) == [50, MAX_SYMBOLS, MAX_SYMBOLS]
+    assert [price.symbol for price in response.data] == symbols
+    assert response.pagination.count == len(symbols)
+    assert response.pagination.total == len(symbols)
+    assert response.pagination.limit == 3 * 100
+    assert response.pagination.offset == 0
+
+
+def test_asyncio_chunks():
+    requests = []
+    client = create_mock_client(eod_latest_handler(requests))
+
+    response = asyncio.run(
+        eod_latest.asyncio(client=client, access_key="key", symbols=symbols)
+    )
+
+    assert len(requests) == 3
+    assert [price.symbol for price in response.data] == symbols
+
+
+def test_chunks_nested_data():
+    def handler(request: httpx.Request):
+        chunk = request.url.params["symbols"].split(",")
+        exchange = {
+            "name": "NASDAQ Stock Exchange",
+            "acronym": "NASDAQ",
+            "mic": "XNAS",
+            "country": "USA",
+            "city": "New York",
+            "website": "www.nasdaq.com",
+            "eod": [eod_price(0, s) for s in chunk],
+        }
+        pagination = {
+            "limit": 100,
+            "offset": 0,
+            "count": len(chunk),
+            "total": len(chunk),
+        }
+        return httpx.Response(200, json={"pagination": pagination, "data": exchange})
+
+    client = create_mock_client(handler)
+    response = exchange_mic_eod_latest.sync(
+        "XNAS", client=client, access_key="key", symbols=symbols
+    )
+    assert [price.symbol for price in response.data.eod] == symbols
+
+
+def test_chunks_error():
+    def handler(request: httpx.Request):
+        if "S0" in request.url.params["symbols"].split(","):
+            return httpx.Response(200, json=paged_response([]))
+        error = {"error": {"code": "rate_limit_reached", "message": "Slow down"}}
+        return httpx.Response(429, json=error)
+
+    client = create_mock_client(handler)
+    response = eod_latest.sync(client=client, access_key="key", symbols=symbols)
+    assert isinstance(response, ErrorResponse)
+
+
+def test_chunks_limit():
+    requests = []
+    client = create_mock_client(eod_latest_handler(requests))
+
+    with pytest.raises(ValueError):
+        eod_latest.sync(client=client, access_key="key", symbols=symbols, limit=10)
+    with pytest.raises(ValueError):
+        asyncio.run(
+            eod_latest.asyncio(
+                client=client, access_key="key", symbols=symbols, offset=100
+            )
+        )
+    assert requests == []
+
+    eod_latest.sync(client=client, access_key="key", symbols=symbols[:100], limit=10)
+    assert len(requests) == 1
+
+
+def eod_handler(requests: list):
+    # three prices per symbol, paged over all symbols of a request
+    def handler(request: httpx.Request):
+        chunk = request.url.params["symbols"].split(",")
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        requests.append((len(chunk), offset))
+        data = [eod_price(day, symbol) for symbol in chunk for day in range(3)]
+        return httpx.Response(
+            200,
+            json=paged_response(
+                data[offset : offset + limit],
+                limit=limit,
+                offset=offset,
+                total=len(data),
+            ),
+        )
+
+    return handler
+
+
+def test_paging_chunks():
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    kwargs = dict(client=client, access_key="key", symbols=symbols, limit=100)
+    expected = [symbol for symbol in symbols for _ in range(3)]
+
+    prices = eod.iter_all(**kwargs)
+    assert [price.symbol for price in prices] == expected
+    paged_requests = [(100, 0), (100, 100), (100, 200)] * 2 + [(50, 0), (50, 100)]
+    assert requests == paged_requests
+
+    requests.clear()
+    assert [price.symbol for price in eod.sync_all(**kwargs)] == expected
+    assert sorted(requests) == sorted(paged_requests)
+
+    requests.clear()
+    prices = asyncio.run(eod.asyncio_all(max_concurrency=2, **kwargs))
+    assert [price.symbol for price in prices] == expected
+    assert len(requests) == 8
+
+    with pytest.raises(ValueError):
+        eod.sync_all(offset=10, **kwargs)
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+import pytest
+
+from marketstack.api.timezones import timezones
+from marketstack.client import Client
+from marketstack.models import PagedResponseListmodelsTimezone
+from marketstack.retry import RetryPolicy
+from tests.setup import create_mock_client, paged_response
+
+timezone = {"timezone": "America/New_York", "abbr": "EST", "abbr_dst": "EDT"}
+
+
+def test_pooled_client_is_reused():
+    clients = set()
+
+    def handler(request: httpx.Request):
+        assert request.url.params["access_key"] == "key"
+        return httpx.Response(200, json=paged_response([timezone]))
+
+    client = create_mock_client(handler)
+    for _ in range(3):
+        clients.add(id(client.get_httpx_client()))
+        response = timezones.sync(client=client, access_key="key", limit=1)
+        assert isinstance(response, PagedResponseListmodelsTimezone)
+        assert response.data[0].timezone == "America/New_York"
+
+    assert len(clients) == 1
+
+
+def test_client_lifecycle():
+    client = Client(
+        base_url="http://localhost", max_connections=4, keepalive_expiry=30.0
+    )
+    assert client.get_limits().max_connections == 4
+    assert client.get_limits().keepalive_expiry == 30.0
+
+    with client:
+        httpx_client = client.get_httpx_client()
+        assert httpx_client is client.get_httpx_client()
+    assert httpx_client.is_closed
+
+    assert client.get_httpx_client() is not httpx_client
+    client.close()
+
+
+def test_pooled_async_client_is_reused():
+    def handler(request: httpx.Request):
+        return httpx.Response(200, json=paged_response([timezone]))
+
+    client = create_mock_client(handler)
+
+    async def load():
+        async with client:
+            async_client = client.get_async_httpx_client()
+            responses = await asyncio.gather(
+                *[timezones.asyncio(client=client, access_key="key") for _ in range(5)]
+            )
+            assert client.get_async_httpx_client() is async_client
+        assert async_client.is_closed
+        return responses
+
+    for response in asyncio.run(load()):
+        assert response.data[0].abbr == "EST"
+
+
+def test_async_client_per_event_loop():
+    client = Client(base_url="http://localhost")
+
+    async def get():
+        return client.get_async_httpx_client()
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert second is not first
+    assert first.is_closed
+    assert second.is_closed
+
+    async def get_twice():
+        await client.aclose()
+        return client.get_async_httpx_client(), client.get_async_httpx_client()
+
+    third, again = asyncio.run(get_twice())
+    assert third is again
+
+
+def test_json_decoder():
+    decoded = []
+
+    def json_decoder(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    def handler(request: httpx.Request):
+        return httpx.Response(200, json=paged_response([timezone]))
+
+    client = create_mock_client(handler, json_decoder=json_decoder)
+    response = timezones.sync(client=client, access_key="key")
+    assert response.data[0].abbr_dst == "EDT"
+    assert len(decoded) == 1
+
+
+def test_default_json_decoder():
+    assert Client(base_url="http://localhost").json_decoder(b'{"a": [1]}') == {"a": [1]}
+
+
+@pytest.fixture
+def proxy(monkeypatch):
+    # an HTTP proxy of the environment, which answers all requests itself
+    requested = []
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            body = json.dumps(paged_response([timezone])).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy", "HTTPS_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+    yield requested
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("retry_policy", [None, RetryPolicy()])
+def test_environment_proxy(proxy, retry_policy):
+    client = Client(base_url="http://api.marketstack.com/v1", retry_policy=retry_policy)
+
+    with client:
+        response = timezones.sync(client=client, access_key="key")
+    assert response.data[0].abbr == "EST"
+
+    async def load():
+        async with client:
+            return await timezones.asyncio(client=client, access_key="key")
+
+    assert asyncio.run(load()).data[0].abbr == "EST"
+    assert len(proxy) == 2
+    assert proxy[0].startswith("http://api.marketstack.com/v1/timezones")
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from marketstack.column_store import DATE_DTYPE, ColumnStore
+from marketstack.models import EodPrice, IntervalPrice
+from tests.setup import eod_price, interval_price
+
+
+def eod_prices(symbol: str, dates):
+    prices = []
+    for index, date in enumerate(dates):
+        price = eod_price(index, symbol)
+        price["date"] = f"{date}T00:00:00+0000"
+        prices.append(EodPrice.from_dict(price))
+    return prices
+
+
+def test_partitioned_by_symbol_and_year(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write(
+        eod_prices("AAPL", ["2021-12-30", "2021-12-31", "2022-01-03"])
+        + eod_prices("BRK/B", ["2022-01-03"])
+    )
+
+    assert store.symbols() == ["AAPL", "BRK/B"]
+    assert store.years("AAPL") == [2021, 2022]
+    path = tmp_path / "AAPL" / "2021"
+    assert (path / (path / "CURRENT").read_text() / "close.npy").exists()
+
+    partition = store.read_partition("AAPL", 2021)
+    assert isinstance(partition["close"], np.memmap)
+    assert list(partition["close"]) == [1.5, 2.5]
+    assert partition["date"].dtype == DATE_DTYPE
+
+
+def test_read(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write(eod_prices("AAPL", ["2021-12-30", "2021-12-31", "2022-01-03"]))
+
+    columns = store.read("AAPL")
+    assert list(columns["open"]) == [1.0, 2.0, 3.0]
+    assert columns["date"][0] == np.datetime64("2021-12-30")
+
+    columns = store.read("AAPL", "2021-12-31", "2022-01-03")
+    assert list(columns["open"]) == [2.0, 3.0]
+
+    columns = store.read("AAPL", date_from="2022-01-01")
+    assert isinstance(columns["open"], np.memmap)
+    assert list(columns["open"]) == [3.0]
+
+    assert len(store.read("MSFT")["date"]) == 0
+
+
+def test_merge_replaces_dates(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write(eod_prices("AAPL", ["2022-01-04", "2022-01-03"]))
+    updated = eod_prices("AAPL", ["2022-01-05", "2022-01-04"])
+    updated[1].close = 10.0
+    store.write(updated)
+
+    columns = store.read("AAPL")
+    assert list(columns["date"].astype(str)) == [
+        "2022-01-03T00:00:00",
+        "2022-01-04T00:00:00",
+        "2022-01-05T00:00:00",
+    ]
+    assert columns["close"][1] == 10.0
+
+
+def test_missing_values(tmp_path):
+    store = ColumnStore(tmp_path)
+    prices = eod_prices("AAPL", ["2022-01-03"])
+    prices[0].volume = None
+    store.write(prices)
+
+    assert np.isnan(store.read("AAPL")["volume"][0])
+
+
+def test_intraday(tmp_path):
+    store = ColumnStore(tmp_path, IntervalPrice)
+    store.write([IntervalPrice.from_dict(interval_price(i, "AAPL")) for i in range(3)])
+
+    columns = store.read("AAPL", "2022-01-03")
+    assert set(columns) == {"date", "open", "high", "low", "close", "last", "volume"}
+    assert columns["date"][2] == np.datetime64("2022-01-03T02:00:00")
+
+
+def test_invalid_price_type(tmp_path):
+    with pytest.raises(ValueError):
+        ColumnStore(tmp_path, dict)
+
+
+def test_write_replaces_partition_atomically(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write(eod_prices("AAPL", ["2022-01-03"]))
+    before = store.read_partition("AAPL", 2022)
+    path = tmp_path / "AAPL" / "2022"
+    (path / "interrupted").mkdir()
+
+    store.write(eod_prices("AAPL", ["2022-01-04"]))
+
+    # mapped columns of the previous version stay readable
+    assert list(before["date"].astype(str)) == ["2022-01-03T00:00:00"]
+    assert len(store.read_partition("AAPL", 2022)["date"]) == 2
+    assert {entry.name for entry in path.iterdir()} == {
+        "CURRENT",
+        (path / "CURRENT").read_text(),
+    }
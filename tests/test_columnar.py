@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from marketstack import columnar
+from marketstack.api.eod import eod
+from marketstack.api.intraday import intraday
+from marketstack.api.tickers import ticker_symbol, ticker_symbol_eod
+from marketstack.models import ErrorResponse
+from tests.setup import create_mock_client, eod_price, interval_price, paged_response
+
+
+def test_parse_eod_prices():
+    client = create_mock_client(
+        lambda request: httpx.Response(
+            200, json=paged_response([eod_price(i, s) for i in range(3) for s in "AB"])
+        )
+    )
+
+    prices = columnar.sync(eod, client=client, access_key="key", symbols="A,B")
+
+    assert len(prices) == 6
+    assert prices.pagination.count == 6
+    assert prices["date"].dtype == np.dtype("M8[ns]")
+    assert str(prices["date"][0]) == "2022-01-01T00:00:00.000000000"
+    assert prices["date"][0] == prices["date"][1]
+    assert prices["open"].dtype == np.float64
+    assert prices["open"].tolist() == [1.0, 1.0, 2.0, 2.0, 3.0, 3.0]
+    assert prices["symbol"].categories.tolist() == ["A", "B"]
+    assert prices["symbol"].codes.tolist() == [0, 1, 0, 1, 0, 1]
+    assert prices["symbol"].to_numpy().tolist() == ["A", "B"] * 3
+    assert "adj_close" in prices
+
+
+def test_parse_interval_prices():
+    client = create_mock_client(
+        lambda request: httpx.Response(
+            200, json=paged_response([interval_price(i, "AAPL") for i in range(4)])
+        )
+    )
+
+    prices = asyncio.run(
+        columnar.asyncio(intraday, client=client, access_key="key", symbols="AAPL")
+    )
+
+    assert prices["high"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert np.isnan(prices["last"]).all()
+    assert np.isnan(prices["close"]).all()
+    assert "adj_close" not in prices
+
+
+def test_parse_nested_prices():
+    def handler(request: httpx.Request):
+        ticker = {
+            "name": "Apple Inc",
+            "symbol": "AAPL",
+            "has_intraday": False,
+            "has_eod": True,
+            "country": "US",
+            "eod": [eod_price(0), eod_price(1)],
+        }
+        pagination = {"limit": 100, "offset": 0, "count": 2, "total": 2}
+        return httpx.Response(200, json={"pagination": pagination, "data": ticker})
+
+    client = create_mock_client(handler)
+    prices = columnar.sync(ticker_symbol_eod, "AAPL", client=client, access_key="key")
+    assert prices["close"].tolist() == [1.5, 2.5]
+
+
+def test_columnar_error():
+    error = {"error": {"code": "not_found_error", "message": "Not found"}}
+    client = create_mock_client(lambda request: httpx.Response(404, json=error))
+
+    response = columnar.sync(eod, client=client, access_key="key", symbols="AAPL")
+    assert isinstance(response, ErrorResponse)
+
+    with pytest.raises(ValueError):
+        columnar.sync(ticker_symbol, client=client, access_key="key", symbol="AAPL")
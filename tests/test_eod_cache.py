@@ -0,0 +1,197 @@
+import asyncio
+import datetime
+
+import httpx
+
+from marketstack.eod_cache import EodCache, merge_ranges, missing_ranges, to_date
+from tests.setup import create_mock_client, eod_price, paged_response
+
+TODAY = datetime.date(2022, 2, 1)
+
+
+def d(value: str) -> datetime.date:
+    return datetime.date.fromisoformat(value)
+
+
+def eod_handler(requests: list):
+    def handler(request: httpx.Request):
+        params = request.url.params
+        date_from, date_to = d(params["date_from"]), d(params["date_to"])
+        symbols = params["symbols"].split(",")
+        requests.append((symbols, params["date_from"], params["date_to"]))
+        data = []
+        date = date_to
+        while date >= date_from:
+            if date.weekday() < 5:
+                for symbol in symbols:
+                    price = eod_price(0, symbol)
+                    price["date"] = f"{date.isoformat()}T00:00:00+0000"
+                    data.append(price)
+            date -= datetime.timedelta(days=1)
+        return httpx.Response(
+            200, json=paged_response(data, limit=1000, offset=0, total=len(data))
+        )
+
+    return handler
+
+
+def test_ranges():
+    assert merge_ranges(
+        [
+            (d("2022-01-10"), d("2022-01-12")),
+            (d("2022-01-01"), d("2022-01-05")),
+            (d("2022-01-06"), d("2022-01-07")),
+        ]
+    ) == [(d("2022-01-01"), d("2022-01-07")), (d("2022-01-10"), d("2022-01-12"))]
+
+    covered = [(d("2022-01-05"), d("2022-01-10")), (d("2022-01-15"), d("2022-01-20"))]
+    assert missing_ranges(covered, d("2022-01-01"), d("2022-01-31")) == [
+        (d("2022-01-01"), d("2022-01-04")),
+        (d("2022-01-11"), d("2022-01-14")),
+        (d("2022-01-21"), d("2022-01-31")),
+    ]
+    assert missing_ranges(covered, d("2022-01-06"), d("2022-01-09")) == []
+    assert to_date("2022-01-03T10:00:00+0000") == d("2022-01-03")
+
+
+def test_fetches_only_missing_ranges(tmp_path):
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    path = tmp_path / "eod.sqlite"
+
+    with EodCache(path, today=lambda: TODAY) as cache:
+        prices = cache.eod(
+            client=client,
+            access_key="key",
+            symbols="AAPL",
+            date_from="2022-01-10",
+            date_to="2022-01-14",
+        )
+        assert len(prices) == 5
+        assert prices[0].date > prices[-1].date
+
+    with EodCache(path, today=lambda: TODAY) as cache:
+        prices = cache.eod(
+            client=client,
+            access_key="key",
+            symbols=["AAPL", "MSFT"],
+            date_from="2022-01-03",
+            date_to="2022-01-21",
+        )
+
+    assert requests == [
+        (["AAPL"], "2022-01-10", "2022-01-14"),
+        (["AAPL"], "2022-01-03", "2022-01-09"),
+        (["AAPL"], "2022-01-15", "2022-01-21"),
+        (["MSFT"], "2022-01-03", "2022-01-21"),
+    ]
+    assert len(prices) == 30
+
+
+def test_fully_cached_range_is_local():
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    cache = EodCache(today=lambda: TODAY)
+
+    cache.eod_date("2022-01-08", client=client, access_key="key", symbols="AAPL")
+    assert (
+        cache.eod_date("2022-01-08", client=client, access_key="key", symbols="AAPL")
+        == []
+    )
+    price = cache.ticker_symbol_eod_date(
+        "AAPL", "2022-01-07", client=client, access_key="key"
+    )
+    assert price.date.date() == d("2022-01-07")
+    assert len(requests) == 2
+
+    cache.ticker_symbol_eod_date("AAPL", "2022-01-07", client=client, access_key="key")
+    assert len(requests) == 2
+
+
+def test_current_day_is_not_cached():
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    cache = EodCache(today=lambda: TODAY)
+
+    for _ in range(2):
+        prices = cache.eod(
+            client=client,
+            access_key="key",
+            symbols="AAPL",
+            date_from="2022-01-31",
+            date_to="2022-02-01",
+        )
+        assert [price.date.date() for price in prices] == [
+            d("2022-02-01"),
+            d("2022-01-31"),
+        ]
+
+    assert requests == [
+        (["AAPL"], "2022-01-31", "2022-01-31"),
+        (["AAPL"], "2022-02-01", "2022-02-01"),
+        (["AAPL"], "2022-02-01", "2022-02-01"),
+    ]
+
+
+def test_exchange_prices_are_stored_separately():
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    cache = EodCache(today=lambda: TODAY)
+
+    cache.eod_date("2022-01-07", client=client, access_key="key", symbols="AAPL")
+    cache.exchange_mic_eod_date(
+        "XNAS", "2022-01-07", client=client, access_key="key", symbols="AAPL"
+    )
+    assert len(requests) == 2
+    assert cache.covered_ranges("AAPL", "XNAS") == [(d("2022-01-07"), d("2022-01-07"))]
+
+
+def test_asyncio_eod():
+    requests = []
+    client = create_mock_client(eod_handler(requests))
+    cache = EodCache(today=lambda: TODAY)
+
+    async def run():
+        return await cache.asyncio_eod(
+            client=client,
+            access_key="key",
+            symbols="AAPL",
+            date_from="2022-01-03",
+            date_to="2022-01-07",
+        )
+
+    assert len(asyncio.run(run())) == 5
+    assert len(asyncio.run(run())) == 5
+    assert len(requests) == 1
+
+
+def test_unpublished_days_are_requested_again():
+    requests = []
+    published = [d("2022-01-28")]
+    handler = eod_handler(requests)
+
+    def delayed_handler(request: httpx.Request):
+        response = handler(request)
+        page = response.json()
+        page["data"] = [
+            price for price in page["data"] if d(price["date"][:10]) <= published[0]
+        ]
+        return httpx.Response(200, json=page)
+
+    client = create_mock_client(delayed_handler)
+    cache = EodCache(today=lambda: TODAY)
+    kwargs = dict(client=client, access_key="key", symbols="AAPL")
+
+    prices = cache.eod(date_from="2022-01-27", date_to="2022-01-31", **kwargs)
+    assert len(prices) == 2
+    assert cache.covered_ranges("AAPL") == [(d("2022-01-27"), d("2022-01-30"))]
+
+    published[0] = d("2022-01-31")
+    prices = cache.eod(date_from="2022-01-27", date_to="2022-01-31", **kwargs)
+    assert len(prices) == 3
+    assert cache.eod_date("2022-01-31", **kwargs)[0].date.date() == d("2022-01-31")
+
+    assert [request[1:] for request in requests] == [
+        ("2022-01-27", "2022-01-31"),
+        ("2022-01-31", "2022-01-31"),
+    ]
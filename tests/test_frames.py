@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from marketstack.api.eod import eod
+from marketstack.frames import concat_columns
+from marketstack.models import (
+    EodPrice,
+    PagedResponseListmodelsEodPrice,
+    PagedResponseListmodelsTicker,
+    PagedResponseTickerEod,
+)
+from tests.setup import create_mock_client, eod_price, paged_handler, paged_response
+
+
+def ticker(symbol: str, exchange: dict = None):
+    return {
+        "name": symbol.lower(),
+        "symbol": symbol,
+        "has_intraday": False,
+        "has_eod": True,
+        "country": None,
+        "stock_exchange": exchange,
+    }
+
+
+def test_page_to_pandas():
+    data = [eod_price(0), eod_price(1, "MSFT")]
+    del data[1]["close"]
+    data[1]["volume"] = None
+    page = PagedResponseListmodelsEodPrice.from_dict(paged_response(data))
+
+    frame = page.to_pandas()
+
+    assert {"date", "symbol", "exchange"}.issubset(frame.columns)
+    assert "open" in frame.columns and "open_" not in frame.columns
+    assert str(frame["date"].dtype).startswith("datetime64")
+    assert str(frame["date"].dt.tz) == "UTC"
+    assert frame["open"].dtype == np.float64
+    assert frame["close"].iloc[0] == 1.5
+    assert np.isnan(frame["close"].iloc[1])
+    assert np.isnan(frame["volume"].iloc[1])
+    assert list(frame["symbol"]) == ["AAPL", "MSFT"]
+
+
+def test_page_to_arrow():
+    data = [eod_price(0), eod_price(1)]
+    del data[1]["close"]
+    page = PagedResponseListmodelsEodPrice.from_dict(paged_response(data))
+
+    table = page.to_arrow()
+
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 2
+    assert table.schema.field("date").type == pa.timestamp("us", tz="UTC")
+    assert table.column("close").to_pylist() == [1.5, None]
+    assert table.column("symbol").to_pylist() == ["AAPL", "AAPL"]
+
+
+def test_nested_page_to_pandas():
+    page = PagedResponseTickerEod.from_dict(
+        paged_response(
+            {**ticker("AAPL"), "eod": [eod_price(0), eod_price(1)]},
+        )
+    )
+
+    frame = page.to_pandas()
+
+    assert len(frame) == 2
+    assert list(frame["open"]) == [1.0, 2.0]
+
+
+def test_flatten_nested_models():
+    exchange = {
+        "name": "NASDAQ",
+        "acronym": "NASDAQ",
+        "mic": "XNAS",
+        "country": "USA",
+        "city": "New York",
+        "website": "www.nasdaq.com",
+    }
+    page = PagedResponseListmodelsTicker.from_dict(
+        paged_response(
+            [
+                ticker("AAPL", {**exchange, "country_code": "US"}),
+                ticker("MSFT", exchange),
+            ]
+        )
+    )
+
+    frame = page.to_pandas()
+
+    assert list(frame["stock_exchange.mic"]) == ["XNAS", "XNAS"]
+    assert list(frame["stock_exchange.country_code"].isna()) == [False, True]
+    assert frame["country"].isna().all()
+
+
+def test_empty_page():
+    page = PagedResponseListmodelsEodPrice.from_dict(paged_response([]))
+
+    assert len(page.to_pandas()) == 0
+    assert page.to_arrow().num_rows == 0
+
+
+def test_concat_columns():
+    pages = [
+        [EodPrice.from_dict(eod_price(i)) for i in range(offset, offset + 3)]
+        for offset in (0, 3)
+    ]
+
+    columns = concat_columns(pages, EodPrice)
+
+    kind, values = columns["open"]
+    assert kind == "float"
+    assert list(values) == [1.0 + i for i in range(6)]
+
+
+def test_iter_all_to_pandas():
+    requests = []
+    client = create_mock_client(paged_handler(25, requests))
+
+    prices = eod.iter_all(client=client, access_key="key", symbols="AAPL", limit=10)
+    assert requests == []
+
+    frame = prices.to_pandas()
+
+    assert isinstance(frame, pd.DataFrame)
+    assert list(frame["open"]) == [1.0 + i for i in range(25)]
+    assert requests == [(10, 0), (10, 10), (10, 20)]
+
+
+def test_iter_all_to_arrow_remaining_items():
+    requests = []
+    client = create_mock_client(paged_handler(25, requests))
+
+    prices = eod.iter_all(client=client, access_key="key", symbols="AAPL", limit=10)
+    assert next(prices).open_ == 1.0
+    assert next(prices).open_ == 2.0
+
+    table = prices.to_arrow()
+
+    assert table.column("open").to_pylist() == [1.0 + i for i in range(2, 25)]
+    assert list(prices) == []
@@ -1,4 +1,10 @@
-from marketstack.models import ErrorCode, Interval
+from datetime import datetime, timezone
+
+import pytest
+
+from marketstack.dates import parse_datetime
+from marketstack.models import Error, ErrorCode, Interval, Split, Timezone
+from marketstack.slotted import SlottedSplit
 
 
 def test_error_codes():
@@ -7,3 +13,69 @@ def test_error_codes():
 
 def test_interval():
     assert Interval.HOUR1.value == "1hour"
+
+
+def test_additional_properties():
+    src = {"timezone": "America/New_York", "abbr": "EST", "abbr_dst": "EDT"}
+    parsed = Timezone.from_dict(src)
+    assert parsed._additional_properties is None
+    assert parsed.additional_properties == {}
+
+    parsed = Timezone.from_dict({**src, "offset": -5})
+    assert parsed.additional_keys == ["offset"]
+    assert parsed["offset"] == -5
+    assert parsed.to_dict() == {**src, "offset": -5}
+
+
+def test_from_dict_keeps_source():
+    src = {"code": "not_found_error", "message": "Not found", "context": {"a": 1}}
+    error = Error.from_dict(src)
+    assert error.code == ErrorCode.NOT_FOUND_ERROR
+    assert error.context["a"] == 1
+    assert src == {
+        "code": "not_found_error",
+        "message": "Not found",
+        "context": {"a": 1},
+    }
+
+
+def test_parse_datetime():
+    expected = datetime(2022, 1, 3, 9, 30, tzinfo=timezone.utc)
+    assert parse_datetime("2022-01-03T09:30:00+0000") == expected
+    assert parse_datetime("2022-01-03T09:30:00+00:00") == expected
+    assert parse_datetime("2022-01-03T09:30:00Z") == expected
+    assert parse_datetime("20220103T093000Z") == expected
+    assert parse_datetime("2022-01-03T09:30:00+0000") is parse_datetime(
+        "2022-01-03T09:30:00+0000"
+    )
+
+
+def test_lazy_additional_properties():
+    src = {"date": "2022-01-03", "symbol": "AAPL", "split_factor": 4.0}
+    split = Split.from_dict(src)
+    assert split._additional_properties is None
+    assert "ratio" not in split
+    assert split.additional_keys == []
+
+    other = Split.from_dict(src)
+    assert other.additional_properties == {}
+    assert split == other
+
+    split["ratio"] = "4:1"
+    assert split != other
+    assert split.to_dict() == {**src, "ratio": "4:1"}
+
+
+def test_slotted_models():
+    src = {"date": "2022-01-03", "symbol": "AAPL", "split_factor": 4.0, "ratio": "4:1"}
+    split = Split.from_dict(src)
+    split.note = "unchanged"
+    assert vars(split)["symbol"] == "AAPL"
+
+    slotted_split = SlottedSplit.from_dict(src)
+    assert not hasattr(slotted_split, "__dict__")
+    assert slotted_split["ratio"] == "4:1"
+    assert slotted_split.to_dict() == split.to_dict()
+    assert slotted_split == SlottedSplit.from_dict(src)
+    with pytest.raises(AttributeError):
+        slotted_split.note = "unchanged"
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+import pytest
+
+from marketstack.api.eod import eod
+from marketstack.api.tickers import ticker_symbol_eod
+from marketstack.errors import ApiError
+from marketstack.models import ErrorCode, ErrorResponse
+from marketstack.paging import MAX_LIMIT
+from tests.setup import create_mock_client, eod_price, paged_handler
+
+
+def test_iter_all():
+    requests = []
+    client = create_mock_client(paged_handler(25, requests))
+
+    prices = eod.iter_all(client=client, access_key="key", symbols="AAPL", limit=10)
+    assert requests == []
+
+    assert [price.open_ for price in prices] == [1.0 + i for i in range(25)]
+    assert requests == [(10, 0), (10, 10), (10, 20)]
+
+
+def test_iter_all_default_limit():
+    requests = []
+    client = create_mock_client(paged_handler(0, requests))
+
+    assert list(eod.iter_all(client=client, access_key="key", symbols="AAPL")) == []
+    assert requests == [(MAX_LIMIT, 0)]
+
+
+def test_iter_all_nested_data():
+    def handler(request: httpx.Request):
+        ticker = {
+            "name": "Apple Inc",
+            "symbol": "AAPL",
+            "has_intraday": False,
+            "has_eod": True,
+            "country": "US",
+            "eod": [eod_price(0), eod_price(1)],
+        }
+        pagination = {"limit": 100, "offset": 0, "count": 2, "total": 2}
+        return httpx.Response(200, json={"pagination": pagination, "data": ticker})
+
+    client = create_mock_client(handler)
+    prices = list(ticker_symbol_eod.iter_all("AAPL", client=client, access_key="key"))
+    assert len(prices) == 2
+
+
+def test_iter_all_error():
+    def handler(request: httpx.Request):
+        error = {"error": {"code": "rate_limit_reached", "message": "Slow down"}}
+        return httpx.Response(429, json=error)
+
+    client = create_mock_client(handler)
+    with pytest.raises(ApiError) as error:
+        list(eod.iter_all(client=client, access_key="key", symbols="AAPL"))
+
+    assert error.value.status_code == 429
+    assert isinstance(error.value.parsed, ErrorResponse)
+    assert error.value.parsed.error.code == ErrorCode.RATE_LIMIT_REACHED
+
+
+def test_sync_all():
+    requests = []
+    client = create_mock_client(paged_handler(95, requests))
+
+    prices = eod.sync_all(
+        client=client, access_key="key", symbols="AAPL", limit=10, max_concurrency=4
+    )
+
+    assert [price.open_ for price in prices] == [1.0 + i for i in range(95)]
+    assert sorted(requests) == [(10, offset) for offset in range(0, 95, 10)]
+
+
+def test_asyncio_all():
+    requests = []
+    client = create_mock_client(paged_handler(95, requests))
+
+    prices = asyncio.run(
+        eod.asyncio_all(client=client, access_key="key", symbols="AAPL", limit=10)
+    )
+
+    assert [price.open_ for price in prices] == [1.0 + i for i in range(95)]
+    assert sorted(requests) == [(10, offset) for offset in range(0, 95, 10)]
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import httpx
+
+from marketstack.api.timezones import timezones
+from marketstack.rate_limit import RateLimiter
+from tests.setup import create_mock_client, paged_response
+
+
+def test_token_bucket():
+    rate_limiter = RateLimiter(rate=100, burst=3)
+    assert [rate_limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert 0.0 < rate_limiter.reserve() <= 0.01
+    assert 0.01 < rate_limiter.reserve() <= 0.02
+
+
+def test_adapts_to_rate_limit_responses():
+    rate_limiter = RateLimiter(rate=10, min_rate=2, backoff=0.5, recovery=0.1)
+
+    rate_limiter.on_response(429)
+    assert rate_limiter.current_rate == 5
+    for _ in range(3):
+        rate_limiter.on_response(429)
+    assert rate_limiter.current_rate == 2
+
+    for _ in range(100):
+        rate_limiter.on_response(200)
+    assert rate_limiter.current_rate == 10
+
+
+def test_retry_after_pauses_bucket():
+    rate_limiter = RateLimiter(rate=10, burst=5)
+    rate_limiter.on_response(429, retry_after=1.0)
+    assert rate_limiter.reserve() > 1.0
+
+
+def test_rate_limited_client():
+    statuses = iter([200, 429, 200, 200])
+
+    def handler(request: httpx.Request):
+        status_code = next(statuses)
+        if status_code == 429:
+            error = {"error": {"code": "rate_limit_reached", "message": "Slow down"}}
+            return httpx.Response(status_code, json=error)
+        return httpx.Response(status_code, json=paged_response([]))
+
+    rate_limiter = RateLimiter(rate=50, burst=1)
+    client = create_mock_client(handler, rate_limiter=rate_limiter)
+
+    start = time.monotonic()
+    timezones.sync(client=client, access_key="key")
+    timezones.sync(client=client, access_key="key")
+    assert rate_limiter.current_rate == 25
+
+    asyncio.run(timezones.asyncio(client=client, access_key="key"))
+    asyncio.run(timezones.asyncio(client=client, access_key="key"))
+    assert time.monotonic() - start >= 0.08
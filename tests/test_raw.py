@@ -0,0 +1,94 @@
+import asyncio
+import json
+from unittest import mock
+
+import httpx
+import pytest
+
+from marketstack import raw
+from marketstack.api.eod import eod
+from marketstack.api.exchanges import exchange_mic_eod
+from marketstack.api.tickers import ticker_symbol
+from marketstack.cache import ResponseCache
+from marketstack.errors import ApiError
+from marketstack.models import ErrorResponse, PagedResponseListmodelsEodPrice
+from tests.setup import create_mock_client, eod_price, paged_handler
+
+
+def test_raw_decoded():
+    requests = []
+    client = create_mock_client(
+        paged_handler(3, requests), response_cache=ResponseCache()
+    )
+
+    kwargs = dict(access_key="key", symbols="AAPL", limit=10, offset=0)
+    with mock.patch.object(PagedResponseListmodelsEodPrice, "from_dict") as from_dict:
+        page = raw.sync(eod, client=client, **kwargs)
+        cached = raw.sync(eod, client=client, **kwargs)
+        from_dict.assert_not_called()
+
+    assert page.data["data"][0]["symbol"] == "AAPL"
+    assert page.pagination.total == 3
+    assert cached.content == page.content
+    assert len(requests) == 1
+
+
+def test_raw_bytes():
+    pagination = {"limit": 100, "offset": 0, "count": 1, "total": 1}
+    body = {"data": {"name": '"pagination": {}', "eod": [eod_price(0)]}}
+    content = json.dumps({**body, "pagination": pagination}).encode()
+    client = create_mock_client(lambda request: httpx.Response(200, content=content))
+
+    page = asyncio.run(
+        raw.asyncio(
+            exchange_mic_eod,
+            "XNAS",
+            client=client,
+            access_key="key",
+            symbols="AAPL",
+            decode=False,
+        )
+    )
+    assert page.content == content
+    assert page.data is None
+    assert page.pagination.to_dict() == pagination
+
+    page = raw.sync(ticker_symbol, "AAPL", client=client, access_key="key")
+    assert page.data["data"]["name"] == '"pagination": {}'
+
+
+def test_raw_all():
+    requests = []
+    client = create_mock_client(paged_handler(5, requests))
+
+    pages = raw.sync_all(
+        eod, client=client, access_key="key", symbols="AAPL", limit=2, decode=False
+    )
+    assert [page.pagination.offset for page in pages] == [0, 2, 4]
+    assert b'"open":5.0' in pages[2].content
+
+    pages = asyncio.run(
+        raw.asyncio_all(eod, client=client, access_key="key", symbols="AAPL", limit=2)
+    )
+    assert [row["open"] for page in pages for row in page.data["data"]] == [
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+        5.0,
+    ]
+
+    pages = raw.iter_all(eod, client=client, access_key="key", symbols="AAPL")
+    assert len(next(pages).data["data"]) == 5
+
+
+def test_raw_error():
+    error = {"error": {"code": "not_found_error", "message": "Not found"}}
+    client = create_mock_client(lambda request: httpx.Response(404, json=error))
+
+    with pytest.raises(ApiError) as info:
+        raw.sync(eod, client=client, access_key="key", symbols="AAPL")
+    assert isinstance(info.value.parsed, ErrorResponse)
+
+    response = raw.sync_detailed(eod, client=client, access_key="key", symbols="AAPL")
+    assert response.status_code == 404
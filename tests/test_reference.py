@@ -0,0 +1,181 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from marketstack.errors import ApiError
+from marketstack.reference import ReferenceData, ReferenceTable
+from tests.setup import FakeClock, create_mock_client, paged_response
+
+CURRENCY = {"code": "USD", "name": "US Dollar", "symbol": "$", "symbol_native": "$"}
+TIMEZONE = {"timezone": "America/New_York", "abbr": "EST", "abbr_dst": "EDT"}
+EXCHANGE = {
+    "name": "NASDAQ Stock Exchange",
+    "acronym": "NASDAQ",
+    "mic": "XNAS",
+    "country": "USA",
+    "country_code": "US",
+    "city": "New York",
+    "website": "www.nasdaq.com",
+    "currency": CURRENCY,
+    "timezone": TIMEZONE,
+}
+
+
+def reference_handler(requests: list):
+    def handler(request: httpx.Request):
+        path = request.url.path
+        requests.append(path)
+        if path.endswith("/exchanges"):
+            data = [EXCHANGE]
+        elif path.endswith("/currencies"):
+            data = [CURRENCY]
+        else:
+            data = [TIMEZONE]
+        return httpx.Response(200, json=paged_response(data))
+
+    return handler
+
+
+def test_lookups():
+    requests = []
+    reference = ReferenceData(create_mock_client(reference_handler(requests)), "key")
+
+    assert reference.exchange("XNAS").acronym == "NASDAQ"
+    assert reference.exchange("XXXX") is None
+    assert reference.currency("USD").name == "US Dollar"
+    assert reference.timezone("America/New_York").abbr == "EST"
+    assert "XNAS" in reference.exchanges
+    assert len(reference.currencies) == 1
+    assert requests == ["/v1/exchanges", "/v1/currencies", "/v1/timezones"]
+
+
+def test_stale_while_revalidate():
+    clock = FakeClock()
+    versions = iter(range(10))
+    fetches = []
+
+    def fetch():
+        fetches.append(clock.now)
+        return [("key", next(versions))]
+
+    table = ReferenceTable(
+        fetch, lambda item: item[0], refresh_interval=10, clock=clock
+    )
+    assert table["key"] == ("key", 0)
+
+    clock.now = 9
+    assert table["key"] == ("key", 0)
+    assert fetches == [0]
+
+    clock.now = 10
+    assert table["key"] == ("key", 0)
+    table.wait()
+    assert fetches == [0, 10]
+    assert table["key"] == ("key", 1)
+
+
+def test_max_age_blocks():
+    clock = FakeClock()
+    versions = iter(range(10))
+    table = ReferenceTable(
+        lambda: [("key", next(versions))],
+        lambda item: item[0],
+        refresh_interval=10,
+        max_age=20,
+        clock=clock,
+    )
+    assert table["key"] == ("key", 0)
+
+    clock.now = 20
+    assert table["key"] == ("key", 1)
+
+
+def test_failed_revalidation_keeps_stale_items():
+    clock = FakeClock()
+    results = iter([[("key", 0)], ValueError("unavailable"), [("key", 1)]])
+
+    def fetch():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    table = ReferenceTable(
+        fetch, lambda item: item[0], refresh_interval=10, retry_interval=5, clock=clock
+    )
+    table.get("key")
+
+    clock.now = 10
+    assert table["key"] == ("key", 0)
+    table.wait()
+    assert isinstance(table.last_error, ValueError)
+
+    clock.now = 12
+    assert table["key"] == ("key", 0)
+    table.wait()
+
+    clock.now = 15
+    table.get("key")
+    table.wait()
+    assert table["key"] == ("key", 1)
+    assert table.last_error is None
+
+
+def test_initial_load_error():
+    def handler(request: httpx.Request):
+        error = {"error": {"code": "invalid_access_key", "message": "Invalid key"}}
+        return httpx.Response(401, json=error)
+
+    reference = ReferenceData(create_mock_client(handler), "key")
+    with pytest.raises(ApiError):
+        reference.exchange("XNAS")
+    assert not reference.exchanges.loaded
+
+
+def test_asyncio_refresh():
+    requests = []
+    reference = ReferenceData(create_mock_client(reference_handler(requests)), "key")
+
+    asyncio.run(reference.asyncio_refresh())
+
+    assert sorted(requests) == ["/v1/currencies", "/v1/exchanges", "/v1/timezones"]
+    assert reference.exchange("XNAS").currency.code == "USD"
+    assert len(requests) == 3
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "reference.sqlite"
+    requests = []
+    with ReferenceData(
+        create_mock_client(reference_handler(requests)), "key", path=path
+    ) as reference:
+        reference.refresh()
+        assert len(requests) == 3
+
+    release = threading.Event()
+    restarted_requests = []
+
+    def handler(request: httpx.Request):
+        restarted_requests.append(request.url.path)
+        release.wait(5)
+        if request.url.path.endswith("/exchanges"):
+            return httpx.Response(
+                200, json=paged_response([{**EXCHANGE, "acronym": "NDAQ"}])
+            )
+        return reference_handler([])(request)
+
+    with ReferenceData(create_mock_client(handler), "key", path=path) as restarted:
+        # the persisted data is served while it is revalidated in the background
+        assert restarted.exchanges.loaded
+        assert restarted.exchange("XNAS").acronym == "NASDAQ"
+        assert restarted.exchange("XNAS").currency.code == "USD"
+        assert restarted_requests == ["/v1/exchanges"]
+
+        release.set()
+        restarted.exchanges.wait()
+        assert restarted.exchange("XNAS").acronym == "NDAQ"
+
+    with ReferenceData(create_mock_client(handler), "key", path=path) as reference:
+        assert reference.exchange("XNAS").acronym == "NDAQ"
@@ -0,0 +1,120 @@
+import datetime
+
+import httpx
+import numpy as np
+import pytest
+
+from marketstack.api.eod import eod
+from marketstack.api.intraday import intraday
+from marketstack.models import Interval, IntervalPrice
+from marketstack.resampling import can_resample, resample, resample_prices
+from marketstack.store import PriceStore
+from marketstack.types import UNSET
+from tests.setup import create_mock_client, interval_price, paged_response
+
+
+def test_resample_columns():
+    columns = {
+        "date": np.array(
+            [
+                "2022-01-03T14:00:00",
+                "2022-01-03T14:30:00",
+                "2022-01-03T15:00:00",
+                "2022-01-03T18:00:00",
+            ],
+            dtype="datetime64[ns]",
+        ),
+        "open": np.array([np.nan, 2.0, 3.0, 4.0]),
+        "high": np.array([5.0, 6.0, 4.0, 4.5]),
+        "low": np.array([1.0, np.nan, 2.5, 3.5]),
+        "close": np.array([1.5, np.nan, 3.5, 4.2]),
+        "volume": np.array([10.0, 20.0, np.nan, np.nan]),
+    }
+
+    bars = resample(columns, Interval.HOUR3)
+
+    assert list(bars["date"].astype(str)) == [
+        "2022-01-03T12:00:00.000000000",
+        "2022-01-03T15:00:00.000000000",
+        "2022-01-03T18:00:00.000000000",
+    ]
+    assert list(bars["open"]) == [2.0, 3.0, 4.0]
+    assert list(bars["high"]) == [6.0, 4.0, 4.5]
+    assert list(bars["low"]) == [1.0, 2.5, 3.5]
+    assert list(bars["close"]) == [1.5, 3.5, 4.2]
+    assert bars["volume"][0] == 30.0
+    assert np.isnan(bars["volume"][1:]).all()
+
+    assert len(resample({"date": columns["date"][:0]}, Interval.HOUR1)["date"]) == 0
+
+
+def test_can_resample():
+    assert can_resample(Interval.MIN5, Interval.MIN30)
+    assert can_resample(Interval.HOUR1, Interval.HOUR24)
+    assert not can_resample(Interval.MIN10, Interval.MIN5)
+    assert not can_resample(Interval.HOUR6, Interval.HOUR3)
+
+
+def test_resample_prices():
+    prices = [
+        IntervalPrice.from_dict(interval_price(hour, symbol))
+        for hour in range(6)
+        for symbol in ("AAPL", "MSFT")
+    ]
+    prices[-1].exchange = "XNAS"
+
+    bars = resample_prices(prices[::-1], Interval.HOUR3)
+
+    assert [(bar.symbol, bar.date.hour) for bar in bars] == [
+        ("MSFT", 0),
+        ("MSFT", 3),
+        ("AAPL", 0),
+        ("AAPL", 3),
+    ]
+    bar = bars[1]
+    assert bar.date.tzinfo == datetime.timezone.utc
+    assert (bar.open_, bar.high, bar.low, bar.volume) == (4.0, 7.0, 3.5, 300.0)
+    assert bar.exchange == "IEXG"
+    assert bar.last is UNSET
+    assert IntervalPrice.from_dict(bar.to_dict()) == bar
+
+
+def test_resample_prices_without_valid_values():
+    prices = [
+        IntervalPrice.from_dict(interval_price(hour, "AAPL")) for hour in range(6)
+    ]
+    for price in prices[:3]:
+        price.open_ = price.low = price.high = float("nan")
+    prices[4].close = float("nan")
+    prices[5].close = float("nan")
+
+    bars = resample_prices(prices, Interval.HOUR3)
+
+    assert [bar.date.hour for bar in bars] == [3]
+    assert bars[0].close == prices[3].close
+    assert bars[0].last is UNSET
+
+
+def test_store_load_resampled():
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        data = [interval_price(hour, "AAPL") for hour in range(6)]
+        return httpx.Response(200, json=paged_response(data))
+
+    client = create_mock_client(handler)
+    store = PriceStore(endpoint=intraday, interval=Interval.HOUR1)
+    store.sync("AAPL", client=client, access_key="key")
+
+    bars = store.load_resampled("AAPL", Interval.HOUR6)
+    assert len(requests) == 1
+    assert len(bars) == 1
+    assert (bars[0].open_, bars[0].high, bars[0].volume) == (1.0, 7.0, 600.0)
+
+    with pytest.raises(ValueError):
+        PriceStore(endpoint=intraday, interval=Interval.HOUR3).load_resampled(
+            "AAPL", Interval.HOUR1
+        )
+    with pytest.raises(ValueError):
+        PriceStore(endpoint=eod).load_resampled("AAPL", Interval.HOUR1)
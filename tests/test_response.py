@@ -0,0 +1,55 @@
+import asyncio
+from unittest import mock
+
+import httpx
+
+from marketstack.api.eod import eod
+from marketstack.models import PagedResponseListmodelsEodPrice
+from marketstack.types import Response
+from tests.setup import create_mock_client, eod_price, paged_response
+
+
+def eod_client():
+    return create_mock_client(
+        lambda request: httpx.Response(200, json=paged_response([eod_price(0)]))
+    )
+
+
+def test_parsed_lazily():
+    client = eod_client()
+    with mock.patch.object(
+        PagedResponseListmodelsEodPrice,
+        "from_dict",
+        wraps=PagedResponseListmodelsEodPrice.from_dict,
+    ) as from_dict:
+        response = eod.sync_detailed(client=client, access_key="key", symbols="AAPL")
+        assert response.status_code == 200
+        assert b"AAPL" in response.content
+        repr(response)
+        from_dict.assert_not_called()
+
+        assert response.parsed.data[0].symbol == "AAPL"
+        assert response.parsed is response.parsed
+        from_dict.assert_called_once()
+
+
+def test_raw_only():
+    client = eod_client()
+    with mock.patch.object(PagedResponseListmodelsEodPrice, "from_dict") as from_dict:
+        response = asyncio.run(
+            eod.asyncio_detailed(
+                client=client, access_key="key", symbols="AAPL", parse=False
+            )
+        )
+        assert response.parsed is None
+        from_dict.assert_not_called()
+    assert b"AAPL" in response.content
+
+
+def test_response_eq():
+    parsed = Response(200, b"{}", {}, parsed="parsed")
+    assert parsed == Response(200, b"{}", {}, parse=lambda: "parsed")
+    assert parsed.parsed == "parsed"
+
+    parsed.parsed = None
+    assert parsed.parsed is None
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from marketstack.api.timezones import timezones
+from marketstack.models import ErrorResponse, PagedResponseListmodelsTimezone
+from marketstack.retry import RetryPolicy
+from tests.setup import create_mock_client, paged_response
+
+policy = RetryPolicy(max_attempts=3, backoff_factor=0.001)
+
+
+def flaky_handler(failures: list):
+    calls = []
+
+    def handler(request: httpx.Request):
+        calls.append(request)
+        if len(calls) <= len(failures):
+            failure = failures[len(calls) - 1]
+            if isinstance(failure, Exception):
+                raise failure
+            error = {"error": {"code": "internal_error", "message": "Oops"}}
+            return httpx.Response(failure, json=error, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=paged_response([]))
+
+    return handler, calls
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.get_delay(1, retry_after=7) == 7
+    assert policy.get_delay(1, retry_after=86400) is None
+    assert 0 <= RetryPolicy(backoff_factor=1).get_delay(3) <= 4
+
+
+def test_retry_status_codes():
+    handler, calls = flaky_handler([500, 429])
+    client = create_mock_client(handler, retry_policy=policy)
+
+    response = timezones.sync(client=client, access_key="key")
+    assert isinstance(response, PagedResponseListmodelsTimezone)
+    assert len(calls) == 3
+
+
+def test_retry_gives_up():
+    handler, calls = flaky_handler([500, 500, 500])
+    client = create_mock_client(handler, retry_policy=policy)
+
+    response = timezones.sync(client=client, access_key="key")
+    assert isinstance(response, ErrorResponse)
+    assert len(calls) == 3
+
+
+def test_retry_exceptions():
+    handler, calls = flaky_handler([httpx.ConnectTimeout("timeout")])
+    client = create_mock_client(handler, retry_policy=policy)
+
+    response = asyncio.run(timezones.asyncio(client=client, access_key="key"))
+    assert isinstance(response, PagedResponseListmodelsTimezone)
+    assert len(calls) == 2
+
+    handler, calls = flaky_handler([httpx.ConnectError("refused")] * 3)
+    client = create_mock_client(handler, retry_policy=policy)
+    with pytest.raises(httpx.ConnectError):
+        timezones.sync(client=client, access_key="key")
+
+
+def test_retry_after_too_long():
+    calls = []
+
+    def handler(request: httpx.Request):
+        calls.append(request)
+        error = {"error": {"code": "rate_limit_reached", "message": "Slow down"}}
+        return httpx.Response(429, json=error, headers={"Retry-After": "86400"})
+
+    client = create_mock_client(handler, retry_policy=policy)
+
+    response = timezones.sync(client=client, access_key="key")
+    assert isinstance(response, ErrorResponse)
+    response = asyncio.run(timezones.asyncio(client=client, access_key="key"))
+    assert isinstance(response, ErrorResponse)
+    assert len(calls) == 2
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from marketstack.api.eod import eod_latest
+from marketstack.models import ErrorResponse
+from tests.setup import create_mock_client, eod_price, paged_response
+
+
+def latest_response(request: httpx.Request) -> httpx.Response:
+    symbols = request.url.params["symbols"].split(",")
+    return httpx.Response(
+        200, json=paged_response([eod_price(0, symbol) for symbol in symbols])
+    )
+
+
+def test_sync_single_flight():
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request.url)
+        time.sleep(0.2)
+        return latest_response(request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    def call(symbols):
+        return eod_latest.sync(client=client, access_key="key", symbols=symbols)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(call, ["AAPL,MSFT", "MSFT,AAPL", "AAPL,MSFT"]))
+
+    assert len(requests) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+    call("AAPL")
+    assert len(requests) == 2
+
+
+def test_async_single_flight():
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request.url)
+        await asyncio.sleep(0.05)
+        return latest_response(request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                eod_latest.asyncio(client=client, access_key="key", symbols="AAPL")
+                for _ in range(5)
+            ),
+            eod_latest.asyncio(client=client, access_key="key", symbols="MSFT"),
+        )
+
+    results = asyncio.run(run())
+
+    assert len(requests) == 2
+    assert all(result == results[0] for result in results[:5])
+    assert results[5].data[0].symbol == "MSFT"
+
+
+def test_shared_errors():
+    async def handler(request: httpx.Request):
+        await asyncio.sleep(0.05)
+        error = {"error": {"code": "internal_error", "message": "Failure"}}
+        return httpx.Response(500, json=error)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                eod_latest.asyncio(client=client, access_key="key", symbols="AAPL")
+                for _ in range(3)
+            )
+        )
+
+    assert all(isinstance(result, ErrorResponse) for result in asyncio.run(run()))
+
+
+def test_shared_exceptions():
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request.url)
+        await asyncio.sleep(0.05)
+        raise httpx.ConnectError("unreachable", request=request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                eod_latest.asyncio(client=client, access_key="key", symbols="AAPL")
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert len(requests) == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+
+def test_cancelled_leader():
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request.url)
+        await asyncio.sleep(0.1)
+        return latest_response(request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    def call():
+        return eod_latest.asyncio(client=client, access_key="key", symbols="AAPL")
+
+    async def run():
+        leader = asyncio.ensure_future(call())
+        await asyncio.sleep(0.02)
+        followers = asyncio.gather(call(), call())
+        await asyncio.sleep(0.02)
+        leader.cancel()
+        results = await followers
+        assert leader.cancelled()
+        return results
+
+    results = asyncio.run(run())
+    assert len(requests) == 1
+    assert all(result.data[0].symbol == "AAPL" for result in results)
+
+
+def test_interrupted_leader():
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request.url)
+        time.sleep(0.1)
+        if len(requests) == 1:
+            raise KeyboardInterrupt
+        return latest_response(request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    def call():
+        return eod_latest.sync(client=client, access_key="key", symbols="AAPL")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(call)
+        time.sleep(0.02)
+        followers = [executor.submit(call) for _ in range(2)]
+        try:
+            leader.result()
+        except KeyboardInterrupt:
+            pass
+        results = [follower.result() for follower in followers]
+
+    assert len(requests) == 2
+    assert results[0] == results[1]
+
+
+def test_access_keys_are_not_shared():
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request.url)
+        await asyncio.sleep(0.05)
+        return latest_response(request)
+
+    client = create_mock_client(handler, single_flight=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                eod_latest.asyncio(client=client, access_key=key, symbols="AAPL")
+                for key in ("key", "other", "key")
+            )
+        )
+
+    asyncio.run(run())
+    assert sorted(url.params["access_key"] for url in requests) == ["key", "other"]
@@ -0,0 +1,101 @@
+import asyncio
+import datetime
+
+import httpx
+import pytest
+
+from marketstack.api.eod import eod_latest
+from marketstack.api.intraday import intraday
+from marketstack.models import Interval
+from marketstack.store import PriceStore
+from tests.setup import create_mock_client, eod_price, interval_price, paged_response
+
+LAST_DAY = datetime.date(2022, 1, 14)
+
+
+def history_handler(requests: list, last_day: list):
+    def handler(request: httpx.Request):
+        params = request.url.params
+        symbols = params["symbols"].split(",")
+        date_from = params.get("date_from")
+        requests.append((symbols, date_from))
+        date = datetime.date.fromisoformat(date_from or "2022-01-03")
+        data = []
+        while date <= last_day[0]:
+            for symbol in symbols:
+                price = eod_price(date.day, symbol)
+                price["date"] = f"{date.isoformat()}T00:00:00+0000"
+                data.append(price)
+            date += datetime.timedelta(days=1)
+        return httpx.Response(200, json=paged_response(data[::-1]))
+
+    return handler
+
+
+def test_delta_sync(tmp_path):
+    requests = []
+    last_day = [LAST_DAY]
+    client = create_mock_client(history_handler(requests, last_day))
+    path = tmp_path / "prices.sqlite"
+
+    with PriceStore(path) as store:
+        count = store.sync(
+            ["AAPL", "MSFT"], client=client, access_key="key", date_from="2022-01-10"
+        )
+        assert count == 10
+
+    last_day[0] = datetime.date(2022, 1, 17)
+    with PriceStore(path) as store:
+        assert (
+            store.sync(
+                ["AAPL", "MSFT", "AMZN"],
+                client=client,
+                access_key="key",
+                date_from="2022-01-10",
+            )
+            == 6 + 8
+        )
+        assert store.sync(["AAPL"], client=client, access_key="key") == 0
+
+        prices = store.load("AAPL")
+        assert [price.date.day for price in prices] == list(range(10, 18))
+        assert len(store.load(["AAPL", "MSFT"], "2022-01-15", "2022-01-16")) == 4
+
+    assert requests == [
+        (["AAPL", "MSFT"], "2022-01-10"),
+        (["AAPL", "MSFT"], "2022-01-15"),
+        (["AMZN"], "2022-01-10"),
+        (["AAPL"], "2022-01-18"),
+    ]
+
+
+def test_intraday_sync():
+    requests = []
+
+    def handler(request: httpx.Request):
+        params = request.url.params
+        requests.append((params["interval"], params.get("date_from")))
+        hours = range(4) if "date_from" not in params else range(4, 6)
+        data = [interval_price(hour, "AAPL") for hour in hours]
+        return httpx.Response(200, json=paged_response(data))
+
+    client = create_mock_client(handler)
+    store = PriceStore(endpoint=intraday, interval=Interval.HOUR1)
+
+    async def run():
+        first = await store.asyncio_sync("AAPL", client=client, access_key="key")
+        second = await store.asyncio_sync("AAPL", client=client, access_key="key")
+        return first, second
+
+    assert asyncio.run(run()) == (4, 2)
+    assert requests == [("1hour", None), ("1hour", "2022-01-03T03:00:01+0000")]
+    assert len(store.load("AAPL", date_to="2022-01-03T03:00:00+0000")) == 4
+    assert store.last_dates("AAPL,MSFT") == {
+        "AAPL": datetime.datetime(2022, 1, 3, 5, tzinfo=datetime.timezone.utc),
+        "MSFT": None,
+    }
+
+
+def test_unsupported_endpoint():
+    with pytest.raises(ValueError):
+        PriceStore(endpoint=eod_latest)
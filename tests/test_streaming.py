@@ -0,0 +1,172 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from marketstack import streaming
+from marketstack.api.eod import eod
+from marketstack.api.exchanges import exchange_mic_intraday
+from marketstack.api.intraday import intraday
+from marketstack.api.tickers import ticker_symbol
+from marketstack.cache import ResponseCache
+from marketstack.errors import ApiError
+from marketstack.models import EodPrice, IntervalPrice
+from tests.setup import (
+    create_mock_client,
+    eod_price,
+    interval_price,
+    paged_handler,
+    paged_response,
+)
+
+
+def test_stream_yields_while_receiving():
+    body = json.dumps(
+        paged_response([interval_price(i, "AAPL") for i in range(10)])
+    ).encode()
+    chunk_size = 64
+    sent = []
+
+    def chunks():
+        for start in range(0, len(body), chunk_size):
+            sent.append(start)
+            yield body[start : start + chunk_size]
+
+    client = create_mock_client(lambda request: httpx.Response(200, content=chunks()))
+    items = streaming.stream(intraday, client=client, access_key="key", symbols="AAPL")
+
+    first = next(items)
+    assert isinstance(first, IntervalPrice)
+    assert first.open_ == 1.0
+    assert len(sent) < len(body) // chunk_size
+
+    assert [item.date.hour for item in items] == list(range(1, 10))
+
+
+def test_stream_bypasses_cache():
+    body = json.dumps(
+        paged_response([interval_price(i, "AAPL") for i in range(10)])
+    ).encode()
+    chunk_size = 64
+    sent = []
+
+    def chunks():
+        for start in range(0, len(body), chunk_size):
+            sent.append(start)
+            yield body[start : start + chunk_size]
+
+    cache = ResponseCache()
+    client = create_mock_client(
+        lambda request: httpx.Response(200, content=chunks()),
+        response_cache=cache,
+        single_flight=True,
+    )
+    items = streaming.stream(intraday, client=client, access_key="key", symbols="AAPL")
+
+    assert next(items).date.hour == 0
+    assert len(sent) < len(body) // chunk_size
+    assert len(list(items)) == 9
+    assert len(cache) == 0
+
+    async def achunks():
+        for chunk in chunks():
+            yield chunk
+
+    client = create_mock_client(
+        lambda request: httpx.Response(200, content=achunks()),
+        response_cache=cache,
+        single_flight=True,
+    )
+
+    async def run():
+        sent.clear()
+        items = streaming.asyncio_stream(
+            intraday, client=client, access_key="key", symbols="AAPL"
+        )
+        assert (await items.__anext__()).date.hour == 0
+        assert len(sent) < len(body) // chunk_size
+        return [item async for item in items]
+
+    assert len(asyncio.run(run())) == 9
+    assert len(cache) == 0
+
+
+def test_stream_nested_prices():
+    def handler(request: httpx.Request):
+        exchange = {
+            "name": "NASDAQ Stock Exchange",
+            "acronym": "NASDAQ",
+            "mic": "XNAS",
+            "country": "USA",
+            "country_code": "US",
+            "city": "New York",
+            "website": "www.nasdaq.com",
+            "intraday": [interval_price(i, "AAPL") for i in range(3)],
+        }
+        # the pagination may follow the data
+        pagination = {"limit": 100, "offset": 0, "count": 3, "total": 3}
+        body = {"data": exchange, "pagination": pagination}
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    client = create_mock_client(handler)
+    items = list(
+        streaming.stream(
+            exchange_mic_intraday,
+            "XNAS",
+            client=client,
+            access_key="key",
+            symbols="AAPL",
+        )
+    )
+    assert [item.high for item in items] == [2.0, 3.0, 4.0]
+
+
+def test_stream_all():
+    requests = []
+    client = create_mock_client(paged_handler(5, requests))
+
+    async def run():
+        return [
+            item
+            async for item in streaming.asyncio_stream_all(
+                eod, client=client, access_key="key", symbols="AAPL", limit=2
+            )
+        ]
+
+    items = asyncio.run(run())
+    assert [item.open_ for item in items] == [float(i) for i in range(1, 6)]
+    assert all(isinstance(item, EodPrice) for item in items)
+    assert requests == [(2, 0), (2, 2), (2, 4)]
+
+    requests.clear()
+    items = list(
+        streaming.stream_all(eod, client=client, access_key="key", symbols="AAPL")
+    )
+    assert len(items) == 5
+    assert len(requests) == 1
+
+
+def test_stream_error():
+    error = {"error": {"code": "not_found_error", "message": "Not found"}}
+    client = create_mock_client(lambda request: httpx.Response(404, json=error))
+
+    with pytest.raises(ApiError) as info:
+        list(streaming.stream(eod, client=client, access_key="key", symbols="AAPL"))
+    assert info.value.status_code == 404
+
+    with pytest.raises(ValueError):
+        streaming.get_item_path(ticker_symbol)
+
+
+def test_page_parser():
+    parser = streaming.PageParser("data.item", EodPrice)
+    body = json.dumps(paged_response([eod_price(0), eod_price(1)])).encode()
+
+    items = [
+        item for byte in range(len(body)) for item in parser.feed(body[byte : byte + 1])
+    ]
+    items += parser.close()
+
+    assert [item.close for item in items] == [1.5, 2.5]
+    assert parser.pagination.total == 2